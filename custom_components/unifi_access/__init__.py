@@ -2,31 +2,134 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import logging
 import ssl
+import time
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
-from homeassistant.helpers import config_validation as cv, device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.storage import Store
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import (
+    Event,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    ServiceValidationError,
+)
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import ssl as ssl_util
-from unifi_access_api import ApiConnectionError, EmergencyStatus, UnifiAccessApiClient
+from unifi_access_api import (
+    ApiConnectionError,
+    ApiError,
+    ApiNotFoundError,
+    EmergencyStatus,
+    UnifiAccessApiClient,
+)
 
-from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION
+from .connection import ControllerConnectionPool
+from .const import (
+    CONF_CONFIRM_TIMEOUT,
+    CONF_DEDUP_CAPACITY,
+    CONF_DEDUP_WINDOW,
+    CONF_DNS_CACHE_TTL,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_MAX_CONNECTIONS_PER_HOST,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_RECONCILE_INTERVAL,
+    DEFAULT_CONFIRM_TIMEOUT,
+    DEFAULT_DEDUP_CAPACITY,
+    DEFAULT_DEDUP_WINDOW,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_RECONCILE_INTERVAL,
+    DOMAIN,
+    USER_HOME_TTL,
+)
 from .coordinator import UnifiAccessCoordinator
-from .hub import DoorState, UnifiAccessHub
-
-ENABLE_USER_SCHEMA = vol.Schema({vol.Required("user_id"): cv.string})
-DISABLE_USER_SCHEMA = vol.Schema({vol.Required("user_id"): cv.string})
+from .entity import DoorEntityManager
+from .hub import DoorState, UnifiAccessHub, door_states_fingerprint
+from .store import DoorSettingsStore
+from .timing import SetupTimer
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields that route a service call to one or more controllers. Entity, device
+# and area targets are resolved to the config entries (and doors) they belong to.
+ROUTING_FIELDS = {
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional("config_entry_id"): cv.string,
+    vol.Optional("all_controllers", default=False): cv.boolean,
+}
+
+ENABLE_USER_SCHEMA = vol.Schema({vol.Required("user_id"): cv.string, **ROUTING_FIELDS})
+DISABLE_USER_SCHEMA = vol.Schema({vol.Required("user_id"): cv.string, **ROUTING_FIELDS})
 UPDATE_USER_PIN_SCHEMA = vol.Schema(
     {
         vol.Required("user_id"): cv.string,
         vol.Optional("pin"): vol.Any(None, cv.string),
+        **ROUTING_FIELDS,
+    }
+)
+
+# Maps the service-level command name to the ``control_cmd`` sent to the API.
+DOOR_COMMANDS: dict[str, str | None] = {
+    "unlock": None,
+    "open": "open",
+    "close": "close",
+    "stop": "stop",
+}
+BULK_DOOR_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Optional("door_ids", default=list): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("command", default="unlock"): vol.In(DOOR_COMMANDS),
+        vol.Optional("max_concurrency", default=DEFAULT_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=64)
+        ),
+        **ROUTING_FIELDS,
+    }
+)
+SET_FACE_UNLOCK_SCHEMA = vol.Schema(
+    {
+        vol.Optional("door_ids", default=list): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required("enabled"): cv.boolean,
+        vol.Optional("max_concurrency", default=DEFAULT_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=64)
+        ),
+        **ROUTING_FIELDS,
+    }
+)
+LOCK_RULES = ["keep_lock", "keep_unlock", "custom", "reset", "lock_early", "lock_now"]
+SET_LOCK_RULE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("door_ids", default=list): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required("rule"): vol.In(LOCK_RULES),
+        vol.Optional("max_concurrency", default=DEFAULT_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=64)
+        ),
+        **ROUTING_FIELDS,
     }
 )
 
@@ -44,35 +147,297 @@ PLATFORMS: list[Platform] = [
 ]
 
 
-async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Set up domain-level services."""
-
-    def _get_hub() -> UnifiAccessHub:
-        entries = hass.config_entries.async_loaded_entries(DOMAIN)
-        if not entries:
+def _loaded_hubs(hass: HomeAssistant) -> dict[str, UnifiAccessHub]:
+    """Return the hub of every loaded config entry, keyed by entry ID."""
+    entries = hass.config_entries.async_loaded_entries(DOMAIN)
+    if not entries:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_config_entry",
+        )
+    hubs: dict[str, UnifiAccessHub] = {}
+    for entry in entries:
+        if not isinstance(entry.runtime_data, UnifiAccessData):
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
-                translation_key="no_config_entry",
+                translation_key="invalid_config_entry",
             )
-        entry = entries[0]
-        if not isinstance(entry.runtime_data, UnifiAccessData):
+        hubs[entry.entry_id] = entry.runtime_data.hub
+    return hubs
+
+
+def _filter_by_config_entry(
+    hubs: dict[str, UnifiAccessHub], call: ServiceCall
+) -> dict[str, UnifiAccessHub]:
+    """Restrict hubs to the ``config_entry_id`` given in a service call."""
+    if (entry_id := call.data.get("config_entry_id")) is None:
+        return hubs
+    if entry_id not in hubs:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_config_entry",
+        )
+    return {entry_id: hubs[entry_id]}
+
+
+def _referenced_devices(hass: HomeAssistant, call: ServiceCall) -> set[str]:
+    """Return the devices targeted by a service call, directly or via entities."""
+    selected = async_extract_referenced_entity_ids(hass, call)
+    device_ids = set(selected.referenced_devices)
+    entity_registry = er.async_get(hass)
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        entity_entry = entity_registry.async_get(entity_id)
+        if (
+            entity_entry is not None
+            and entity_entry.platform == DOMAIN
+            and entity_entry.device_id
+        ):
+            device_ids.add(entity_entry.device_id)
+    return device_ids
+
+
+def _resolve_target_doors(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    default: Callable[[DoorState], bool] | None = None,
+) -> dict[UnifiAccessHub, list[str]]:
+    """Group the doors targeted by a service call by the hub that owns them.
+
+    Without door, device or entity targets, the doors of the routed hubs that
+    match ``default`` are used, if given.
+    """
+    hubs = _filter_by_config_entry(_loaded_hubs(hass), call)
+    door_index = {door_id: hub for hub in hubs.values() for door_id in hub.doors}
+
+    door_ids = list(call.data["door_ids"])
+    if unknown := [door_id for door_id in door_ids if door_id not in door_index]:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="unknown_door",
+            translation_placeholders={"door_ids": ", ".join(unknown)},
+        )
+
+    device_registry = dr.async_get(hass)
+    for device_id in _referenced_devices(hass, call):
+        if (device := device_registry.async_get(device_id)) is None:
+            continue
+        door_ids.extend(
+            identifier
+            for domain, identifier in device.identifiers
+            if domain == DOMAIN and identifier in door_index
+        )
+    if not door_ids and default is not None:
+        door_ids = [
+            door_id
+            for door_id, hub in door_index.items()
+            if default(hub.doors[door_id])
+        ]
+
+    targets: dict[UnifiAccessHub, list[str]] = {}
+    for door_id in dict.fromkeys(door_ids):
+        targets.setdefault(door_index[door_id], []).append(door_id)
+    if not targets:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_target_doors",
+        )
+    return targets
+
+
+async def _async_resolve_target_hubs(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    user_homes: dict[str, tuple[float, list[str]]],
+) -> list[UnifiAccessHub]:
+    """Return the hubs a user-level service call should run against.
+
+    Explicit routing (all controllers, config entry, device or entity targets)
+    wins. Otherwise a single controller is used as-is, and with several
+    controllers the call goes to the controller(s) the user belongs to.
+    """
+    hubs = _loaded_hubs(hass)
+    if call.data["all_controllers"]:
+        return list(hubs.values())
+    if "config_entry_id" in call.data:
+        return list(_filter_by_config_entry(hubs, call).values())
+
+    device_registry = dr.async_get(hass)
+    targeted: dict[str, UnifiAccessHub] = {}
+    for device_id in _referenced_devices(hass, call):
+        if (device := device_registry.async_get(device_id)) is None:
+            continue
+        targeted.update(
+            (entry_id, hubs[entry_id])
+            for entry_id in device.config_entries
+            if entry_id in hubs
+        )
+    if targeted:
+        return list(targeted.values())
+    if len(hubs) == 1:
+        return list(hubs.values())
+
+    user_id = call.data["user_id"]
+    homes: list[str] = []
+    if (cached := user_homes.get(user_id)) and (
+        time.monotonic() - cached[0] < USER_HOME_TTL
+    ):
+        homes = [entry_id for entry_id in cached[1] if entry_id in hubs]
+    if not homes:
+        found = await asyncio.gather(
+            *(hub.async_has_user(user_id) for hub in hubs.values()),
+            return_exceptions=True,
+        )
+        homes = [
+            entry_id
+            for entry_id, result in zip(hubs, found, strict=True)
+            if result is True
+        ]
+        if not homes:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
-                translation_key="invalid_config_entry",
+                translation_key="unknown_user",
+                translation_placeholders={"user_id": user_id},
             )
-        return entry.runtime_data.hub
+        user_homes[user_id] = (time.monotonic(), homes)
+    return [hubs[entry_id] for entry_id in homes]
+
+
+async def _async_run_user_service(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    user_homes: dict[str, tuple[float, list[str]]],
+    action: Callable[[UnifiAccessHub], Awaitable[None]],
+) -> None:
+    """Run a user-level action on every controller the call resolves to."""
+    hubs = await _async_resolve_target_hubs(hass, call, user_homes)
+    try:
+        await asyncio.gather(*(action(hub) for hub in hubs))
+    except ApiNotFoundError:
+        # The user moved or was deleted; look them up again on the next call.
+        user_homes.pop(call.data["user_id"], None)
+        raise
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up domain-level services."""
+
+    # Controllers each user was found on and when, so repeated calls skip the
+    # lookup. Entries expire so users added to another controller are found.
+    user_homes: dict[str, tuple[float, list[str]]] = {}
 
     async def handle_enable_user(call: ServiceCall) -> None:
-        hub = _get_hub()
-        await hub.async_update_user_status(call.data["user_id"], enabled=True)
+        await _async_run_user_service(
+            hass,
+            call,
+            user_homes,
+            lambda hub: hub.async_update_user_status(
+                call.data["user_id"], enabled=True
+            ),
+        )
 
     async def handle_disable_user(call: ServiceCall) -> None:
-        hub = _get_hub()
-        await hub.async_update_user_status(call.data["user_id"], enabled=False)
+        await _async_run_user_service(
+            hass,
+            call,
+            user_homes,
+            lambda hub: hub.async_update_user_status(
+                call.data["user_id"], enabled=False
+            ),
+        )
 
     async def handle_update_user_pin(call: ServiceCall) -> None:
-        hub = _get_hub()
-        await hub.async_update_user_pin(call.data["user_id"], call.data.get("pin"))
+        await _async_run_user_service(
+            hass,
+            call,
+            user_homes,
+            lambda hub: hub.async_update_user_pin(
+                call.data["user_id"], call.data.get("pin")
+            ),
+        )
+
+    async def handle_bulk_door_command(call: ServiceCall) -> ServiceResponse:
+        targets = _resolve_target_doors(hass, call)
+        per_hub = await asyncio.gather(
+            *(
+                hub.async_bulk_door_command(
+                    door_ids,
+                    control_cmd=DOOR_COMMANDS[call.data["command"]],
+                    max_concurrency=call.data["max_concurrency"],
+                )
+                for hub, door_ids in targets.items()
+            )
+        )
+        results = [result for hub_results in per_hub for result in hub_results]
+        succeeded = sum(result.success for result in results)
+        return {
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": [asdict(result) for result in results],
+        }
+
+    async def handle_set_face_unlock(call: ServiceCall) -> ServiceResponse:
+        # Without explicit targets, every face unlock reader is switched.
+        targets = _resolve_target_doors(
+            hass, call, default=lambda state: state.has_face_unlock
+        )
+        per_hub = await asyncio.gather(
+            *(
+                hub.async_set_face_unlock_bulk(
+                    door_ids,
+                    enabled=call.data["enabled"],
+                    max_concurrency=call.data["max_concurrency"],
+                )
+                for hub, door_ids in targets.items()
+            )
+        )
+        results = [result for hub_results in per_hub for result in hub_results]
+        succeeded = sum(result.success for result in results)
+        return {
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": [asdict(result) for result in results],
+        }
+
+    async def handle_set_lock_rule(call: ServiceCall) -> None:
+        targets = _resolve_target_doors(hass, call)
+        if not all(hub.supports_door_lock_rules for hub in targets):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="lock_rules_unsupported",
+            )
+        # Each controller applies its doors as one transaction. When one
+        # fails, controllers that applied all their doors are rolled back too.
+        results = await asyncio.gather(
+            *(
+                hub.async_set_lock_rule_bulk(
+                    door_ids,
+                    call.data["rule"],
+                    max_concurrency=call.data["max_concurrency"],
+                )
+                for hub, door_ids in targets.items()
+            )
+        )
+        failed = [door_id for result in results for door_id in result.failed]
+        if failed:
+            await asyncio.gather(
+                *(
+                    hub.async_rollback_lock_rules(
+                        result, max_concurrency=call.data["max_concurrency"]
+                    )
+                    for hub, result in zip(targets, results, strict=True)
+                )
+            )
+            rolled_back = [
+                door_id for result in results for door_id in result.rolled_back
+            ]
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="lock_rule_failed",
+                translation_placeholders={
+                    "failed": ", ".join(failed),
+                    "rolled_back": ", ".join(rolled_back) or "-",
+                },
+            )
 
     hass.services.async_register(
         DOMAIN, "enable_user", handle_enable_user, schema=ENABLE_USER_SCHEMA
@@ -83,6 +448,23 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.services.async_register(
         DOMAIN, "update_user_pin", handle_update_user_pin, schema=UPDATE_USER_PIN_SCHEMA
     )
+    hass.services.async_register(
+        DOMAIN,
+        "bulk_door_command",
+        handle_bulk_door_command,
+        schema=BULK_DOOR_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "set_lock_rule", handle_set_lock_rule, schema=SET_LOCK_RULE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "set_face_unlock",
+        handle_set_face_unlock,
+        schema=SET_FACE_UNLOCK_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
     return True
 
@@ -94,7 +476,10 @@ class UnifiAccessData:
     hub: UnifiAccessHub
     coordinator: UnifiAccessCoordinator[dict[str, DoorState]]
     emergency_coordinator: UnifiAccessCoordinator[EmergencyStatus]
-    store: Store
+    settings: DoorSettingsStore
+    connection_pool: ControllerConnectionPool
+    entity_manager: DoorEntityManager
+    setup_timer: SetupTimer
 
 
 type UnifiAccessConfigEntry = ConfigEntry[UnifiAccessData]
@@ -102,30 +487,62 @@ type UnifiAccessConfigEntry = ConfigEntry[UnifiAccessData]
 
 async def async_setup_entry(hass: HomeAssistant, entry: UnifiAccessConfigEntry) -> bool:
     """Set up Unifi Access from a config entry."""
-    session = async_get_clientsession(hass, verify_ssl=entry.data["verify_ssl"])
-
     ssl_context: ssl.SSLContext | bool = False
     if entry.data["verify_ssl"]:
         # SSL context creation may call into blocking cert-loading functions.
         ssl_context = await hass.async_add_executor_job(ssl_util.client_context)
 
+    connection_pool = ControllerConnectionPool(
+        ssl_context=ssl_context,
+        limit_per_host=entry.options.get(
+            CONF_MAX_CONNECTIONS_PER_HOST, DEFAULT_MAX_CONNECTIONS_PER_HOST
+        ),
+        keepalive_timeout=entry.options.get(
+            CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT
+        ),
+        dns_cache_ttl=entry.options.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL),
+    )
+    # Closed by async_unload_entry; this covers a setup that fails.
+    entry.async_on_unload(connection_pool.async_close)
+
+    async def _async_close_pool(event: Event) -> None:
+        await connection_pool.async_close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_pool)
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     client_kwargs = {
         "host": entry.data["host"],
         "api_token": entry.data["api_token"],
-        "session": session,
+        "session": connection_pool.session,
         "verify_ssl": entry.data["verify_ssl"],
         "ssl_context": ssl_context,
     }
 
     client = UnifiAccessApiClient(**client_kwargs)
 
-    hub = UnifiAccessHub(client, use_polling=entry.data["use_polling"])
+    hub = UnifiAccessHub(
+        client,
+        use_polling=entry.data["use_polling"],
+        dedup_window=entry.options.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW),
+        dedup_capacity=entry.options.get(CONF_DEDUP_CAPACITY, DEFAULT_DEDUP_CAPACITY),
+        confirm_timeout=entry.options.get(
+            CONF_CONFIRM_TIMEOUT, DEFAULT_CONFIRM_TIMEOUT
+        ),
+    )
 
+    timer = SetupTimer(connection_pool.stats, hub.read_stats)
     try:
-        await hub.client.authenticate()
+        with timer.phase("authenticate"):
+            await hub.client.authenticate()
     except ApiConnectionError as err:
         raise ConfigEntryNotReady("Unable to connect to UniFi Access") from err
 
+    max_poll_interval = timedelta(
+        seconds=entry.options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+    )
     coordinator: UnifiAccessCoordinator[dict[str, DoorState]] = UnifiAccessCoordinator(
         hass,
         entry,
@@ -133,19 +550,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: UnifiAccessConfigEntry)
         name="Unifi Access Coordinator",
         update_method=hub.async_update,
         always_update=True,
+        fingerprint=door_states_fingerprint,
+        max_update_interval=max_poll_interval,
     )
-    await coordinator.async_config_entry_first_refresh()
-
-    # Restore persisted entity types (e.g. garage/gate for UGT doors)
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-    stored_data = await store.async_load() or {}
-    # Migrate old format: {"entity_types": {"door_id": "value"}}
-    if "entity_types" in stored_data:
-        stored_data = stored_data["entity_types"]
-    for door_id, door_state in coordinator.data.items():
-        if door_id in stored_data:
-            door_state.entity_type = stored_data[door_id]
-
     emergency_coordinator: UnifiAccessCoordinator[EmergencyStatus] = (
         UnifiAccessCoordinator(
             hass,
@@ -153,45 +560,140 @@ async def async_setup_entry(hass: HomeAssistant, entry: UnifiAccessConfigEntry)
             hub,
             name="Unifi Access Emergency Coordinator",
             update_method=hub.async_get_emergency_status,
+            max_update_interval=max_poll_interval,
         )
     )
-    await emergency_coordinator.async_config_entry_first_refresh()
+    # Per-door user settings (entity type, cover timings, ...)
+    settings = DoorSettingsStore(hass, entry.entry_id, hub.doors)
+
+    # The first refreshes and the settings load do not depend on each other.
+    with timer.phase("initial_load"):
+        results = await asyncio.gather(
+            timer.async_time(
+                "first_refresh", coordinator.async_config_entry_first_refresh()
+            ),
+            timer.async_time("settings_load", settings.async_load()),
+            timer.async_time(
+                "emergency_refresh",
+                emergency_coordinator.async_config_entry_first_refresh(),
+            ),
+            return_exceptions=True,
+        )
+    _raise_setup_error(results)
+    # Stored settings override the defaults of the doors just fetched.
+    settings.async_apply()
 
     # Wire WebSocket push → coordinator updates
     hub.on_doors_updated = lambda: coordinator.async_set_updated_data(hub.doors)
     hub.on_emergency_updated = lambda: emergency_coordinator.async_set_updated_data(
         EmergencyStatus(evacuation=hub.evacuation, lockdown=hub.lockdown)
     )
+    hub.on_command_sent = coordinator.async_note_activity
 
     entry.runtime_data = UnifiAccessData(
         hub=hub,
         coordinator=coordinator,
         emergency_coordinator=emergency_coordinator,
-        store=store,
+        settings=settings,
+        connection_pool=connection_pool,
+        entity_manager=DoorEntityManager(hass, coordinator),
+        setup_timer=timer,
     )
+    entry.async_on_unload(entry.runtime_data.entity_manager.async_start())
+
+    @callback
+    def _async_doors_removed(door_ids: list[str]) -> None:
+        entry.runtime_data.entity_manager.async_remove_doors(door_ids)
+        settings.async_remove_doors(door_ids)
+
+    hub.on_doors_removed = _async_doors_removed
 
     hub.create_task = lambda coro: entry.async_create_background_task(
         hass, coro, "unifi_access_background_task"
     )
+    hub.call_later = lambda delay, action: async_call_later(
+        hass, delay, HassJob(callback(lambda _now: action()), cancel_on_shutdown=True)
+    )
 
     if not hub.use_polling:
         hub.start_websocket()
+        _async_schedule_reconcile(hass, entry, hub)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    with timer.phase("forward_entry_setups"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _LOGGER.debug("Setup of %s finished: %s", entry.title, timer.summary())
 
     return True
 
 
+def _raise_setup_error(results: list[Any]) -> None:
+    """Raise the error of a failed concurrent setup step, if any.
+
+    An authentication failure takes precedence so reauth starts. Otherwise
+    the first error is raised, which is ``ConfigEntryNotReady`` when a first
+    refresh failed.
+    """
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for err in errors:
+        if isinstance(err, ConfigEntryAuthFailed):
+            raise err
+    if errors:
+        raise errors[0]
+
+
+def _async_schedule_reconcile(
+    hass: HomeAssistant, entry: UnifiAccessConfigEntry, hub: UnifiAccessHub
+) -> None:
+    """Periodically correct drift between pushed and controller state."""
+    reconcile_interval = entry.options.get(
+        CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL
+    )
+    if not reconcile_interval:
+        return
+
+    async def _async_reconcile(_now: datetime) -> None:
+        try:
+            await hub.async_reconcile()
+        except ApiError as err:
+            _LOGGER.debug("Reconcile with controller failed: %s", err)
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            _async_reconcile,
+            timedelta(seconds=reconcile_interval),
+            name="Unifi Access reconcile",
+            cancel_on_shutdown=True,
+        )
+    )
+
+
+async def _async_update_listener(
+    hass: HomeAssistant, entry: UnifiAccessConfigEntry
+) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(
     hass: HomeAssistant, entry: UnifiAccessConfigEntry
 ) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         await entry.runtime_data.hub.async_close()
+        # After the hub, as its websocket runs on the pool's session.
+        await entry.runtime_data.connection_pool.async_close()
 
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: UnifiAccessConfigEntry
+) -> None:
+    """Delete the door settings of a removed config entry."""
+    await DoorSettingsStore(hass, entry.entry_id, {}).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant,
     config_entry: UnifiAccessConfigEntry,
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from . import UnifiAccessConfigEntry
-from .const import DOMAIN
-from .coordinator import UnifiAccessCoordinator
 from .entity import UnifiAccessDoorEntity
-from .hub import DoorState
+
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry
+    from .coordinator import UnifiAccessCoordinator
+    from .hub import DoorState
 
 PARALLEL_UPDATES = 0
 
@@ -64,16 +66,6 @@ class UnifiDoorbellStatusEntity(UnifiAccessDoorEntity, BinarySensorEntity):
         super().__init__(coordinator, coordinator.data[door_id])
         self._attr_unique_id = f"doorbell_{self.door.id}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Get device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.door.id)},
-            name=self.door.name,
-            model=self.door.hub_type,
-            manufacturer="Unifi",
-        )
-
     @property
     def is_on(self) -> bool:
         """Get doorbell status."""
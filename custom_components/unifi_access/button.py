@@ -1,14 +1,20 @@
 """Platform for button integration."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from homeassistant.components.button import ButtonEntity
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from . import UnifiAccessConfigEntry, UnifiAccessData
 from .const import DOOR_TYPE_GARAGE, DOOR_TYPE_GATE
 from .entity import UnifiAccessDoorEntity, manage_door_entities
 
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry, UnifiAccessData
+
 PARALLEL_UPDATES = 1
 
 
@@ -21,7 +27,6 @@ async def async_setup_entry(
     data = config_entry.runtime_data
     manage_door_entities(
         config_entry,
-        data.coordinator,
         async_add_entities,
         lambda door: door.entity_type in (DOOR_TYPE_GARAGE, DOOR_TYPE_GATE),
         lambda door_id: [ClearObstructionButton(data, door_id)],
@@ -43,4 +48,5 @@ class ClearObstructionButton(UnifiAccessDoorEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Clear the obstruction flag and notify coordinator."""
         self.door.obstruction_detected = False
+        self._data.settings.async_schedule_save()
         self._data.coordinator.async_set_updated_data(self._data.coordinator.data)
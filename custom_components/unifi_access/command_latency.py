@@ -0,0 +1,115 @@
+"""Round-trip and confirmation latency of door commands."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any
+
+from .latency import LatencyTracker
+
+if TYPE_CHECKING:
+    from .hub import DoorHotState
+
+# Upper bounds (ms) of the latency histogram buckets shown in diagnostics.
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass(slots=True)
+class PendingCommand:
+    """A sent command waiting for the door state it should cause."""
+
+    command: str
+    confirmed: Callable[[DoorHotState], bool]
+    sent_mono: float
+
+
+class DoorCommandLatency:
+    """Command latency of one door.
+
+    ``rtt`` is how long the controller took to answer a command request and
+    ``confirmation`` how long it took from sending the command until the
+    door reported the state it should cause. Commands not confirmed within
+    ``timeout`` seconds are counted as unconfirmed.
+    """
+
+    def __init__(self, window: int, timeout: float) -> None:
+        """Initialize empty trackers."""
+        self.rtt = LatencyTracker(window)
+        self.confirmation = LatencyTracker(window)
+        self.timeout = timeout
+        self.failed = 0
+        self.confirmed = 0
+        self.unconfirmed = 0
+        self.pending: PendingCommand | None = None
+
+    def begin(
+        self,
+        command: str,
+        hot: DoorHotState | None,
+        confirmed: Callable[[DoorHotState], bool] | None,
+    ) -> float:
+        """Start timing ``command`` and return its start time.
+
+        The command awaits confirmation unless it has no visible effect or
+        the door is already in the state it should cause. A command still
+        pending is superseded and counted as unconfirmed.
+        """
+        start = time.monotonic()
+        if self.pending is not None:
+            self.unconfirmed += 1
+        self.pending = None
+        if confirmed is not None and hot is not None and not confirmed(hot):
+            self.pending = PendingCommand(command, confirmed, start)
+        return start
+
+    def answered(self, start: float) -> None:
+        """Record the round-trip time of a command the controller accepted."""
+        self.rtt.add((time.monotonic() - start) * 1000)
+
+    def fail(self) -> None:
+        """Record a command the controller rejected; nothing is confirmed."""
+        self.failed += 1
+        self.pending = None
+
+    def check(self, hot: DoorHotState, now: float) -> bool | None:
+        """Settle the pending command against the door state.
+
+        Returns True once the door reports the expected state, False when
+        the command has timed out and None while it is still pending.
+        """
+        if (pending := self.pending) is None:
+            return False
+        if pending.confirmed(hot):
+            self.confirmation.add((now - pending.sent_mono) * 1000)
+            self.confirmed += 1
+            self.pending = None
+            return True
+        if now - pending.sent_mono > self.timeout:
+            self.expire()
+            return False
+        return None
+
+    def expire(self) -> None:
+        """Count the pending command as unconfirmed and stop waiting for it."""
+        if self.pending is not None:
+            self.unconfirmed += 1
+            self.pending = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters, percentiles and histograms for diagnostics."""
+        return {
+            "failed": self.failed,
+            "confirmed": self.confirmed,
+            "unconfirmed": self.unconfirmed,
+            "pending": None if self.pending is None else self.pending.command,
+            "rtt": {
+                **self.rtt.as_dict(),
+                "histogram": self.rtt.histogram(LATENCY_BUCKETS_MS),
+            },
+            "confirmation": {
+                **self.confirmation.as_dict(),
+                "histogram": self.confirmation.histogram(LATENCY_BUCKETS_MS),
+            },
+        }
@@ -6,8 +6,13 @@ from collections.abc import Mapping
 import logging
 from typing import Any
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import ssl as ssl_util
@@ -19,7 +24,26 @@ from unifi_access_api import (
 )
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import (
+    CONF_CONFIRM_TIMEOUT,
+    CONF_DEDUP_CAPACITY,
+    CONF_DEDUP_WINDOW,
+    CONF_DNS_CACHE_TTL,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_MAX_CONNECTIONS_PER_HOST,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_RECONCILE_INTERVAL,
+    DEFAULT_CONFIRM_TIMEOUT,
+    DEFAULT_DEDUP_CAPACITY,
+    DEFAULT_DEDUP_WINDOW,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_RECONCILE_INTERVAL,
+    DOMAIN,
+    POLL_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,6 +85,12 @@ class UnifiAccessConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return UnifiAccessOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -177,6 +207,71 @@ class UnifiAccessConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
+class UnifiAccessOptionsFlow(OptionsFlow):
+    """Handle Unifi Access options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_CONNECTIONS_PER_HOST,
+                        default=options.get(
+                            CONF_MAX_CONNECTIONS_PER_HOST,
+                            DEFAULT_MAX_CONNECTIONS_PER_HOST,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+                    vol.Required(
+                        CONF_KEEPALIVE_TIMEOUT,
+                        default=options.get(
+                            CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Required(
+                        CONF_DNS_CACHE_TTL,
+                        default=options.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Required(
+                        CONF_MAX_POLL_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=POLL_INTERVAL, max=3600)),
+                    vol.Required(
+                        CONF_RECONCILE_INTERVAL,
+                        default=options.get(
+                            CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Required(
+                        CONF_DEDUP_WINDOW,
+                        default=options.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                    vol.Required(
+                        CONF_DEDUP_CAPACITY,
+                        default=options.get(
+                            CONF_DEDUP_CAPACITY, DEFAULT_DEDUP_CAPACITY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=16, max=65536)),
+                    vol.Required(
+                        CONF_CONFIRM_TIMEOUT,
+                        default=options.get(
+                            CONF_CONFIRM_TIMEOUT, DEFAULT_CONFIRM_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                }
+            ),
+        )
+
+
 class CannotConnectError(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -0,0 +1,179 @@
+"""Dedicated HTTP connection pool for a Unifi Access controller."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import ssl
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from aiohttp.client_proto import ResponseHandler
+    from aiohttp.client_reqrep import ClientRequest
+    from aiohttp.connector import Connection
+    from aiohttp.tracing import Trace
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Counters collected from aiohttp request tracing."""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued: int = 0
+    queued_seconds: float = 0.0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Return the share of connections served from the keep-alive pool."""
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+
+class _CountingConnector(aiohttp.TCPConnector):
+    """TCP connector that counts the connections it hands out and keeps open.
+
+    aiohttp does not expose pool occupancy, so connections are counted as
+    ``connect`` returns them and released through their callbacks.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the connector with empty counts."""
+        super().__init__(**kwargs)
+        self.active = 0
+        self._protocols: set[ResponseHandler] = set()
+
+    async def connect(
+        self,
+        req: ClientRequest,
+        traces: list[Trace],
+        timeout: aiohttp.ClientTimeout,  # noqa: ASYNC109 - aiohttp's signature
+    ) -> Connection:
+        """Get a connection from the pool and count it until it is released."""
+        conn = await super().connect(req, traces, timeout)
+        self.active += 1
+        conn.add_callback(self._released)
+        if conn.protocol is not None:
+            self._protocols.add(conn.protocol)
+        return conn
+
+    def _released(self) -> None:
+        """Stop counting a connection handed back to the pool or closed."""
+        self.active -= 1
+
+    def open_connections(self) -> int:
+        """Return how many connections are open, forgetting closed ones."""
+        self._protocols = {
+            protocol for protocol in self._protocols if protocol.is_connected()
+        }
+        return len(self._protocols)
+
+
+class ControllerConnectionPool:
+    """aiohttp session backed by a connector owned by a single controller.
+
+    Keeps controller traffic out of Home Assistant's shared connection pool so
+    bulk fetches do not queue behind other integrations, and records pool
+    statistics for diagnostics.
+    """
+
+    def __init__(
+        self,
+        *,
+        ssl_context: ssl.SSLContext | bool,
+        limit_per_host: int,
+        keepalive_timeout: float,
+        dns_cache_ttl: int,
+    ) -> None:
+        """Create the connector and session."""
+        self.stats = ConnectionPoolStats()
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._connector = _CountingConnector(
+            ssl=ssl_context,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            use_dns_cache=dns_cache_ttl > 0,
+            ttl_dns_cache=dns_cache_ttl or None,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=self._connector,
+            trace_configs=[self._create_trace_config()],
+        )
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config that feeds the pool statistics."""
+        stats = self.stats
+        trace_config = aiohttp.TraceConfig()
+
+        async def _on_request_end(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            stats.requests += 1
+
+        async def _on_queued_start(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            stats.queued += 1
+            ctx.queued_at = time.monotonic()
+
+        async def _on_queued_end(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            stats.queued_seconds += time.monotonic() - ctx.queued_at
+
+        async def _on_create_end(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            stats.connections_created += 1
+
+        async def _on_reuse(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            stats.connections_reused += 1
+
+        async def _on_dns_hit(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            stats.dns_cache_hits += 1
+
+        async def _on_dns_miss(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            stats.dns_cache_misses += 1
+
+        trace_config.on_request_end.append(_on_request_end)
+        trace_config.on_request_exception.append(_on_request_end)
+        trace_config.on_connection_queued_start.append(_on_queued_start)
+        trace_config.on_connection_queued_end.append(_on_queued_end)
+        trace_config.on_connection_create_end.append(_on_create_end)
+        trace_config.on_connection_reuseconn.append(_on_reuse)
+        trace_config.on_dns_cache_hit.append(_on_dns_hit)
+        trace_config.on_dns_cache_miss.append(_on_dns_miss)
+        return trace_config
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return pool configuration, occupancy and counters."""
+        active = self._connector.active
+        open_connections = max(self._connector.open_connections(), active)
+        return {
+            "limit_per_host": self._connector.limit_per_host,
+            "keepalive_timeout": self._keepalive_timeout,
+            "dns_cache_ttl": self._dns_cache_ttl,
+            "open_connections": open_connections,
+            "active_connections": active,
+            "idle_connections": open_connections - active,
+            **asdict(self.stats),
+            "reuse_ratio": round(self.stats.reuse_ratio, 3),
+        }
+
+    async def async_close(self) -> None:
+        """Close the session and its connector."""
+        if not self.session.closed:
+            await self.session.close()
@@ -8,9 +8,94 @@ DOOR_TYPE_GARAGE = "garage"
 DOOR_TYPE_GATE = "gate"
 DOOR_TYPES = [DOOR_TYPE_LOCK, DOOR_TYPE_GARAGE, DOOR_TYPE_GATE]
 
-# Storage (for door type)
+# Storage (per-door user settings). The key predates the other settings.
 STORAGE_KEY = "unifi_access_entity_types"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+# Seconds to wait for further changes before writing settings to disk
+SETTINGS_SAVE_DELAY = 10
+
+# Options: dedicated controller connection pool
+CONF_MAX_CONNECTIONS_PER_HOST = "max_connections_per_host"
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+CONF_DNS_CACHE_TTL = "dns_cache_ttl"
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+DEFAULT_DNS_CACHE_TTL = 300
+
+# Options: adaptive polling (polling mode only)
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+DEFAULT_MAX_POLL_INTERVAL = 60
+
+# Options: periodic reconciliation (websocket mode only), 0 disables it
+CONF_RECONCILE_INTERVAL = "reconcile_interval"
+DEFAULT_RECONCILE_INTERVAL = 300
+# Doors whose lock rule is re-read on each reconcile run
+RECONCILE_LOCK_RULE_BATCH = 4
+
+# Consecutive door refreshes a door must be missing from before it is removed
+DOOR_REMOVE_AFTER_MISSES = 3
+
+# Options: access event de-duplication, in seconds and remembered events
+CONF_DEDUP_WINDOW = "dedup_window"
+DEFAULT_DEDUP_WINDOW = 5
+CONF_DEDUP_CAPACITY = "dedup_capacity"
+DEFAULT_DEDUP_CAPACITY = 1024
+
+# Options: seconds a command may take to show up in the door state before an
+# optimistic lock state is rolled back and the command counts as unconfirmed
+CONF_CONFIRM_TIMEOUT = "confirm_timeout"
+DEFAULT_CONFIRM_TIMEOUT = 10
+
+# Fastest poll interval, used right after commands or detected changes
+POLL_INTERVAL = 3
+# Seconds to keep polling at the fastest interval after activity
+POLL_ACTIVITY_WINDOW = 30
+# Multiplier applied to the interval after each idle poll
+POLL_BACKOFF_FACTOR = 2
+
+# Maximum number of concurrent controller requests issued by bulk actions
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Seconds user actions remember which controller(s) a user belongs to
+USER_HOME_TTL = 600
+
+# Websocket dispatcher: number of per-door lanes processed concurrently, and
+# messages that skip them through the priority lane
+DISPATCH_LANES = 4
+PRIORITY_WS_EVENTS: frozenset[str] = frozenset({"access.data.setting.update"})
+
+# Websocket backpressure, in messages queued across all lanes. Above the
+# high-water mark low-value messages are shed or sampled; above the hard
+# limit only essential messages are kept.
+DISPATCH_HIGH_WATER = 100
+DISPATCH_MAX_QUEUED = 500
+# Lock state, doorbell and emergency messages, never shed
+ESSENTIAL_WS_EVENTS: frozenset[str] = frozenset(
+    {
+        "access.data.device.location_update_v2",
+        "access.data.v2.location.update",
+        "access.data.location.update",
+        "access.data.v2.device.update",
+        "access.data.device.update",
+        "access.data.device.remote_unlock",
+        "access.data.setting.update",
+        "access.remote_view",
+        "access.remote_view.change",
+        "access.hw.door_bell",
+    }
+)
+SHED_WS_EVENTS: frozenset[str] = frozenset({"access.base.info"})
+# Event type -> keep one in N while above the high-water mark
+SAMPLED_WS_EVENTS: dict[str, int] = {"access.logs.add": 10}
+
+# Recent websocket messages kept per event type for diagnostics
+MESSAGE_LOG_SIZE = 10
+
+# Push latency samples kept for the rolling percentiles
+PUSH_LATENCY_WINDOW = 256
+
+# Command latency samples kept per door
+COMMAND_LATENCY_WINDOW = 64
 
 # Hub types that support the intercom guard ID feature (UA-Intercom directory)
 INTERCOM_HUB_TYPES: frozenset[str] = frozenset({"UA-Intercom", "UA-G3-Intercom"})
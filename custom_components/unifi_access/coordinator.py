@@ -4,14 +4,21 @@ import asyncio
 from collections.abc import Callable, Coroutine
 from datetime import timedelta
 import logging
+import time
 from typing import Any, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from unifi_access_api import ApiAuthError, ApiError
 
+from .const import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    POLL_ACTIVITY_WINDOW,
+    POLL_BACKOFF_FACTOR,
+    POLL_INTERVAL,
+)
 from .hub import UnifiAccessHub
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,25 +38,83 @@ class UnifiAccessCoordinator(DataUpdateCoordinator[_T]):
         name: str,
         update_method: Callable[[], Coroutine[Any, Any, _T]],
         always_update: bool = False,
+        fingerprint: Callable[[_T], object] | None = None,
+        max_update_interval: timedelta = timedelta(seconds=DEFAULT_MAX_POLL_INTERVAL),
     ) -> None:
-        """Initialize Unifi Access Coordinator."""
+        """Initialize Unifi Access Coordinator.
+
+        In polling mode the update interval adapts to activity: it drops to
+        ``POLL_INTERVAL`` after a command or a detected change and backs off
+        towards ``max_update_interval`` while consecutive polls see nothing
+        new. ``fingerprint`` maps the fetched data to a comparable value used
+        to detect changes; it defaults to the data itself.
+        """
         self.hub = hub
         self._update_method = update_method
+        self._fingerprint = fingerprint or (lambda data: data)
+        self._last_fingerprint: object = None
+        self._min_update_interval = timedelta(seconds=POLL_INTERVAL)
+        self._max_update_interval = max(max_update_interval, self._min_update_interval)
+        self._active_until = 0.0
         super().__init__(
             hass,
             _LOGGER,
             name=name,
             config_entry=config_entry,
             always_update=always_update,
-            update_interval=timedelta(seconds=3) if hub.use_polling else None,
+            update_interval=self._min_update_interval if hub.use_polling else None,
         )
 
     async def _async_update_data(self) -> _T:
         """Fetch data from the API."""
         try:
             async with asyncio.timeout(10):
-                return await self._update_method()
+                data = await self._update_method()
         except ApiAuthError as err:
             raise ConfigEntryAuthFailed from err
         except ApiError as err:
             raise UpdateFailed("Error communicating with API") from err
+
+        if self.update_interval is not None:
+            self._adapt_update_interval(self.update_interval, self._fingerprint(data))
+        return data
+
+    def _adapt_update_interval(self, current: timedelta, fingerprint: object) -> None:
+        """Pick the next poll interval from the latest poll result."""
+        if fingerprint != self._last_fingerprint:
+            self._last_fingerprint = fingerprint
+            self._active_until = time.monotonic() + POLL_ACTIVITY_WINDOW
+
+        if time.monotonic() < self._active_until:
+            interval = self._min_update_interval
+        else:
+            interval = min(current * POLL_BACKOFF_FACTOR, self._max_update_interval)
+        if interval != current:
+            _LOGGER.debug("%s: poll interval now %s", self.name, interval)
+            self.update_interval = interval
+
+    @callback
+    def async_note_activity(self) -> None:
+        """Poll fast for a while, e.g. after a command was sent."""
+        if self.update_interval is None:
+            return
+        self._active_until = time.monotonic() + POLL_ACTIVITY_WINDOW
+        if self.update_interval != self._min_update_interval:
+            self.update_interval = self._min_update_interval
+            # Replace the pending slow poll with one on the fast schedule.
+            self._unschedule_refresh()
+            self._schedule_refresh()
+            # Let the poll interval sensor show the new interval right away.
+            self.async_update_listeners()
+
+    @property
+    def polling_stats(self) -> dict[str, Any]:
+        """Return the adaptive polling state for diagnostics."""
+        return {
+            "update_interval": (
+                self.update_interval.total_seconds() if self.update_interval else None
+            ),
+            "min_update_interval": self._min_update_interval.total_seconds(),
+            "max_update_interval": self._max_update_interval.total_seconds(),
+            "active": time.monotonic() < self._active_until,
+        }
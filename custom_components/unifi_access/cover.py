@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, timedelta
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.cover import (
     CoverDeviceClass,
@@ -17,10 +17,12 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util import dt as dt_util
 
-from . import UnifiAccessConfigEntry, UnifiAccessData
 from .const import DOOR_TYPE_GARAGE, DOOR_TYPE_GATE
 from .entity import UnifiAccessDoorEntity, manage_door_entities
 
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry, UnifiAccessData
+
 PARALLEL_UPDATES = 1
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,7 +37,6 @@ async def async_setup_entry(
     data = config_entry.runtime_data
     manage_door_entities(
         config_entry,
-        data.coordinator,
         async_add_entities,
         lambda door: door.entity_type in (DOOR_TYPE_GARAGE, DOOR_TYPE_GATE),
         lambda door_id: [UnifiAccessCoverEntity(data, door_id)],
@@ -49,6 +50,7 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
         CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.STOP
     )
     _attr_name = None
+    _records_push_latency = True
 
     def __init__(self, data: UnifiAccessData, door_id: str) -> None:
         """Initialize the cover entity."""
@@ -92,6 +94,12 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
         """Return True while closing."""
         return self._is_closing
 
+    def _set_obstruction(self, detected: bool) -> None:
+        """Set the obstruction flag, saving it when it changes."""
+        if self.door.obstruction_detected != detected:
+            self.door.obstruction_detected = detected
+            self._data.settings.async_schedule_save()
+
     def _cancel_operation_timer(self) -> None:
         """Cancel any running operation timer."""
         if self._operation_timer_cancel:
@@ -129,9 +137,9 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
                 "Door %s opening timer expired but door is still closed - obstructed",
                 self.door.name,
             )
-            self.door.obstruction_detected = True
+            self._set_obstruction(True)
         else:
-            self.door.obstruction_detected = False
+            self._set_obstruction(False)
         self._is_opening = False
         self._operation_timer_cancel = None
         self.async_write_ha_state()
@@ -145,9 +153,9 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
                 "Door %s closing timer expired but door is still open - obstructed",
                 self.door.name,
             )
-            self.door.obstruction_detected = True
+            self._set_obstruction(True)
         else:
-            self.door.obstruction_detected = False
+            self._set_obstruction(False)
         self._is_closing = False
         self._operation_timer_cancel = None
         self.async_write_ha_state()
@@ -176,7 +184,7 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
                     "Door %s opened externally, starting open timer", self.door.name
                 )
                 self._is_opening = True
-                self.door.obstruction_detected = False
+                self._set_obstruction(False)
                 self.async_write_ha_state()
                 self._start_opening_timer(open_time)
         elif sensor_closed and self._is_opening:
@@ -187,14 +195,14 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
             )
             self._cancel_operation_timer()
             self._is_opening = False
-            self.door.obstruction_detected = True
+            self._set_obstruction(True)
             self.async_write_ha_state()
         elif sensor_closed and self._is_closing:
             # Closed successfully before timer expired
             _LOGGER.debug("Door %s closed successfully", self.door.name)
             self._cancel_operation_timer()
             self._is_closing = False
-            self.door.obstruction_detected = False
+            self._set_obstruction(False)
             self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -215,7 +223,7 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
             _LOGGER.debug("Door %s trigger rate limited", self.door.name)
             return
         self._last_trigger_time = now
-        self.door.obstruction_detected = False
+        self._set_obstruction(False)
 
         await self._data.hub.async_open_door(self.door.id)
 
@@ -243,7 +251,7 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
             _LOGGER.debug("Door %s trigger rate limited", self.door.name)
             return
         self._last_trigger_time = now
-        self.door.obstruction_detected = False
+        self._set_obstruction(False)
 
         await self._data.hub.async_close_door(self.door.id)
 
@@ -284,4 +292,4 @@ class UnifiAccessCoverEntity(UnifiAccessDoorEntity, CoverEntity):
                 self._debounced_sensor_check(current_sensor_closed)
             )
         self._last_sensor_state = current_sensor_closed
-        self.async_write_ha_state()
+        super()._handle_coordinator_update()
@@ -0,0 +1,90 @@
+"""Bounded TTL cache for de-duplicating access events."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+import time
+from typing import Any
+
+
+@dataclass
+class DedupStats:
+    """Counters for event de-duplication lookups."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evicted: int = 0
+
+
+class EventDedupCache:
+    """Remember event fingerprints for a limited time and count.
+
+    Entries expire ``ttl`` seconds after they were added. When ``capacity``
+    is reached, the oldest entry is evicted, so memory stays bounded however
+    busy the controller gets.
+    """
+
+    def __init__(self, *, ttl: float, capacity: int) -> None:
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self.capacity = capacity
+        self.stats = DedupStats()
+        # Insertion order is expiry order, as every entry has the same TTL.
+        self._entries: OrderedDict[Hashable, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of live and not yet pruned entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True when ``key`` was added and has not expired."""
+        self._prune(time.monotonic())
+        return key in self._entries
+
+    def add(self, key: Hashable) -> None:
+        """Record ``key``, refreshing its expiry if already present."""
+        now = time.monotonic()
+        self._prune(now)
+        self._entries[key] = now + self.ttl
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.stats.evicted += 1
+
+    def seen(self, *keys: Hashable) -> bool:
+        """Return True when any of ``keys`` is cached, counting a hit or miss."""
+        self._prune(time.monotonic())
+        if any(key in self._entries for key in keys):
+            self.stats.hits += 1
+            return True
+        self.stats.misses += 1
+        return False
+
+    def discard(self, predicate: Callable[[Any], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``; return how many."""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries from the front of the cache."""
+        entries = self._entries
+        while entries:
+            key, expires = next(iter(entries.items()))
+            if expires > now:
+                return
+            del entries[key]
+            self.stats.expired += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache configuration, size and counters."""
+        return {
+            "ttl": self.ttl,
+            "capacity": self.capacity,
+            "size": len(self._entries),
+            **asdict(self.stats),
+        }
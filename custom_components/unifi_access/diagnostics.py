@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
-from . import UnifiAccessConfigEntry
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry
 
 REDACT_CONFIG = {"api_token"}
 REDACT_DOOR = {"full_name"}
+# Personal data and secrets in websocket message payloads
+REDACT_MESSAGE = {
+    "actor",
+    "alternate_name",
+    "display_name",
+    "email",
+    "first_name",
+    "last_name",
+    "nfc_id",
+    "pin",
+    "pin_code",
+    "token",
+    "user_name",
+}
 
 
 async def async_get_config_entry_diagnostics(
@@ -37,9 +52,26 @@ async def async_get_config_entry_diagnostics(
 
     return {
         "config_entry": async_redact_data(dict(entry.data), REDACT_CONFIG),
+        "options": dict(entry.options),
         "use_polling": hub.use_polling,
+        "polling": {
+            "doors": data.coordinator.polling_stats,
+            "emergency": data.emergency_coordinator.polling_stats,
+        },
         "supports_door_lock_rules": hub.supports_door_lock_rules,
         "evacuation": hub.evacuation,
         "lockdown": hub.lockdown,
         "doors": doors,
+        "websocket": hub.connection_stats_as_dict(),
+        "sequencing": hub.sequencing_stats_as_dict(),
+        "push_latency": hub.push_latency_as_dict(),
+        "command_latency": hub.command_latency_as_dict(),
+        "dispatcher": hub.dispatch_stats_as_dict(),
+        "access_event_dedup": hub.access_event_cache.as_dict(),
+        "reconcile": hub.reconcile_stats_as_dict(),
+        "door_gc": hub.gc_stats_as_dict(),
+        "connection_pool": data.connection_pool.as_dict(),
+        "read_coalescing": hub.read_stats_as_dict(),
+        "setup_timing": data.setup_timer.as_dict(),
+        "recent_messages": async_redact_data(hub.message_log.as_dict(), REDACT_MESSAGE),
     }
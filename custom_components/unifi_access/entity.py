@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
@@ -15,6 +18,31 @@ from .const import DOMAIN
 from .coordinator import UnifiAccessCoordinator
 from .hub import DoorState
 
+_LOGGER = logging.getLogger(__name__)
+
+
+def _device_info_key(door: DoorState) -> tuple[str, str | None]:
+    """Return the door attributes its device info is built from."""
+    return (door.name, door.hub_type)
+
+
+def door_device_info(door: DoorState) -> DeviceInfo:
+    """Return the device info shared by a door's entities.
+
+    The info is built once and rebuilt only when the door is renamed or its
+    hub type changes.
+    """
+    key = _device_info_key(door)
+    if door.device_info is None or door.device_info_key != key:
+        door.device_info = DeviceInfo(
+            identifiers={(DOMAIN, door.id)},
+            name=door.name,
+            model=door.hub_type,
+            manufacturer="Unifi",
+        )
+        door.device_info_key = key
+    return door.device_info
+
 
 class UnifiAccessDoorDeviceMixin:
     """Mixin providing device_info for any entity linked to a door."""
@@ -24,12 +52,7 @@ class UnifiAccessDoorDeviceMixin:
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for this door."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.door.id)},
-            name=self.door.name,
-            model=self.door.hub_type,
-            manufacturer="Unifi",
-        )
+        return door_device_info(self.door)
 
 
 class UnifiAccessDoorEntity(
@@ -39,6 +62,8 @@ class UnifiAccessDoorEntity(
     """Base entity for a Unifi Access door bound to a coordinator."""
 
     _attr_has_entity_name = True
+    # Whether this entity's state write ends a push update's latency sample
+    _records_push_latency = False
 
     def __init__(
         self, coordinator: UnifiAccessCoordinator[dict[str, DoorState]], door: DoorState
@@ -47,41 +72,178 @@ class UnifiAccessDoorEntity(
         super().__init__(coordinator, context=door.id)
         self.door = door
 
+    @property
+    def available(self) -> bool:
+        """Return False once the door is gone from the controller."""
+        return super().available and self.door.id in self.coordinator.data
 
-def manage_door_entities(
-    config_entry: ConfigEntry,
-    coordinator: UnifiAccessCoordinator[dict[str, DoorState]],
-    async_add_entities: AddConfigEntryEntitiesCallback,
-    should_include: Callable[[DoorState], bool],
-    build_entities: Callable[[str], Iterable[Entity]],
-) -> None:
-    """Add and remove door-linked entities as coordinator data changes."""
-    entity_registry = er.async_get(coordinator.hass)
-    active_entities: dict[str, list[Entity]] = {}
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state and record how long a pushed update took."""
+        super()._handle_coordinator_update()
+        if self._records_push_latency:
+            self.coordinator.hub.note_state_written(self.door)
 
-    def _sync_entities() -> None:
-        for door_id in list(active_entities):
-            door = coordinator.data.get(door_id)
-            if door is not None and should_include(door):
-                continue
 
-            for entity in active_entities.pop(door_id):
-                if entity.entity_id:
-                    entity_registry.async_remove(entity.entity_id)
-                else:
-                    entity.async_remove()
+def _door_membership(door: DoorState) -> tuple[str, str | None, bool]:
+    """Return the door attributes that decide which entities a door gets."""
+    return (door.entity_type, door.hub_type, door.has_face_unlock)
+
+
+@dataclass
+class _DoorEntityConsumer:
+    """A platform's rule for which doors get which entities."""
 
+    async_add_entities: AddConfigEntryEntitiesCallback
+    should_include: Callable[[DoorState], bool]
+    build_entities: Callable[[str], Iterable[Entity]]
+    active: dict[str, list[Entity]] = field(default_factory=dict)
+
+
+class DoorEntityManager:
+    """Add and remove door-linked entities for every platform of an entry.
+
+    Door membership (door set, entity type, hub type and face unlock
+    support) is compared once per coordinator update, and only the doors
+    whose membership changed are passed on to the platforms. Platform rules
+    must therefore only depend on those attributes. Renamed doors are pushed
+    to the device registry in the same pass.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: UnifiAccessCoordinator[dict[str, DoorState]],
+    ) -> None:
+        """Initialize the manager."""
+        self._entity_registry = er.async_get(hass)
+        self._device_registry = dr.async_get(hass)
+        self._coordinator = coordinator
+        self._consumers: list[_DoorEntityConsumer] = []
+        self._memberships: dict[str, tuple[str, str | None, bool]] = {}
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow coordinator updates and return a callback to stop."""
+        self._memberships = self._current_memberships()
+        return self._coordinator.async_add_listener(self._async_sync)
+
+    @callback
+    def async_register(
+        self,
+        async_add_entities: AddConfigEntryEntitiesCallback,
+        should_include: Callable[[DoorState], bool],
+        build_entities: Callable[[str], Iterable[Entity]],
+    ) -> None:
+        """Register a platform rule and add entities for the current doors."""
+        consumer = _DoorEntityConsumer(
+            async_add_entities, should_include, build_entities
+        )
+        self._consumers.append(consumer)
+        self._sync_consumer(consumer, self._coordinator.data)
+
+    def _current_memberships(self) -> dict[str, tuple[str, str | None, bool]]:
+        """Return the membership of every door in the coordinator data."""
+        return {
+            door_id: _door_membership(door)
+            for door_id, door in self._coordinator.data.items()
+        }
+
+    @callback
+    def _async_sync(self) -> None:
+        """Apply door membership and device changes since the last update."""
+        memberships: dict[str, tuple[str, str | None, bool]] = {}
+        renamed: list[DoorState] = []
+        for door_id, door in self._coordinator.data.items():
+            memberships[door_id] = _door_membership(door)
+            if door.device_info is not None and door.device_info_key != (
+                _device_info_key(door)
+            ):
+                renamed.append(door)
+
+        if renamed:
+            self._async_update_devices(renamed)
+        if memberships == self._memberships:
+            return
+
+        previous = self._memberships
+        changed = [
+            door_id
+            for door_id in previous.keys() | memberships.keys()
+            if previous.get(door_id) != memberships.get(door_id)
+        ]
+        self._memberships = memberships
+        for consumer in self._consumers:
+            self._sync_consumer(consumer, changed)
+
+    @callback
+    def async_remove_doors(self, door_ids: list[str]) -> None:
+        """Remove the devices, and with them the entities, of removed doors."""
+        for door_id in door_ids:
+            self._memberships.pop(door_id, None)
+            for consumer in self._consumers:
+                consumer.active.pop(door_id, None)
+
+        removed = 0
+        for door_id in door_ids:
+            device = self._device_registry.async_get_device(
+                identifiers={(DOMAIN, door_id)}
+            )
+            if device is not None:
+                self._device_registry.async_remove_device(device.id)
+                removed += 1
+        _LOGGER.debug("Removed %s devices of removed doors", removed)
+
+    @callback
+    def _async_update_devices(self, doors: list[DoorState]) -> None:
+        """Rebuild device info of renamed doors and update their devices."""
+        for door in doors:
+            info = door_device_info(door)
+            device = self._device_registry.async_get_device(
+                identifiers={(DOMAIN, door.id)}
+            )
+            if device is None:
+                continue
+            _LOGGER.debug("Updating device of door %s to %s", door.id, door.name)
+            self._device_registry.async_update_device(
+                device.id, name=info["name"], model=info["model"]
+            )
+
+    def _sync_consumer(
+        self, consumer: _DoorEntityConsumer, door_ids: Iterable[str]
+    ) -> None:
+        """Add or remove a platform's entities for the given doors."""
+        doors = self._coordinator.data
         new_entities: list[Entity] = []
-        for door_id, door in coordinator.data.items():
-            if not should_include(door) or door_id in active_entities:
+        for door_id in door_ids:
+            door = doors.get(door_id)
+            include = door is not None and consumer.should_include(door)
+            if include == (door_id in consumer.active):
+                continue
+
+            if include:
+                entities = list(consumer.build_entities(door_id))
+                consumer.active[door_id] = entities
+                new_entities.extend(entities)
                 continue
 
-            entities = list(build_entities(door_id))
-            active_entities[door_id] = entities
-            new_entities.extend(entities)
+            for entity in consumer.active.pop(door_id):
+                if entity.entity_id:
+                    self._entity_registry.async_remove(entity.entity_id)
+                else:
+                    entity.async_remove()
 
         if new_entities:
-            async_add_entities(new_entities)
+            consumer.async_add_entities(new_entities)
+
 
-    _sync_entities()
-    config_entry.async_on_unload(coordinator.async_add_listener(_sync_entities))
+def manage_door_entities(
+    config_entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    should_include: Callable[[DoorState], bool],
+    build_entities: Callable[[str], Iterable[Entity]],
+) -> None:
+    """Add and remove door-linked entities as coordinator data changes."""
+    config_entry.runtime_data.entity_manager.async_register(
+        async_add_entities, should_include, build_entities
+    )
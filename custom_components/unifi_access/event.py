@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.event import EventDeviceClass, EventEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from . import UnifiAccessConfigEntry
 from .const import (
     ACCESS_ENTRY_EVENT,
     ACCESS_EXIT_EVENT,
@@ -15,7 +16,10 @@ from .const import (
     DOORBELL_STOP_EVENT,
 )
 from .entity import UnifiAccessDoorDeviceMixin
-from .hub import DoorState
+
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry
+    from .hub import DoorState
 
 PARALLEL_UPDATES = 0
 
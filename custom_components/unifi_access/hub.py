@@ -7,52 +7,85 @@ for the Home Assistant integration.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine
-from dataclasses import dataclass, field
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Iterable
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from functools import partial
 import logging
+import math
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import unicodedata
+import zlib
 
 from unifi_access_api import (
     ApiError,
     ApiNotFoundError,
-    BaseInfo,
-    Device,
     DeviceSettings,
-    DeviceUpdate,
-    Door,
     DoorLockRelayStatus,
     DoorLockRule,
     DoorLockRuleType,
     DoorPositionStatus,
     EmergencyStatus,
-    HwDoorbell,
-    InsightsAdd,
-    LocationUpdateLegacy,
     LocationUpdateV2,
-    LogAdd,
-    RemoteUnlock,
-    RemoteView,
-    RemoteViewChange,
-    SettingUpdate,
-    UnifiAccessApiClient,
     V2DeviceUpdate,
     V2LocationUpdate,
+    WebsocketMessage,
     WsMessageHandler,
 )
-from unifi_access_api.models.websocket import WebsocketMessage
 
+from .command_latency import DoorCommandLatency
 from .const import (
     ACCESS_ENTRY_EVENT,
     ACCESS_EXIT_EVENT,
     ACCESS_GENERIC_EVENT,
+    COMMAND_LATENCY_WINDOW,
+    DEFAULT_CONFIRM_TIMEOUT,
+    DEFAULT_DEDUP_CAPACITY,
+    DEFAULT_DEDUP_WINDOW,
+    DEFAULT_MAX_CONCURRENCY,
+    DISPATCH_HIGH_WATER,
+    DISPATCH_LANES,
+    DISPATCH_MAX_QUEUED,
+    DOOR_REMOVE_AFTER_MISSES,
     DOOR_TYPE_LOCK,
     DOORBELL_START_EVENT,
     DOORBELL_STOP_EVENT,
+    ESSENTIAL_WS_EVENTS,
     INTERCOM_HUB_TYPES,
+    MESSAGE_LOG_SIZE,
+    PRIORITY_WS_EVENTS,
+    PUSH_LATENCY_WINDOW,
+    RECONCILE_LOCK_RULE_BATCH,
+    SAMPLED_WS_EVENTS,
+    SHED_WS_EVENTS,
 )
+from .dedup import EventDedupCache
+from .latency import LatencyTracker
+from .message_log import MessageRecord, RecentMessageLog
+
+if TYPE_CHECKING:
+    from unifi_access_api import (
+        BaseInfo,
+        Device,
+        DeviceUpdate,
+        Door,
+        DoorLockRuleStatus,
+        HwDoorbell,
+        InsightsAdd,
+        LocationUpdateLegacy,
+        LocationUpdateState,
+        LogAdd,
+        RemoteUnlock,
+        RemoteView,
+        RemoteViewChange,
+        SettingUpdate,
+        UnifiAccessApiClient,
+        User,
+        V2LocationState,
+    )
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,32 +98,168 @@ def _normalize_name(name: str) -> str:
 
 
 EventListener = Callable[[str, dict[str, str]], None]
+_QueuedMessage = tuple[WsMessageHandler, WebsocketMessage, MessageRecord]
+
+# Record of the websocket message whose handler is running in this task.
+_current_message: ContextVar[MessageRecord | None] = ContextVar(
+    "unifi_access_current_message", default=None
+)
+
+# Top-level fields some controller versions add to websocket frames with the
+# time the event was emitted. None of them are part of the typed models.
+_MESSAGE_TIME_FIELDS = ("timestamp", "ts")
+
+
+def _epoch_ms(value: object) -> int | None:
+    """Return a positive epoch timestamp in seconds or ms as ms, else None."""
+    if isinstance(value, int | float) and not isinstance(value, bool) and value > 0:
+        # Seconds and milliseconds are both seen in the wild.
+        return int(value if value > 1e11 else value * 1000)
+    return None
+
+
+def _message_sent_at(msg: WebsocketMessage) -> int | None:
+    """Return the controller timestamp of a websocket message in ms, if any."""
+    extra = msg.model_extra or {}
+    for key in _MESSAGE_TIME_FIELDS:
+        if (sent_at := _epoch_ms(extra.get(key))) is not None:
+            return sent_at
+    return None
+
+
+def _event_time_ms(msg: WebsocketMessage, published: object) -> int:
+    """Return when an access event happened in ms.
+
+    Falls back to the message's controller timestamp, then to when the
+    message was received, which does not change while it waits in a queue.
+    """
+    if (published_ms := _epoch_ms(published)) is not None:
+        return published_ms
+    if (sent_at := _message_sent_at(msg)) is not None:
+        return sent_at
+    record = _current_message.get()
+    return int((record.received_at if record else time.time()) * 1000)
+
+
+def access_event_fingerprint(
+    door_id: str, actor: str, bucket: int
+) -> tuple[str, str, int]:
+    """Return the dedup key of an access event in a given time bucket.
+
+    The credential is left out: insights and access logs name it differently
+    (for example ``PIN`` and ``PIN_CODE``) for the same access.
+    """
+    return (door_id, actor.casefold(), bucket)
+
+
+# Door fields that push events change; they live in DoorHotState instead.
+_HOT_DOOR_FIELDS = frozenset({"door_position_status", "door_lock_relay_status"})
+
+
+@dataclass(slots=True)
+class DoorHotState:
+    """Frequently changing door fields, updated in place by push events.
+
+    ``push_seq`` and ``push_sent_at`` are the hub sequence number and the
+    controller timestamp (ms, 0 if unknown) of the last applied push update.
+    ``push_origin`` is when that update was emitted, or received if the
+    controller did not say (epoch seconds), until the door's lock or cover
+    entity has written it.
+    """
+
+    door_position_status: DoorPositionStatus
+    door_lock_relay_status: DoorLockRelayStatus
+    lock_rule: str = ""
+    lock_rule_ended_time: int = 0
+    doorbell_request_id: str | None = None
+    push_seq: int = 0
+    push_sent_at: int = 0
+    push_origin: float = 0.0
+
+    @classmethod
+    def from_door(cls, door: Door) -> DoorHotState:
+        """Return the hot state of a freshly fetched door."""
+        return cls(door.door_position_status, door.door_lock_relay_status)
+
+    def matches(self, door: Door) -> bool:
+        """Return True when a fetched door has the same lock and DPS state."""
+        return (
+            self.door_position_status == door.door_position_status
+            and self.door_lock_relay_status == door.door_lock_relay_status
+        )
+
+    def snapshot(self) -> tuple[Any, ...]:
+        """Return the observable fields for change detection."""
+        return (
+            self.door_position_status,
+            self.door_lock_relay_status,
+            self.lock_rule,
+            self.lock_rule_ended_time,
+        )
+
+
+# Door state confirming each command; ``stop`` has no state to wait for.
+_COMMAND_CONFIRMATIONS: dict[str, Callable[[DoorHotState], bool]] = {
+    "unlock": lambda hot: hot.door_lock_relay_status == DoorLockRelayStatus.UNLOCK,
+    "open": lambda hot: hot.door_position_status == DoorPositionStatus.OPEN,
+    "close": lambda hot: hot.door_position_status == DoorPositionStatus.CLOSE,
+}
 
 
 @dataclass
 class DoorState:
-    """Mutable runtime state for a single door."""
+    """Mutable runtime state for a single door.
+
+    ``door`` is the controller payload as last fetched. Push updates only
+    change ``hot``, so the payload is replaced on a refresh and never copied
+    per event.
+    """
 
     door: Door
     hub_id: str | None = None
     hub_type: str | None = None
     entity_type: str = DOOR_TYPE_LOCK
-    lock_rule: str = ""
-    lock_rule_ended_time: int = 0
     lock_rule_interval: int = 10
     open_time: int = 0
     close_time: int = 0
     obstruction_detected: bool = False
-    doorbell_request_id: str | None = None
     thumbnail: bytes | None = None
     thumbnail_last_updated: datetime | None = None
     device_settings: DeviceSettings | None = None
     has_face_unlock: bool = False
+    # Lock state shown after an unlock command until the door reports it.
+    optimistic_lock: DoorLockRelayStatus | None = None
+    hot: DoorHotState = field(init=False)
+    # Device registry info shared by all entities of this door, and the
+    # (name, hub type) it was built from. Built by the entity layer.
+    device_info: Any = field(default=None, repr=False)
+    device_info_key: tuple[str, str | None] | None = field(default=None, repr=False)
 
     _event_listeners: dict[str, list[EventListener]] = field(
         default_factory=dict, repr=False
     )
 
+    def __post_init__(self) -> None:
+        """Take the initial hot state from the door payload."""
+        self.hot = DoorHotState.from_door(self.door)
+
+    def refresh(self, door: Door) -> bool:
+        """Replace the door payload from a controller read.
+
+        Returns True when the lock or door position state, or any other
+        payload field, differs from what was known.
+        """
+        hot = self.hot
+        changed = not hot.matches(door) or (
+            door != self.door
+            and door.model_dump(exclude=_HOT_DOOR_FIELDS)
+            != self.door.model_dump(exclude=_HOT_DOOR_FIELDS)
+        )
+        self.door = door
+        hot.door_position_status = door.door_position_status
+        hot.door_lock_relay_status = door.door_lock_relay_status
+        return changed
+
     @property
     def id(self) -> str:
         """Return the door id."""
@@ -104,22 +273,49 @@ class DoorState:
     @property
     def door_position_status(self) -> DoorPositionStatus:
         """Return the door position status."""
-        return self.door.door_position_status
+        return self.hot.door_position_status
 
     @property
     def door_lock_relay_status(self) -> DoorLockRelayStatus:
-        """Return the door lock relay status."""
-        return self.door.door_lock_relay_status
+        """Return the door lock relay status, optimistic until confirmed."""
+        return self.optimistic_lock or self.hot.door_lock_relay_status
+
+    @property
+    def lock_rule(self) -> str:
+        """Return the active lock rule, or "" when none."""
+        return self.hot.lock_rule
+
+    @lock_rule.setter
+    def lock_rule(self, value: str) -> None:
+        self.hot.lock_rule = value
+
+    @property
+    def lock_rule_ended_time(self) -> int:
+        """Return when the active lock rule ends (epoch seconds, 0 if never)."""
+        return self.hot.lock_rule_ended_time
+
+    @lock_rule_ended_time.setter
+    def lock_rule_ended_time(self, value: int) -> None:
+        self.hot.lock_rule_ended_time = value
+
+    @property
+    def doorbell_request_id(self) -> str | None:
+        """Return the request id of the ringing doorbell, if any."""
+        return self.hot.doorbell_request_id
+
+    @doorbell_request_id.setter
+    def doorbell_request_id(self, value: str | None) -> None:
+        self.hot.doorbell_request_id = value
 
     @property
     def is_locked(self) -> bool:
         """Return whether the door is locked."""
-        return bool(self.door.door_lock_relay_status == DoorLockRelayStatus.LOCK)
+        return self.door_lock_relay_status == DoorLockRelayStatus.LOCK
 
     @property
     def is_open(self) -> bool:
         """Return whether the door is open."""
-        return bool(self.door.door_position_status == DoorPositionStatus.OPEN)
+        return self.hot.door_position_status == DoorPositionStatus.OPEN
 
     @property
     def doorbell_pressed(self) -> bool:
@@ -142,6 +338,144 @@ class DoorState:
             listener(event, attributes)
 
 
+def door_states_fingerprint(doors: dict[str, DoorState]) -> tuple[Any, ...]:
+    """Return a comparable snapshot of polled door state.
+
+    ``Door`` models are immutable, so holding on to them together with a
+    snapshot of the hot state is enough to detect a change on the next poll.
+    """
+    return tuple(
+        (door_id, state.door, state.hot.snapshot()) for door_id, state in doors.items()
+    )
+
+
+@dataclass
+class DoorCommandResult:
+    """Outcome of a single door command issued as part of a bulk request."""
+
+    door_id: str
+    success: bool
+    latency_ms: float
+    error: str | None = None
+
+
+@dataclass
+class LockRuleTransactionResult:
+    """Outcome of applying a lock rule to several doors as one transaction."""
+
+    applied: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    rolled_back: list[str] = field(default_factory=list)
+    # Rule and end time each door had before, to roll the doors back.
+    previous: dict[str, tuple[str, int]] = field(default_factory=dict, repr=False)
+
+    @property
+    def success(self) -> bool:
+        """Return whether every door accepted the rule."""
+        return not self.failed
+
+
+@dataclass
+class SingleFlightStats:
+    """Call counters for one kind of coalesced controller read."""
+
+    calls: int = 0
+    coalesced: int = 0
+
+
+@dataclass
+class ReconcileStats:
+    """Counters for websocket-mode reconciliation polls."""
+
+    runs: int = 0
+    failures: int = 0
+    runs_with_discrepancy: int = 0
+    door_state: int = 0
+    lock_rule: int = 0
+    emergency: int = 0
+    new_doors: int = 0
+    last_run: datetime | None = None
+    last_discrepancy: datetime | None = None
+
+    @property
+    def discrepancies(self) -> int:
+        """Return the total number of corrected discrepancies."""
+        return self.door_state + self.lock_rule + self.emergency + self.new_doors
+
+
+@dataclass
+class ConnectionStats:
+    """Websocket connection history used to detect and measure outages."""
+
+    connected: bool = False
+    connects: int = 0
+    disconnects: int = 0
+    resyncs: int = 0
+    resync_failures: int = 0
+    resync_corrections: int = 0
+    completed_downtime: float = 0.0
+    last_connected: datetime | None = None
+    last_disconnected: datetime | None = None
+    disconnected_since: float | None = None
+
+    @property
+    def downtime(self) -> float:
+        """Return total seconds disconnected, including any ongoing outage."""
+        if self.disconnected_since is None:
+            return self.completed_downtime
+        return self.completed_downtime + time.monotonic() - self.disconnected_since
+
+
+@dataclass
+class SequencingStats:
+    """Counters for door updates dropped because newer state was applied.
+
+    ``unchecked_messages`` counts pushed frames without a controller
+    timestamp, which are applied in arrival order without a staleness check.
+    """
+
+    stale_messages: defaultdict[str, int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
+    stale_snapshots: int = 0
+    unchecked_messages: int = 0
+
+    @property
+    def dropped(self) -> int:
+        """Return the total number of dropped updates."""
+        return sum(self.stale_messages.values()) + self.stale_snapshots
+
+
+@dataclass
+class DispatchStats:
+    """Counters for the per-door websocket message dispatcher."""
+
+    dispatched: int = 0
+    processed: int = 0
+    failed: int = 0
+    peak_depth: int = 0
+    overloads: int = 0
+    shed: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def shed_total(self) -> int:
+        """Return the number of messages dropped under backpressure."""
+        return sum(self.shed.values())
+
+
+@dataclass
+class DoorGcStats:
+    """Counters for doors pruned after disappearing from the controller."""
+
+    runs: int = 0
+    doors_removed: int = 0
+    thumbnail_bytes: int = 0
+    listeners: int = 0
+    index_entries: int = 0
+    last_removed: list[str] = field(default_factory=list)
+    last_run: datetime | None = None
+
+
 class UnifiAccessHub:
     """Manages door state and websocket events on top of the async API client."""
 
@@ -150,26 +484,85 @@ class UnifiAccessHub:
         client: UnifiAccessApiClient,
         *,
         use_polling: bool = False,
+        dedup_window: float = DEFAULT_DEDUP_WINDOW,
+        dedup_capacity: int = DEFAULT_DEDUP_CAPACITY,
+        confirm_timeout: float = DEFAULT_CONFIRM_TIMEOUT,
     ) -> None:
         """Initialize the hub."""
         self.client = client
         self.use_polling = use_polling
+        self.confirm_timeout = confirm_timeout
         self.doors: dict[str, DoorState] = {}
         self.evacuation: bool = False
         self.lockdown: bool = False
         self.supports_door_lock_rules: bool = True
 
-        # Dedup: track last insights.add timestamp per door to suppress
-        # redundant logs.add events when a hub sends both.
-        self._last_insight_time: dict[str, float] = {}
+        # Dedup: remember recent insights.add fingerprints to suppress the
+        # matching logs.add event when a hub sends both.
+        self.access_event_cache = EventDedupCache(
+            ttl=dedup_window, capacity=dedup_capacity
+        )
+
+        # Single-flight: identical reads issued while one is already in
+        # flight share its result instead of hitting the controller again.
+        self._inflight: dict[tuple[Hashable, ...], asyncio.Future[Any]] = {}
+        self.read_stats: defaultdict[str, SingleFlightStats] = defaultdict(
+            SingleFlightStats
+        )
+
+        # Reconcile: lock rules are re-read a few doors at a time, round-robin.
+        self.reconcile_stats = ReconcileStats()
+        self._reconcile_cursor = 0
+
+        self.connection_stats = ConnectionStats()
+        # Recent messages per event type, for diagnostics.
+        self.message_log = RecentMessageLog(MESSAGE_LOG_SIZE)
+
+        # Sequencing: every applied push update gets a hub-wide sequence
+        # number so REST snapshots fetched before it cannot overwrite it.
+        self._push_seq = 0
+        self.sequencing_stats = SequencingStats()
+
+        # Latency from the controller emitting a door push update (or the hub
+        # receiving it) until the door's lock or cover entity has written it.
+        self.push_latency = LatencyTracker(PUSH_LATENCY_WINDOW)
+        self._push_latency_sources: defaultdict[str, int] = defaultdict(int)
+
+        # Command latency per door: the controller's answer to the request
+        # and the door state change confirming it. Doors with a command
+        # awaiting confirmation are checked on every door state update, and
+        # given up on when their timer fires.
+        self.command_latency: dict[str, DoorCommandLatency] = {}
+        self._awaiting_confirmation: dict[str, Callable[[], None] | None] = {}
+
+        # Dispatcher: websocket messages are queued per door shard so a slow
+        # handler for one door does not hold up messages for other doors.
+        # Global messages use their own priority lane, always lane 0.
+        self._lanes: list[asyncio.Queue[_QueuedMessage]] = []
+        self._overloaded = False
+        self._sample_counts: defaultdict[str, int] = defaultdict(int)
+        self._dispatch_workers: list[asyncio.Task[None]] = []
+        self.dispatch_stats = DispatchStats()
+        self._closing = False
+
+        self.gc_stats = DoorGcStats()
+        # Doors missing from the latest refreshes, with how many in a row.
+        self._door_misses: dict[str, int] = {}
 
         # Set by __init__.py after coordinator creation to push WS updates.
         self.on_doors_updated: Callable[[], None] | None = None
         self.on_emergency_updated: Callable[[], None] | None = None
+        self.on_command_sent: Callable[[], None] | None = None
+        self.on_doors_removed: Callable[[list[str]], None] | None = None
         self.create_task: Callable[[Coroutine[Any, Any, None]], Any] | None = None
+        # Schedules a callback after a delay; returns a function cancelling it.
+        self.call_later: (
+            Callable[[float, Callable[[], None]], Callable[[], None]] | None
+        ) = None
 
     def _notify_doors_updated(self) -> None:
         """Notify that door state changed (triggers coordinator update)."""
+        self._check_command_confirmations()
         if self.on_doors_updated:
             self.on_doors_updated()
 
@@ -178,24 +571,136 @@ class UnifiAccessHub:
         if self.on_emergency_updated:
             self.on_emergency_updated()
 
+    def _notify_command_sent(self) -> None:
+        """Notify that a command was sent (speeds up adaptive polling)."""
+        if self.on_command_sent:
+            self.on_command_sent()
+
+    # ------------------------------------------------------------------
+    # Coalesced reads
+    # ------------------------------------------------------------------
+
+    async def _single_flight[T](
+        self, name: str, factory: Callable[..., Awaitable[T]], *args: Hashable
+    ) -> T:
+        """Run a read once for all concurrent callers with the same arguments.
+
+        The first caller starts the request and later callers await the same
+        future. The request is shielded so a cancelled caller does not abort
+        it for the others.
+        """
+        key = (name, *args)
+        stats = self.read_stats[name]
+        stats.calls += 1
+        if (future := self._inflight.get(key)) is not None:
+            stats.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(factory(*args))
+        self._inflight[key] = future
+
+        def _done(fut: asyncio.Future[Any]) -> None:
+            self._inflight.pop(key, None)
+            if not fut.cancelled():
+                # Mark the exception as retrieved in case every caller left.
+                fut.exception()
+
+        future.add_done_callback(_done)
+        return await asyncio.shield(future)
+
+    async def _get_doors(self) -> list[Door]:
+        """Fetch all doors, sharing an identical in-flight request."""
+        return await self._single_flight("get_doors", self.client.get_doors)
+
+    async def _get_door_lock_rule(self, door_id: str) -> DoorLockRuleStatus:
+        """Fetch a door lock rule, sharing an identical in-flight request."""
+        return await self._single_flight(
+            "get_door_lock_rule", self.client.get_door_lock_rule, door_id
+        )
+
+    async def _get_devices(self) -> list[Device]:
+        """Fetch all devices, sharing an identical in-flight request."""
+        return await self._single_flight("get_devices", self.client.get_devices)
+
+    async def _get_device_settings(self, device_id: str) -> DeviceSettings:
+        """Fetch device settings, sharing an identical in-flight request."""
+        return await self._single_flight(
+            "get_device_settings", self.client.get_device_settings, device_id
+        )
+
+    async def _get_emergency_status(self) -> EmergencyStatus:
+        """Fetch the emergency status, sharing an identical in-flight request."""
+        return await self._single_flight(
+            "get_emergency_status", self.client.get_emergency_status
+        )
+
+    async def _get_users(self) -> list[User]:
+        """Fetch all users, sharing an identical in-flight request."""
+        return await self._single_flight("get_users", self.client.get_users)
+
+    def reconcile_stats_as_dict(self) -> dict[str, Any]:
+        """Return reconciliation counters for diagnostics."""
+        stats = self.reconcile_stats
+        return {
+            **asdict(stats),
+            "discrepancies": stats.discrepancies,
+            "last_run": stats.last_run.isoformat() if stats.last_run else None,
+            "last_discrepancy": (
+                stats.last_discrepancy.isoformat() if stats.last_discrepancy else None
+            ),
+        }
+
+    def gc_stats_as_dict(self) -> dict[str, Any]:
+        """Return removed door counters and reclaimed memory for diagnostics."""
+        stats = self.gc_stats
+        return {
+            **asdict(stats),
+            "last_run": stats.last_run.isoformat() if stats.last_run else None,
+            "missing": dict(self._door_misses),
+        }
+
+    def sequencing_stats_as_dict(self) -> dict[str, Any]:
+        """Return dropped stale update counters for diagnostics."""
+        stats = self.sequencing_stats
+        return {
+            "dropped": stats.dropped,
+            "stale_messages": dict(stats.stale_messages),
+            "stale_snapshots": stats.stale_snapshots,
+            "unchecked_messages": stats.unchecked_messages,
+        }
+
+    def read_stats_as_dict(self) -> dict[str, dict[str, int]]:
+        """Return single-flight counters per read for diagnostics."""
+        return {
+            name: {"calls": stats.calls, "coalesced": stats.coalesced}
+            for name, stats in sorted(self.read_stats.items())
+        }
+
     # ------------------------------------------------------------------
     # Data fetching
     # ------------------------------------------------------------------
 
     async def async_update(self) -> dict[str, DoorState]:
         """Fetch all doors and return the door state dict (for coordinator)."""
-        api_doors = await self.client.get_doors()
+        self._discard_push_origins()
+        started_seq = self._push_seq
+        api_doors = await self._get_doors()
+        self._prune_removed_doors(api_doors)
         for api_door in api_doors:
-            if api_door.id in self.doors:
-                self.doors[api_door.id].door = api_door
-            else:
+            if api_door.id not in self.doors:
                 self.doors[api_door.id] = DoorState(door=api_door)
-        # Fetch lock rules for each door
+            elif not self._is_stale_snapshot(self.doors[api_door.id], started_seq):
+                self.doors[api_door.id].refresh(api_door)
+        # Fetch lock rules for each door the controller still reports
         for door_id, state in self.doors.items():
+            if door_id in self._door_misses:
+                continue
             try:
-                rule_status = await self.client.get_door_lock_rule(door_id)
-                state.lock_rule = rule_status.type.value
-                state.lock_rule_ended_time = rule_status.ended_time
+                started_seq = self._push_seq
+                rule_status = await self._get_door_lock_rule(door_id)
+                if not self._is_stale_snapshot(state, started_seq):
+                    state.lock_rule = rule_status.type.value
+                    state.lock_rule_ended_time = rule_status.ended_time
             except ApiNotFoundError:
                 _LOGGER.debug("Door lock rules not supported for door %s", door_id)
                 self.supports_door_lock_rules = False
@@ -206,8 +711,184 @@ class UnifiAccessHub:
             await self._async_map_hub_types()
         else:
             await self.async_refresh_device_settings()
+        self._check_command_confirmations()
         return self.doors
 
+    async def async_reconcile(
+        self, *, lock_rule_batch: int = RECONCILE_LOCK_RULE_BATCH
+    ) -> int:
+        """Re-read controller state and correct drift from missed push events.
+
+        Door and emergency state are cheap single requests and are compared
+        in full on every run. Lock rules need one request per door, so only
+        ``lock_rule_batch`` doors are checked per run, cycling through all
+        doors over successive runs. Returns the number of corrections made.
+        """
+        stats = self.reconcile_stats
+        stats.runs += 1
+        stats.last_run = datetime.now(UTC)
+        self._discard_push_origins()
+        started_seq = self._push_seq
+        try:
+            api_doors = await self._get_doors()
+            rule_door_ids = self._next_reconcile_batch(lock_rule_batch)
+            rule_results = await asyncio.gather(
+                *(self._get_door_lock_rule(door_id) for door_id in rule_door_ids),
+                return_exceptions=True,
+            )
+            emergency = await self._get_emergency_status()
+        except ApiError:
+            stats.failures += 1
+            raise
+
+        doors_changed = len(self._prune_removed_doors(api_doors))
+        changed, new_doors = self._reconcile_doors(api_doors, started_seq)
+        doors_changed += changed
+        doors_changed += self._reconcile_lock_rules(
+            rule_door_ids, rule_results, started_seq
+        )
+
+        emergency_changed = (emergency.evacuation, emergency.lockdown) != (
+            self.evacuation,
+            self.lockdown,
+        )
+        if emergency_changed:
+            _LOGGER.debug("Reconcile corrected emergency status")
+            self.evacuation = emergency.evacuation
+            self.lockdown = emergency.lockdown
+            stats.emergency += 1
+
+        if new_doors:
+            await self._async_map_hub_types()
+
+        found = doors_changed + emergency_changed
+        if found:
+            stats.runs_with_discrepancy += 1
+            stats.last_discrepancy = stats.last_run
+        if doors_changed:
+            self._notify_doors_updated()
+        if emergency_changed:
+            self._notify_emergency_updated()
+        return found
+
+    def _prune_removed_doors(self, api_doors: list[Door]) -> list[str]:
+        """Forget doors the controller no longer reports; return their ids.
+
+        A door is only removed once it has been missing from
+        ``DOOR_REMOVE_AFTER_MISSES`` refreshes in a row, so a partial list
+        from a restarting controller does not delete devices and their
+        customizations. An empty door list is ignored altogether.
+
+        Drops the door state with its thumbnail and event listeners, and the
+        door's access event cache entries and command latency, then
+        notifies ``on_doors_removed`` so entities and devices can go too.
+        """
+        if not api_doors:
+            return []
+        present = {api_door.id for api_door in api_doors}
+        self._door_misses = {
+            door_id: self._door_misses.get(door_id, 0) + 1
+            for door_id in self.doors
+            if door_id not in present
+        }
+        removed = [
+            door_id
+            for door_id, misses in self._door_misses.items()
+            if misses >= DOOR_REMOVE_AFTER_MISSES
+        ]
+        if not removed:
+            return []
+
+        stats = self.gc_stats
+        stats.runs += 1
+        stats.last_run = datetime.now(UTC)
+        stats.last_removed = removed
+        removed_ids = set(removed)
+        for door_id in removed:
+            del self._door_misses[door_id]
+            state = self.doors.pop(door_id)
+            stats.thumbnail_bytes += len(state.thumbnail or b"")
+            stats.listeners += sum(map(len, state._event_listeners.values()))
+            state._event_listeners.clear()
+            state.thumbnail = None
+            self.command_latency.pop(door_id, None)
+            self._stop_awaiting(door_id)
+        stats.index_entries += self.access_event_cache.discard(
+            lambda key: key[0] in removed_ids
+        )
+        stats.doors_removed += len(removed)
+        _LOGGER.info(
+            "Removed %s doors no longer reported by the controller: %s",
+            len(removed),
+            ", ".join(removed),
+        )
+        if self.on_doors_removed:
+            self.on_doors_removed(removed)
+        return removed
+
+    def _reconcile_doors(
+        self, api_doors: list[Door], started_seq: int
+    ) -> tuple[int, bool]:
+        """Apply fetched doors; return the number corrected and if any are new."""
+        stats = self.reconcile_stats
+        changed = 0
+        new_doors = False
+        for api_door in api_doors:
+            state = self.doors.get(api_door.id)
+            if state is None:
+                _LOGGER.debug("Reconcile found new door %s", api_door.id)
+                self.doors[api_door.id] = DoorState(door=api_door)
+                stats.new_doors += 1
+                new_doors = True
+            elif not self._is_stale_snapshot(state, started_seq) and state.refresh(
+                api_door
+            ):
+                _LOGGER.debug("Reconcile corrected state of door %s", api_door.id)
+                stats.door_state += 1
+            else:
+                continue
+            changed += 1
+        return changed, new_doors
+
+    def _reconcile_lock_rules(
+        self,
+        door_ids: list[str],
+        results: list[DoorLockRuleStatus | BaseException],
+        started_seq: int,
+    ) -> int:
+        """Apply fetched lock rules; return the number corrected."""
+        changed = 0
+        for door_id, result in zip(door_ids, results, strict=True):
+            state = self.doors.get(door_id)
+            if state is None or isinstance(result, ApiError):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            rule = (result.type.value, result.ended_time)
+            if rule != (
+                state.lock_rule,
+                state.lock_rule_ended_time,
+            ) and not self._is_stale_snapshot(state, started_seq):
+                _LOGGER.debug("Reconcile corrected lock rule of door %s", door_id)
+                state.lock_rule, state.lock_rule_ended_time = rule
+                self.reconcile_stats.lock_rule += 1
+                changed += 1
+        return changed
+
+    def _next_reconcile_batch(self, size: int) -> list[str]:
+        """Return the next doors whose lock rule should be reconciled."""
+        if not self.supports_door_lock_rules or not self.doors or size <= 0:
+            return []
+        door_ids = [
+            door_id for door_id in self.doors if door_id not in self._door_misses
+        ]
+        if not door_ids:
+            return []
+        start = self._reconcile_cursor % len(door_ids)
+        batch = (door_ids[start:] + door_ids[:start])[:size]
+        self._reconcile_cursor = start + len(batch)
+        return batch
+
     @staticmethod
     def _is_hub_device(device: Device) -> bool:
         """Return True when a device represents a hub/controller."""
@@ -217,7 +898,7 @@ class UnifiAccessHub:
     async def _async_map_hub_types(self) -> None:
         """Fetch devices and map hub types to doors."""
         try:
-            devices = await self.client.get_devices()
+            devices = await self._get_devices()
         except ApiError:
             _LOGGER.warning(
                 "Could not fetch devices for hub type mapping", exc_info=True
@@ -263,7 +944,7 @@ class UnifiAccessHub:
 
         if face_doors:
             results = await asyncio.gather(
-                *(self.client.get_device_settings(dev_id) for _, dev_id in face_doors),
+                *(self._get_device_settings(dev_id) for _, dev_id in face_doors),
                 return_exceptions=True,
             )
             for (door_id, _), result in zip(face_doors, results):
@@ -307,7 +988,7 @@ class UnifiAccessHub:
 
     async def async_get_emergency_status(self) -> EmergencyStatus:
         """Fetch the current emergency status."""
-        status = await self.client.get_emergency_status()
+        status = await self._get_emergency_status()
         self.evacuation = status.evacuation
         self.lockdown = status.lockdown
         return status
@@ -316,23 +997,35 @@ class UnifiAccessHub:
         self, *, evacuation: bool | None = None, lockdown: bool | None = None
     ) -> None:
         """Set the emergency status."""
-        current = await self.client.get_emergency_status()
+        current = await self._get_emergency_status()
         new_status = EmergencyStatus(
             evacuation=evacuation if evacuation is not None else current.evacuation,
             lockdown=lockdown if lockdown is not None else current.lockdown,
         )
         await self.client.set_emergency_status(new_status)
+        self._notify_command_sent()
         self.evacuation = new_status.evacuation
         self.lockdown = new_status.lockdown
         self._notify_emergency_updated()
 
     async def async_set_lock_rule(self, door_id: str, rule_type: str) -> None:
         """Set a door lock rule."""
+        if await self._async_apply_lock_rule(door_id, rule_type):
+            self._notify_doors_updated()
+
+    async def _async_apply_lock_rule(
+        self, door_id: str, rule_type: str, *, interval: int | None = None
+    ) -> bool:
+        """Send a door lock rule and record it on the door state.
+
+        Returns True when tracked door state was changed.
+        """
         if not rule_type:
-            return
+            return False
 
         state = self.doors.get(door_id)
-        interval = state.lock_rule_interval if state else 0
+        if interval is None:
+            interval = state.lock_rule_interval if state else 0
 
         try:
             door_lock_rule_type = DoorLockRuleType(rule_type)
@@ -342,25 +1035,367 @@ class UnifiAccessHub:
                 rule_type,
                 door_id,
             )
-            return
+            return False
 
         rule = DoorLockRule(type=door_lock_rule_type, interval=interval)
         await self.client.set_door_lock_rule(door_id, rule)
+        self._notify_command_sent()
 
-        if state is not None:
-            state.lock_rule = rule_type
+        if state is None:
+            return False
+        state.lock_rule = rule_type
+        return True
+
+    async def async_set_lock_rule_bulk(
+        self,
+        door_ids: Iterable[str],
+        rule_type: str,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> LockRuleTransactionResult:
+        """Apply a lock rule to many doors concurrently, all or nothing.
+
+        If any door rejects the rule, doors that already accepted it are
+        restored to the rule they had before. Door state listeners are
+        notified once, after the transaction has settled.
+        """
+        door_ids = [
+            door_id for door_id in dict.fromkeys(door_ids) if door_id in self.doors
+        ]
+        result = LockRuleTransactionResult(
+            previous={
+                door_id: (
+                    self.doors[door_id].lock_rule,
+                    self.doors[door_id].lock_rule_ended_time,
+                )
+                for door_id in door_ids
+            }
+        )
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _apply(door_id: str) -> None:
+            async with semaphore:
+                await self._async_apply_lock_rule(door_id, rule_type)
+
+        outcomes = await asyncio.gather(
+            *(_apply(door_id) for door_id in door_ids), return_exceptions=True
+        )
+        for door_id, outcome in zip(door_ids, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                result.failed[door_id] = str(outcome)
+            else:
+                result.applied.append(door_id)
+
+        if result.failed and result.applied:
+            _LOGGER.warning(
+                "Lock rule %s failed for door(s) %s, rolling back %s",
+                rule_type,
+                ", ".join(result.failed),
+                ", ".join(result.applied),
+            )
+            await self._async_rollback_lock_rules(result, semaphore)
+
+        if door_ids:
             self._notify_doors_updated()
+        return result
+
+    async def async_rollback_lock_rules(
+        self,
+        result: LockRuleTransactionResult,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Restore the doors a lock rule transaction applied to.
+
+        Used when the transaction was part of a larger one that failed
+        elsewhere, such as on another controller. Restored doors move from
+        ``applied`` to ``rolled_back``.
+        """
+        if not result.applied:
+            return
+        await self._async_rollback_lock_rules(
+            result, asyncio.Semaphore(max(1, max_concurrency))
+        )
+        self._notify_doors_updated()
+
+    async def _async_rollback_lock_rules(
+        self, result: LockRuleTransactionResult, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Restore the applied doors of ``result`` to their previous rule."""
+
+        async def _restore(door_id: str) -> None:
+            async with semaphore:
+                await self._async_restore_lock_rule(door_id, *result.previous[door_id])
+
+        rollbacks = await asyncio.gather(
+            *(_restore(door_id) for door_id in result.applied),
+            return_exceptions=True,
+        )
+        for door_id, outcome in zip(result.applied, rollbacks, strict=True):
+            if isinstance(outcome, BaseException):
+                _LOGGER.error(
+                    "Could not roll back lock rule for door %s: %s",
+                    door_id,
+                    outcome,
+                )
+            else:
+                result.rolled_back.append(door_id)
+        result.applied = []
+
+    async def _async_restore_lock_rule(
+        self, door_id: str, rule_type: str, ended_time: int
+    ) -> None:
+        """Restore a door to a previously observed lock rule."""
+        remaining = ended_time - time.time()
+        if rule_type in (DoorLockRuleType.KEEP_LOCK, DoorLockRuleType.KEEP_UNLOCK):
+            await self._async_apply_lock_rule(door_id, rule_type)
+        elif rule_type == DoorLockRuleType.CUSTOM and remaining > 0:
+            await self._async_apply_lock_rule(
+                door_id, rule_type, interval=max(1, math.ceil(remaining / 60))
+            )
+        else:
+            await self._async_apply_lock_rule(door_id, DoorLockRuleType.RESET)
+
+        state = self.doors[door_id]
+        state.lock_rule = rule_type
+        state.lock_rule_ended_time = ended_time
 
     # ------------------------------------------------------------------
     # WebSocket
     # ------------------------------------------------------------------
 
-    def start_websocket(
-        self,
-        on_connect: Callable[[], Any] | None = None,
-        on_disconnect: Callable[[], Any] | None = None,
+    def _handle_ws_connect(self) -> None:
+        """Record a websocket connection and resync after an outage."""
+        stats = self.connection_stats
+        stats.connected = True
+        stats.connects += 1
+        stats.last_connected = datetime.now(UTC)
+        if stats.disconnected_since is None:
+            return
+
+        outage = time.monotonic() - stats.disconnected_since
+        stats.completed_downtime += outage
+        stats.disconnected_since = None
+        _LOGGER.info("Websocket reconnected after %.1f s, resyncing state", outage)
+        # Runs in the background: the client awaits this callback before it
+        # starts reading messages again.
+        if self.create_task:
+            self.create_task(self._async_resync())
+
+    def _handle_ws_disconnect(self) -> None:
+        """Record the start of a websocket outage."""
+        stats = self.connection_stats
+        if not stats.connected or self._closing:
+            return
+        stats.connected = False
+        stats.disconnects += 1
+        stats.last_disconnected = datetime.now(UTC)
+        stats.disconnected_since = time.monotonic()
+        self._notify_doors_updated()
+
+    async def _async_resync(self) -> None:
+        """Re-read everything that may have changed while disconnected."""
+        stats = self.connection_stats
+        stats.resyncs += 1
+        try:
+            found = await self.async_reconcile(lock_rule_batch=len(self.doors))
+        except ApiError as err:
+            stats.resync_failures += 1
+            _LOGGER.warning("Resync after websocket reconnect failed: %s", err)
+            return
+        stats.resync_corrections += found
+        _LOGGER.debug("Resync after websocket reconnect corrected %s item(s)", found)
+        # Refresh outage sensors even when no door state changed.
+        self._notify_doors_updated()
+
+    def connection_stats_as_dict(self) -> dict[str, Any]:
+        """Return websocket connection counters for diagnostics."""
+        stats = self.connection_stats
+        return {
+            "connected": stats.connected,
+            "connects": stats.connects,
+            "disconnects": stats.disconnects,
+            "downtime": round(stats.downtime, 3),
+            "resyncs": stats.resyncs,
+            "resync_failures": stats.resync_failures,
+            "resync_corrections": stats.resync_corrections,
+            "last_connected": (
+                stats.last_connected.isoformat() if stats.last_connected else None
+            ),
+            "last_disconnected": (
+                stats.last_disconnected.isoformat() if stats.last_disconnected else None
+            ),
+        }
+
+    @staticmethod
+    def _dispatch_key(msg: WebsocketMessage) -> str:
+        """Return the ordering key of a message: its door, or its source."""
+        if isinstance(msg, LocationUpdateV2 | V2LocationUpdate) and msg.data.id:
+            return msg.data.id
+        if msg.door_id:
+            return msg.door_id
+        data = getattr(msg, "data", None)
+        for attr in ("location_id", "unique_id"):
+            value = getattr(data, attr, "")
+            if isinstance(value, str) and value:
+                return value
+        return msg.event_object_id or msg.event or ""
+
+    @staticmethod
+    def _split_by_door(msg: WebsocketMessage) -> list[WebsocketMessage]:
+        """Split a device update carrying door state into one part per door.
+
+        Each part is keyed by its door, so it is queued behind the other state
+        updates of that door instead of racing them in the device's lane.
+        """
+        if not isinstance(msg, V2DeviceUpdate) or not msg.data.location_states:
+            return [msg]
+        return [
+            msg.model_copy(
+                update={
+                    "door_id": loc_state.location_id,
+                    "data": msg.data.model_copy(
+                        update={"location_states": [loc_state]}
+                    ),
+                }
+            )
+            for loc_state in msg.data.location_states
+        ]
+
+    def _start_dispatcher(
+        self, create_task: Callable[[Coroutine[Any, Any, None]], Any], door_lanes: int
+    ) -> None:
+        """Create the priority lane, the door lanes and one worker per lane."""
+        self._lanes = [asyncio.Queue() for _ in range(1 + max(1, door_lanes))]
+        self._dispatch_workers = [
+            create_task(self._async_dispatch_worker(queue)) for queue in self._lanes
+        ]
+
+    def _lane_for(self, msg: WebsocketMessage) -> int:
+        """Return the lane for a message by hashing its ordering key.
+
+        A stable hash keeps every message of a door in the same lane without
+        remembering an assignment per key.
+        """
+        if msg.event in PRIORITY_WS_EVENTS:
+            return 0
+        key = self._dispatch_key(msg)
+        return 1 + zlib.crc32(key.encode()) % (len(self._lanes) - 1)
+
+    def _dispatch(self, handler: WsMessageHandler) -> WsMessageHandler:
+        """Wrap a handler so its messages are queued instead of awaited."""
+
+        async def _enqueue(msg: WebsocketMessage) -> None:
+            for part in self._split_by_door(msg):
+                record = self.message_log.add(part)
+                if not self._admit(part):
+                    record.outcome = "shed"
+                    continue
+                queue = self._lanes[self._lane_for(part)]
+                queue.put_nowait((handler, part, record))
+                stats = self.dispatch_stats
+                stats.dispatched += 1
+                stats.peak_depth = max(stats.peak_depth, queue.qsize())
+
+        return _enqueue
+
+    def _admit(self, msg: WebsocketMessage) -> bool:
+        """Apply backpressure and return whether a message should be queued.
+
+        Lock state, doorbell and emergency messages are always queued. Once
+        the backlog reaches the high-water mark, low-value messages are shed
+        or sampled, and past the hard limit every other message is shed too.
+        """
+        event = msg.event or ""
+        if event in ESSENTIAL_WS_EVENTS:
+            return True
+
+        queued = sum(queue.qsize() for queue in self._lanes)
+        stats = self.dispatch_stats
+        if queued < DISPATCH_HIGH_WATER:
+            if self._overloaded:
+                self._overloaded = False
+                _LOGGER.info("Websocket backlog drained, no longer shedding")
+            return True
+
+        if not self._overloaded:
+            self._overloaded = True
+            stats.overloads += 1
+            _LOGGER.warning(
+                "Websocket backlog of %s messages, shedding low-value messages",
+                queued,
+            )
+
+        if queued < DISPATCH_MAX_QUEUED:
+            if event in SAMPLED_WS_EVENTS:
+                self._sample_counts[event] += 1
+                if (self._sample_counts[event] - 1) % SAMPLED_WS_EVENTS[event] == 0:
+                    return True
+            elif event not in SHED_WS_EVENTS:
+                return True
+
+        stats.shed[event] += 1
+        return False
+
+    async def _async_dispatch_worker(
+        self, queue: asyncio.Queue[_QueuedMessage]
     ) -> None:
-        """Start the websocket connection with all event handlers."""
+        """Process one lane's messages in order."""
+        while True:
+            handler, msg, record = await queue.get()
+            record.start()
+            _current_message.set(record)
+            try:
+                await handler(msg)
+            except Exception:
+                record.finish("failed")
+                self.dispatch_stats.failed += 1
+                _LOGGER.exception("Error handling websocket message %s", msg.event)
+            else:
+                record.finish("processed")
+                self.dispatch_stats.processed += 1
+            finally:
+                queue.task_done()
+
+    def dispatch_stats_as_dict(self) -> dict[str, Any]:
+        """Return dispatcher counters and current queue depths."""
+        stats = self.dispatch_stats
+        return {
+            "dispatched": stats.dispatched,
+            "processed": stats.processed,
+            "failed": stats.failed,
+            "peak_depth": stats.peak_depth,
+            "overloads": stats.overloads,
+            "shed_total": stats.shed_total,
+            "shed": dict(stats.shed),
+            "priority_depth": self._lanes[0].qsize() if self._lanes else 0,
+            "door_lane_depths": [queue.qsize() for queue in self._lanes[1:]],
+        }
+
+    def _record(self, handler: WsMessageHandler) -> WsMessageHandler:
+        """Wrap a handler run inline so its messages are logged and timed."""
+
+        async def _recorded(msg: WebsocketMessage) -> None:
+            record = self.message_log.add(msg)
+            record.start()
+            token = _current_message.set(record)
+            try:
+                await handler(msg)
+            except Exception:
+                record.finish("failed")
+                raise
+            finally:
+                _current_message.reset(token)
+            record.finish("processed")
+
+        return _recorded
+
+    def start_websocket(self, *, dispatch_lanes: int = DISPATCH_LANES) -> None:
+        """Start the websocket connection with all event handlers.
+
+        When a task factory is available, messages are processed by the
+        per-door dispatcher; otherwise handlers run inline in arrival order.
+        """
         handlers: dict[str, WsMessageHandler] = {
             "access.data.device.location_update_v2": self._handle_location_update,
             "access.data.v2.location.update": self._handle_v2_location_update,
@@ -376,12 +1411,26 @@ class UnifiAccessHub:
             "access.data.setting.update": self._handle_settings_update,
             "access.data.device.remote_unlock": self._handle_remote_unlock,
         }
+        if self.create_task is not None:
+            self._start_dispatcher(self.create_task, dispatch_lanes)
+            handlers = {
+                event: self._dispatch(handler) for event, handler in handlers.items()
+            }
+        else:
+            handlers = {
+                event: self._record(handler) for event, handler in handlers.items()
+            }
         self.client.start_websocket(
             handlers,
-            on_connect=on_connect,
-            on_disconnect=on_disconnect,
+            on_connect=self._handle_ws_connect,
+            on_disconnect=self._handle_ws_disconnect,
         )
 
+    async def async_has_user(self, user_id: str) -> bool:
+        """Return whether a user exists on this controller."""
+        users = await self._get_users()
+        return any(user.id == user_id for user in users)
+
     async def async_update_user_status(self, user_id: str, *, enabled: bool) -> None:
         """Enable or disable a user."""
         await self.client.update_user_status(user_id, enabled=enabled)
@@ -390,17 +1439,173 @@ class UnifiAccessHub:
         """Update or remove a user's PIN."""
         await self.client.update_user_pin(user_id, pin)
 
+    async def async_unlock_door(self, door_id: str) -> None:
+        """Send unlock command to a door."""
+        await self._async_door_command(door_id)
+        self._notify_command_sent()
+
     async def async_open_door(self, door_id: str) -> None:
         """Send open command to a UGT gate/garage door."""
-        await self.client.unlock_door(door_id, control_cmd="open")
+        await self._async_door_command(door_id, "open")
+        self._notify_command_sent()
 
     async def async_close_door(self, door_id: str) -> None:
         """Send close command to a UGT gate/garage door."""
-        await self.client.unlock_door(door_id, control_cmd="close")
+        await self._async_door_command(door_id, "close")
+        self._notify_command_sent()
 
     async def async_stop_door(self, door_id: str) -> None:
         """Send stop command to a UGT gate/garage door."""
-        await self.client.unlock_door(door_id, control_cmd="stop")
+        await self._async_door_command(door_id, "stop")
+        self._notify_command_sent()
+
+    async def _async_door_command(
+        self, door_id: str, control_cmd: str | None = None
+    ) -> None:
+        """Send ``unlock_door`` to a door, timing the request and its effect.
+
+        The command awaits confirmation before the request is sent, as the
+        push update reporting its effect can arrive before the response. An
+        unlock is shown optimistically until it is confirmed, and rolled
+        back if the request fails or no confirmation arrives in time. Commands
+        for doors the hub does not know are sent without being timed.
+        """
+        if (state := self.doors.get(door_id)) is None:
+            await self.client.unlock_door(door_id, control_cmd=control_cmd)
+            return
+        command = control_cmd or "unlock"
+        if (latency := self.command_latency.get(door_id)) is None:
+            latency = self.command_latency[door_id] = DoorCommandLatency(
+                COMMAND_LATENCY_WINDOW, self.confirm_timeout
+            )
+        start = latency.begin(command, state.hot, _COMMAND_CONFIRMATIONS.get(command))
+        self._stop_awaiting(door_id)
+        if latency.pending is not None:
+            self._awaiting_confirmation[door_id] = (
+                self.call_later(
+                    self.confirm_timeout, partial(self._expire_command, door_id)
+                )
+                if self.call_later
+                else None
+            )
+        # A superseded command's optimistic state goes with it.
+        self._set_optimistic_lock(
+            state,
+            DoorLockRelayStatus.UNLOCK
+            if latency.pending is not None and command == "unlock"
+            else None,
+        )
+        try:
+            await self.client.unlock_door(door_id, control_cmd=control_cmd)
+        except ApiError:
+            latency.fail()
+            self._stop_awaiting(door_id)
+            self._set_optimistic_lock(state, None)
+            raise
+        latency.answered(start)
+
+    def _check_command_confirmations(self) -> None:
+        """Confirm or expire commands whose effect the doors now report."""
+        if not self._awaiting_confirmation:
+            return
+        now = time.monotonic()
+        for door_id in list(self._awaiting_confirmation):
+            state = self.doors.get(door_id)
+            latency = self.command_latency.get(door_id)
+            if state is None or latency is None:
+                self._stop_awaiting(door_id)
+            elif (confirmed := latency.check(state.hot, now)) is not None:
+                self._stop_awaiting(door_id)
+                self._settle_optimistic(state, confirmed=confirmed)
+
+    def _stop_awaiting(self, door_id: str) -> None:
+        """Stop awaiting confirmation of a door's command, cancelling its timer."""
+        if cancel := self._awaiting_confirmation.pop(door_id, None):
+            cancel()
+
+    def _expire_command(self, door_id: str) -> None:
+        """Give up on a command no door state update has confirmed."""
+        self._awaiting_confirmation.pop(door_id, None)
+        if (latency := self.command_latency.get(door_id)) is not None:
+            latency.expire()
+        if (state := self.doors.get(door_id)) is not None and self._settle_optimistic(
+            state, confirmed=False
+        ):
+            self._notify_doors_updated()
+
+    def _set_optimistic_lock(
+        self, state: DoorState | None, value: DoorLockRelayStatus | None
+    ) -> None:
+        """Show ``value`` as the lock state of a door until it is settled."""
+        if state is not None and state.optimistic_lock != value:
+            state.optimistic_lock = value
+            self._notify_doors_updated()
+
+    def _settle_optimistic(self, state: DoorState, *, confirmed: bool) -> bool:
+        """Drop the optimistic lock state; return True if it was rolled back."""
+        if state.optimistic_lock is None:
+            return False
+        state.optimistic_lock = None
+        if confirmed:
+            return False
+        _LOGGER.warning(
+            "Unlock of %s (%s) was not confirmed within %s seconds, "
+            "showing the reported lock state again",
+            state.name,
+            state.id,
+            self.confirm_timeout,
+        )
+        return True
+
+    def command_latency_as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return command latency per door for diagnostics."""
+        return {
+            door_id: latency.as_dict()
+            for door_id, latency in sorted(self.command_latency.items())
+        }
+
+    async def async_bulk_door_command(
+        self,
+        door_ids: Iterable[str],
+        *,
+        control_cmd: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[DoorCommandResult]:
+        """Send ``unlock_door`` to many doors concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once. Failures
+        are reported per door instead of aborting the remaining commands.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _send(door_id: str) -> DoorCommandResult:
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    await self._async_door_command(door_id, control_cmd)
+                except ApiError as err:
+                    _LOGGER.warning(
+                        "Bulk command %s failed for door %s: %s",
+                        control_cmd or "unlock",
+                        door_id,
+                        err,
+                    )
+                    return DoorCommandResult(
+                        door_id=door_id,
+                        success=False,
+                        latency_ms=(time.monotonic() - start) * 1000,
+                        error=str(err),
+                    )
+                return DoorCommandResult(
+                    door_id=door_id,
+                    success=True,
+                    latency_ms=(time.monotonic() - start) * 1000,
+                )
+
+        results = await asyncio.gather(*(_send(door_id) for door_id in door_ids))
+        if any(result.success for result in results):
+            self._notify_command_sent()
+        return results
 
     async def async_set_face_unlock(self, door_id: str, *, enabled: bool) -> None:
         """Enable or disable face unlock on a device."""
@@ -410,18 +1615,93 @@ class UnifiAccessHub:
             state.hub_id,
             {"face": {"enabled": value}},
         )
-        if state.device_settings is not None:
-            updated_face = state.device_settings.access_methods.face.model_copy(
-                update={"enabled": value}
-            )
-            updated_methods = state.device_settings.access_methods.model_copy(
-                update={"face": updated_face}
-            )
-            state.device_settings = state.device_settings.model_copy(
-                update={"access_methods": updated_methods}
-            )
+        self._notify_command_sent()
+        self._set_cached_face_unlock([state], value)
         self._notify_doors_updated()
 
+    async def async_set_face_unlock_bulk(
+        self,
+        door_ids: Iterable[str],
+        *,
+        enabled: bool,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[DoorCommandResult]:
+        """Enable or disable face unlock on the readers of many doors.
+
+        Doors sharing a reader result in a single ``put_device_settings``
+        call, and at most ``max_concurrency`` calls are in flight at once.
+        Listeners are notified once, after every reader has answered.
+        """
+        value = "yes" if enabled else "no"
+        door_ids = list(dict.fromkeys(door_ids))
+        results: dict[str, DoorCommandResult] = {}
+        by_hub: dict[str, list[DoorState]] = defaultdict(list)
+        for door_id in door_ids:
+            state = self.doors.get(door_id)
+            if state is None or not state.has_face_unlock or not state.hub_id:
+                results[door_id] = DoorCommandResult(
+                    door_id=door_id,
+                    success=False,
+                    latency_ms=0.0,
+                    error="face unlock not supported",
+                )
+                continue
+            by_hub[state.hub_id].append(state)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _send(hub_id: str, states: list[DoorState]) -> None:
+            async with semaphore:
+                start = time.monotonic()
+                error: str | None = None
+                try:
+                    await self.client.put_device_settings(
+                        hub_id, {"face": {"enabled": value}}
+                    )
+                except ApiError as err:
+                    _LOGGER.warning(
+                        "Setting face unlock failed for hub %s: %s", hub_id, err
+                    )
+                    error = str(err)
+                else:
+                    self._set_cached_face_unlock(states, value)
+                latency_ms = (time.monotonic() - start) * 1000
+                for state in states:
+                    results[state.door.id] = DoorCommandResult(
+                        door_id=state.door.id,
+                        success=error is None,
+                        latency_ms=latency_ms,
+                        error=error,
+                    )
+
+        await asyncio.gather(
+            *(_send(hub_id, states) for hub_id, states in by_hub.items())
+        )
+        if any(result.success for result in results.values()):
+            self._notify_command_sent()
+            self._notify_doors_updated()
+        return [results[door_id] for door_id in door_ids]
+
+    @staticmethod
+    def _set_cached_face_unlock(states: list[DoorState], value: str) -> None:
+        """Store the new face unlock setting in the cached device settings.
+
+        The settings models are immutable, so the updated copy is built once
+        and shared by every door on the same reader.
+        """
+        settings = states[0].device_settings
+        if settings is None:
+            return
+        methods = settings.access_methods
+        settings = settings.model_copy(
+            update={
+                "access_methods": methods.model_copy(
+                    update={"face": methods.face.model_copy(update={"enabled": value})}
+                )
+            }
+        )
+        for state in states:
+            state.device_settings = settings
+
     async def async_refresh_device_settings(self) -> None:
         """Re-fetch device settings for all face-capable doors."""
         face_doors = [
@@ -432,7 +1712,7 @@ class UnifiAccessHub:
         if not face_doors:
             return
         results = await asyncio.gather(
-            *(self.client.get_device_settings(hub_id) for _, hub_id in face_doors),
+            *(self._get_device_settings(hub_id) for _, hub_id in face_doors),
             return_exceptions=True,
         )
         for (door_id, _), result in zip(face_doors, results):
@@ -441,25 +1721,119 @@ class UnifiAccessHub:
 
     async def async_close(self) -> None:
         """Close the API client (stops websocket)."""
+        self._closing = True
+        for door_id in list(self._awaiting_confirmation):
+            self._stop_awaiting(door_id)
         await self.client.close()
+        for worker in self._dispatch_workers:
+            worker.cancel()
+        self._dispatch_workers = []
 
     # ------------------------------------------------------------------
     # WebSocket helpers
     # ------------------------------------------------------------------
 
+    def _accept_push(self, state: DoorState, msg: WebsocketMessage) -> bool:
+        """Return whether pushed door state may be applied.
+
+        Only frames with a controller timestamp can be checked: those older
+        than the last applied one are dropped. The typed payloads carry no
+        sequence number, so frames without a timestamp are applied as they
+        are handled and counted as unchecked. Their order relies on the
+        dispatcher queueing every state update of a door in that door's lane.
+        Accepted frames are stamped with the next hub sequence number so REST
+        reads that started earlier are not applied over them.
+        """
+        sent_at = _message_sent_at(msg)
+        if sent_at is None:
+            self.sequencing_stats.unchecked_messages += 1
+        elif sent_at < state.hot.push_sent_at:
+            self.sequencing_stats.stale_messages[msg.event or ""] += 1
+            _LOGGER.debug(
+                "Dropping stale %s for door %s (sent %s, applied %s)",
+                msg.event,
+                state.id,
+                sent_at,
+                state.hot.push_sent_at,
+            )
+            return False
+        else:
+            state.hot.push_sent_at = sent_at
+        self._push_seq += 1
+        state.hot.push_seq = self._push_seq
+        # Keep the origin of the oldest update no entity has written yet.
+        if not state.hot.push_origin:
+            self._stamp_push_origin(state, sent_at)
+        return True
+
+    def _stamp_push_origin(self, state: DoorState, sent_at: int | None) -> None:
+        """Remember when a push update started, preferring the controller time."""
+        if sent_at is not None:
+            state.hot.push_origin = sent_at / 1000
+            self._push_latency_sources["controller"] += 1
+            return
+        record = _current_message.get()
+        state.hot.push_origin = record.received_at if record else time.time()
+        self._push_latency_sources["received"] += 1
+
+    def note_state_written(self, state: DoorState) -> None:
+        """Record the latency of a push update the door's lock or cover wrote."""
+        if not (origin := state.hot.push_origin):
+            return
+        state.hot.push_origin = 0.0
+        # Controller clocks can run slightly ahead of Home Assistant's.
+        self.push_latency.add(max(0.0, (time.time() - origin) * 1000))
+
+    def _discard_push_origins(self) -> None:
+        """Forget push updates no lock or cover entity has written.
+
+        Their entity may be disabled or gone; timing them against a later
+        write would report the time since the push instead of its latency.
+        """
+        for state in self.doors.values():
+            state.hot.push_origin = 0.0
+
+    def push_latency_as_dict(self) -> dict[str, Any]:
+        """Return push latency percentiles and timestamp sources."""
+        return {
+            **self.push_latency.as_dict(),
+            "sources": dict(self._push_latency_sources),
+        }
+
+    def _is_stale_snapshot(self, state: DoorState, started_seq: int) -> bool:
+        """Return whether a push landed on the door after a REST read started."""
+        if state.hot.push_seq <= started_seq:
+            return False
+        self.sequencing_stats.stale_snapshots += 1
+        _LOGGER.debug("Keeping pushed state of door %s over older snapshot", state.id)
+        return True
+
+    def _apply_ws_door_state(
+        self, state: DoorState, ws_state: LocationUpdateState | V2LocationState
+    ) -> None:
+        """Apply lock relay, door position and lock rule from a push update."""
+        self._apply_lock_dps(state, dps=ws_state.dps, lock=ws_state.lock)
+
+        state.lock_rule = ""
+        state.lock_rule_ended_time = 0
+        if ws_state.remain_lock is not None:
+            state.lock_rule = ws_state.remain_lock.type.value
+            state.lock_rule_ended_time = ws_state.remain_lock.until
+        elif ws_state.remain_unlock is not None:
+            state.lock_rule = ws_state.remain_unlock.type.value
+            state.lock_rule_ended_time = ws_state.remain_unlock.until
+
     @staticmethod
     def _apply_lock_dps(
         state: DoorState, *, dps: DoorPositionStatus, lock: str
     ) -> None:
         """Apply lock relay and door position updates to a door state."""
-        updates: dict[str, DoorPositionStatus | DoorLockRelayStatus] = {
-            "door_position_status": dps,
-        }
+        hot = state.hot
+        hot.door_position_status = dps
         if lock == "locked":
-            updates["door_lock_relay_status"] = DoorLockRelayStatus.LOCK
+            hot.door_lock_relay_status = DoorLockRelayStatus.LOCK
         elif lock == "unlocked":
-            updates["door_lock_relay_status"] = DoorLockRelayStatus.UNLOCK
-        state.door = state.door.with_updates(**updates)
+            hot.door_lock_relay_status = DoorLockRelayStatus.UNLOCK
 
     # ------------------------------------------------------------------
     # WebSocket handlers
@@ -477,16 +1851,10 @@ class UnifiAccessHub:
         # Update door with fields from the websocket
         ws_state = update.data.state
         if ws_state is not None:
-            self._apply_lock_dps(state, dps=ws_state.dps, lock=ws_state.lock)
-
-            state.lock_rule = ""
-            state.lock_rule_ended_time = 0
-            if ws_state.remain_lock is not None:
-                state.lock_rule = ws_state.remain_lock.type.value
-                state.lock_rule_ended_time = ws_state.remain_lock.until
-            elif ws_state.remain_unlock is not None:
-                state.lock_rule = ws_state.remain_unlock.type.value
-                state.lock_rule_ended_time = ws_state.remain_unlock.until
+            if self._accept_push(state, msg):
+                self._apply_ws_door_state(state, ws_state)
+            elif update.data.thumbnail is None:
+                return
 
         # Handle thumbnail
         if update.data.thumbnail is not None:
@@ -582,6 +1950,11 @@ class UnifiAccessHub:
                 )
                 self._notify_doors_updated()
 
+    def _access_event_bucket(self, msg: WebsocketMessage, published: object) -> int:
+        """Return the dedup time bucket an access event falls in."""
+        window_ms = max(int(self.access_event_cache.ttl * 1000), 1)
+        return _event_time_ms(msg, published) // window_ms
+
     async def _handle_logs_add(self, msg: WebsocketMessage) -> None:
         """Handle access log messages.
 
@@ -604,16 +1977,27 @@ class UnifiAccessHub:
         )
 
         # Fire access events from logs.add as fallback — but skip if
-        # insights.add already fired for this door recently.
+        # insights.add already fired for the same access.
         resolved_door_id = getattr(msg, "door_id", "")
         if not isinstance(resolved_door_id, str):
             resolved_door_id = ""
         if not resolved_door_id:
             resolved_door_id = self.client.resolve_door_id(door_target.id)
-        last_insight = self._last_insight_time.get(
-            resolved_door_id or door_target.id, 0.0
+        bucket = self._access_event_bucket(
+            msg, (source.event.model_extra or {}).get("published")
         )
-        if time.monotonic() - last_insight < 5.0:
+        if self.access_event_cache.seen(
+            *(
+                access_event_fingerprint(
+                    resolved_door_id or door_target.id,
+                    source.actor.display_name,
+                    neighbour,
+                )
+                # Both events rarely carry the same time; also match the
+                # adjacent buckets so a boundary between them does not matter.
+                for neighbour in (bucket - 1, bucket, bucket + 1)
+            )
+        ):
             return
 
         device_config = source.device_config
@@ -741,7 +2125,13 @@ class UnifiAccessHub:
             update.data.metadata.authentication.display_name,
             update.data.result,
         )
-        self._last_insight_time[canonical_door_id] = time.monotonic()
+        self.access_event_cache.add(
+            access_event_fingerprint(
+                canonical_door_id,
+                update.data.metadata.actor.display_name,
+                self._access_event_bucket(msg, update.data.published),
+            )
+        )
         state.trigger_event("access", event_attributes)
 
     async def _handle_v2_location_update(self, msg: WebsocketMessage) -> None:
@@ -755,17 +2145,10 @@ class UnifiAccessHub:
 
         ws_state = update.data.state
         if ws_state is not None:
-            self._apply_lock_dps(state, dps=ws_state.dps, lock=ws_state.lock)
-
-            # Lock rules
-            state.lock_rule = ""
-            state.lock_rule_ended_time = 0
-            if ws_state.remain_lock is not None:
-                state.lock_rule = ws_state.remain_lock.type.value
-                state.lock_rule_ended_time = ws_state.remain_lock.until
-            elif ws_state.remain_unlock is not None:
-                state.lock_rule = ws_state.remain_unlock.type.value
-                state.lock_rule_ended_time = ws_state.remain_unlock.until
+            if self._accept_push(state, msg):
+                self._apply_ws_door_state(state, ws_state)
+            elif update.data.thumbnail is None:
+                return
 
         # Handle thumbnail
         if update.data.thumbnail is not None:
@@ -805,18 +2188,9 @@ class UnifiAccessHub:
                 state.hub_type = device_type
                 state.hub_id = device_id
 
-            self._apply_lock_dps(state, dps=loc_state.dps, lock=loc_state.lock)
-
-            # Lock rules
-            state.lock_rule = ""
-            state.lock_rule_ended_time = 0
-            if loc_state.remain_lock is not None:
-                state.lock_rule = loc_state.remain_lock.type.value
-                state.lock_rule_ended_time = loc_state.remain_lock.until
-            elif loc_state.remain_unlock is not None:
-                state.lock_rule = loc_state.remain_unlock.type.value
-                state.lock_rule_ended_time = loc_state.remain_unlock.until
-
+            if not self._accept_push(state, msg):
+                continue
+            self._apply_ws_door_state(state, loc_state)
             updated = True
 
         _LOGGER.debug(
@@ -888,8 +2262,6 @@ class UnifiAccessHub:
         if state is None:
             return
 
-        state.door = state.door.with_updates(
-            door_lock_relay_status=DoorLockRelayStatus.UNLOCK
-        )
+        state.hot.door_lock_relay_status = DoorLockRelayStatus.UNLOCK
         _LOGGER.info("Remote unlock on %s (%s)", state.name, state.id)
         self._notify_doors_updated()
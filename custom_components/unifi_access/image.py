@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.image import ImageEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from . import UnifiAccessConfigEntry
-from .coordinator import UnifiAccessCoordinator
 from .entity import UnifiAccessDoorEntity
-from .hub import DoorState
+
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry
+    from .coordinator import UnifiAccessCoordinator
+    from .hub import DoorState
 
 PARALLEL_UPDATES = 0
 
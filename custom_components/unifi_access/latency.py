@@ -0,0 +1,62 @@
+"""Rolling latency percentiles."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class LatencyTracker:
+    """Keep the last ``window`` latency samples and summarize them.
+
+    Percentiles use the nearest-rank method over the current window, so they
+    follow recent behaviour while memory stays bounded.
+    """
+
+    def __init__(self, window: int) -> None:
+        """Initialize an empty tracker."""
+        self.window = window
+        self.count = 0
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def add(self, latency_ms: float) -> None:
+        """Record one latency sample in milliseconds."""
+        self._samples.append(latency_ms)
+        self.count += 1
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the ``pct`` percentile of the window, or None when empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def histogram(self, bounds: Sequence[float]) -> dict[str, int]:
+        """Return how many samples of the window fall into each bucket.
+
+        Buckets are ``le_<bound>`` for every upper bound in ``bounds``, in
+        ascending order, followed by ``gt_<last bound>``.
+        """
+        counts = [0] * (len(bounds) + 1)
+        for sample in self._samples:
+            counts[bisect_left(bounds, sample)] += 1
+        buckets = {
+            f"le_{bound:g}": count for bound, count in zip(bounds, counts, strict=False)
+        }
+        buckets[f"gt_{bounds[-1]:g}"] = counts[-1]
+        return buckets
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return sample counts and p50/p95/p99/max of the window in ms."""
+        summary: dict[str, Any] = {"count": self.count, "window": len(self._samples)}
+        for pct in (50, 95, 99):
+            value = self.percentile(pct)
+            summary[f"p{pct}"] = None if value is None else round(value, 1)
+        summary["max"] = round(max(self._samples), 1) if self._samples else None
+        return summary
@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.lock import LockEntity, LockEntityFeature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from . import UnifiAccessConfigEntry, UnifiAccessData
 from .const import DOOR_TYPE_LOCK
 from .entity import UnifiAccessDoorEntity, manage_door_entities
 
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry, UnifiAccessData
+
 PARALLEL_UPDATES = 1
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,7 +29,6 @@ async def async_setup_entry(
     data = config_entry.runtime_data
     manage_door_entities(
         config_entry,
-        data.coordinator,
         async_add_entities,
         lambda door: door.entity_type == DOOR_TYPE_LOCK,
         lambda door_id: [UnifiDoorLockEntity(data, door_id)],
@@ -39,6 +40,7 @@ class UnifiDoorLockEntity(UnifiAccessDoorEntity, LockEntity):
 
     _attr_supported_features = LockEntityFeature.OPEN
     _attr_name = None
+    _records_push_latency = True
 
     def __init__(self, data: UnifiAccessData, door_id: str) -> None:
         """Initialize Unifi Access Door Lock."""
@@ -52,11 +54,11 @@ class UnifiDoorLockEntity(UnifiAccessDoorEntity, LockEntity):
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the door."""
-        await self._data.hub.client.unlock_door(self.door.id)
+        await self._data.hub.async_unlock_door(self.door.id)
 
     async def async_open(self, **kwargs: Any) -> None:
         """Open the door."""
-        await self._data.hub.client.unlock_door(self.door.id)
+        await self._data.hub.async_unlock_door(self.door.id)
 
     @property
     def is_locked(self) -> bool | None:
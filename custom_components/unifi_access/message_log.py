@@ -0,0 +1,79 @@
+"""Bounded log of recent websocket messages for diagnostics."""
+
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from unifi_access_api import WebsocketMessage
+
+
+@dataclass(slots=True)
+class MessageRecord:
+    """A received websocket message and how it was processed.
+
+    ``outcome`` is ``received`` until a handler picks the message up, then
+    ``processed``, ``failed`` or ``shed``.
+    """
+
+    message: WebsocketMessage
+    received_at: float = field(default_factory=time.time)
+    received_mono: float = field(default_factory=time.monotonic)
+    outcome: str = "received"
+    queue_ms: float | None = None
+    handler_ms: float | None = None
+    _started: float = 0.0
+
+    def start(self) -> None:
+        """Mark the start of handling, recording the time spent queued."""
+        self._started = time.monotonic()
+        self.queue_ms = (self._started - self.received_mono) * 1000
+
+    def finish(self, outcome: str) -> None:
+        """Mark the end of handling with its outcome."""
+        self.handler_ms = (time.monotonic() - self._started) * 1000
+        self.outcome = outcome
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record with the message payload, unredacted."""
+        return {
+            "received_at": datetime.fromtimestamp(self.received_at, UTC).isoformat(),
+            "outcome": self.outcome,
+            "queue_ms": None if self.queue_ms is None else round(self.queue_ms, 2),
+            "handler_ms": (
+                None if self.handler_ms is None else round(self.handler_ms, 2)
+            ),
+            "message": self.message.model_dump(mode="json", by_alias=True),
+        }
+
+
+class RecentMessageLog:
+    """Keep the last ``size`` websocket messages of every event type.
+
+    Messages are stored as received and only serialized when diagnostics
+    are downloaded, so recording costs one deque append per message.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty log."""
+        self.size = size
+        self._records: defaultdict[str, deque[MessageRecord]] = defaultdict(
+            lambda: deque(maxlen=size)
+        )
+
+    def add(self, msg: WebsocketMessage) -> MessageRecord:
+        """Record a received message and return its record."""
+        record = MessageRecord(msg)
+        self._records[msg.event or ""].append(record)
+        return record
+
+    def as_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the records per event type, oldest first."""
+        return {
+            event: [record.as_dict() for record in records]
+            for event, records in sorted(self._records.items())
+        }
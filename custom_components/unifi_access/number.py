@@ -1,15 +1,21 @@
 """Platform for number (interval) integration."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from homeassistant.components.number import RestoreNumber
 from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from . import UnifiAccessConfigEntry
-from .const import DOMAIN, DOOR_TYPE_GARAGE, DOOR_TYPE_GATE
-from .entity import manage_door_entities
-from .hub import DoorState
+from .const import DOOR_TYPE_GARAGE, DOOR_TYPE_GATE
+from .entity import UnifiAccessDoorDeviceMixin, manage_door_entities
+
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry
+    from .hub import DoorState
+    from .store import DoorSettingsStore
 
 PARALLEL_UPDATES = 0
 
@@ -25,144 +31,85 @@ async def async_setup_entry(
     if data.hub.supports_door_lock_rules:
         async_add_entities(
             [
-                TemporaryLockRuleIntervalNumberEntity(door)
+                TemporaryLockRuleIntervalNumberEntity(data.settings, door)
                 for door in data.coordinator.data.values()
             ]
         )
 
     manage_door_entities(
         config_entry,
-        data.coordinator,
         async_add_entities,
         lambda door: door.entity_type in (DOOR_TYPE_GARAGE, DOOR_TYPE_GATE),
         lambda door_id: [
-            DoorOpenTimeNumberEntity(data.coordinator.data[door_id]),
-            DoorCloseTimeNumberEntity(data.coordinator.data[door_id]),
+            DoorOpenTimeNumberEntity(data.settings, data.coordinator.data[door_id]),
+            DoorCloseTimeNumberEntity(data.settings, data.coordinator.data[door_id]),
         ],
     )
 
 
-class TemporaryLockRuleIntervalNumberEntity(RestoreNumber):
-    """Unifi Access Temporary Lock Rule Interval."""
+class DoorSettingNumberEntity(UnifiAccessDoorDeviceMixin, RestoreNumber):
+    """Number entity backed by a per-door setting in the settings store."""
 
-    _attr_entity_category = EntityCategory.CONFIG
-    _attr_entity_registry_enabled_default = False
     _attr_has_entity_name = True
     _attr_native_step = 1
     _attr_should_poll = False
-    _attr_translation_key = "door_lock_rule_interval"
+    _setting: str
 
-    def __init__(self, door: DoorState) -> None:
-        """Initialize Unifi Access Door Lock Rule Interval."""
+    def __init__(self, settings: DoorSettingsStore, door: DoorState) -> None:
+        """Initialize the door setting number."""
         super().__init__()
         self.door = door
-        self._attr_unique_id = f"door_lock_rule_interval_{self.door.id}"
-        self._attr_native_value = 10
-        self._attr_native_min_value = 1
-        self._attr_native_max_value = 480
+        self._settings = settings
+        self._attr_unique_id = f"door_{self._setting}_{door.id}"
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Get Unifi Access Door Lock device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.door.id)},
-            name=self.door.name,
-            model=self.door.hub_type,
-            manufacturer="Unifi",
-        )
+    def native_value(self) -> float:
+        """Return the current setting value."""
+        return getattr(self.door, self._setting)
 
     async def async_added_to_hass(self) -> None:
-        """Add Unifi Access Door Lock Rule Interval to Home Assistant."""
+        """Adopt the last restored value if the setting was never stored."""
         await super().async_added_to_hass()
-        await self.async_get_last_number_data()
-        if self.native_value:
-            self.door.lock_rule_interval = int(self.native_value)
+        if self._settings.has_setting(self.door.id, self._setting):
+            return
+        last = await self.async_get_last_number_data()
+        if last and last.native_value is not None:
+            setattr(self.door, self._setting, int(last.native_value))
+            self._settings.async_schedule_save()
 
     async def async_set_native_value(self, value: float) -> None:
-        """Select Door Lock Rule Interval (in minutes)."""
-        self._attr_native_value = value
-        self.door.lock_rule_interval = int(value)
+        """Update the setting and schedule it to be saved."""
+        setattr(self.door, self._setting, int(value))
+        self._settings.async_schedule_save()
+        self.async_write_ha_state()
+
+
+class TemporaryLockRuleIntervalNumberEntity(DoorSettingNumberEntity):
+    """Unifi Access Temporary Lock Rule Interval (in minutes)."""
+
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_entity_registry_enabled_default = False
+    _attr_native_min_value = 1
+    _attr_native_max_value = 480
+    _attr_translation_key = "door_lock_rule_interval"
+    _setting = "lock_rule_interval"
 
 
-class DoorOpenTimeNumberEntity(RestoreNumber):
+class DoorOpenTimeNumberEntity(DoorSettingNumberEntity):
     """Number entity for configuring auto-close delay after open for garage/gate covers."""
 
-    _attr_has_entity_name = True
-    _attr_native_step = 1
     _attr_native_min_value = 0
     _attr_native_max_value = 120
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
-    _attr_should_poll = False
     _attr_translation_key = "door_open_time"
+    _setting = "open_time"
 
-    def __init__(self, door: DoorState) -> None:
-        """Initialize Door Open Time."""
-        super().__init__()
-        self.door = door
-        self._attr_unique_id = f"door_open_time_{door.id}"
-        self._attr_native_value = door.open_time
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.door.id)},
-            name=self.door.name,
-            model=self.door.hub_type,
-            manufacturer="Unifi",
-        )
 
-    async def async_added_to_hass(self) -> None:
-        """Restore last value."""
-        await super().async_added_to_hass()
-        last = await self.async_get_last_number_data()
-        if last and last.native_value is not None:
-            self._attr_native_value = last.native_value
-            self.door.open_time = int(last.native_value)
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set door open time."""
-        self._attr_native_value = value
-        self.door.open_time = int(value)
-
-
-class DoorCloseTimeNumberEntity(RestoreNumber):
+class DoorCloseTimeNumberEntity(DoorSettingNumberEntity):
     """Number entity for configuring auto-close delay after close for garage/gate covers."""
 
-    _attr_has_entity_name = True
-    _attr_native_step = 1
     _attr_native_min_value = 0
     _attr_native_max_value = 120
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
-    _attr_should_poll = False
     _attr_translation_key = "door_close_time"
-
-    def __init__(self, door: DoorState) -> None:
-        """Initialize Door Close Time."""
-        super().__init__()
-        self.door = door
-        self._attr_unique_id = f"door_close_time_{door.id}"
-        self._attr_native_value = door.close_time
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.door.id)},
-            name=self.door.name,
-            model=self.door.hub_type,
-            manufacturer="Unifi",
-        )
-
-    async def async_added_to_hass(self) -> None:
-        """Restore last value."""
-        await super().async_added_to_hass()
-        last = await self.async_get_last_number_data()
-        if last and last.native_value is not None:
-            self._attr_native_value = last.native_value
-            self.door.close_time = int(last.native_value)
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set door close time."""
-        self._attr_native_value = value
-        self.door.close_time = int(value)
+    _setting = "close_time"
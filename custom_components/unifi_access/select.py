@@ -1,14 +1,19 @@
 """Platform for select integration."""
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from . import UnifiAccessConfigEntry, UnifiAccessData
 from .const import DOOR_TYPES
-from .entity import UnifiAccessDoorEntity
+from .entity import UnifiAccessDoorEntity, manage_door_entities
+
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry, UnifiAccessData
 
 PARALLEL_UPDATES = 1
 
@@ -33,27 +38,19 @@ async def async_setup_entry(
 
     async_add_entities(entities)
 
-    # Track known UGT doors and add EntityTypeSelect once hub mapping is known.
-    known_ugt_doors: set[str] = set()
-
-    def _check_for_new_ugt_doors() -> None:
-        new_entities = []
-        for door_id, door in data.coordinator.data.items():
-            if door.hub_type == "UGT" and door_id not in known_ugt_doors:
-                known_ugt_doors.add(door_id)
-                _LOGGER.debug(
-                    "Discovered UGT door %s (%s), adding EntityTypeSelect",
-                    door.name,
-                    door_id,
-                )
-                new_entities.append(EntityTypeSelect(data, door_id))
-        if new_entities:
-            async_add_entities(new_entities)
-
-    _check_for_new_ugt_doors()
-
-    config_entry.async_on_unload(
-        data.coordinator.async_add_listener(_check_for_new_ugt_doors)
+    # Add EntityTypeSelect once the hub mapping shows a door is on a UGT.
+    def _build_entity_type_select(door_id: str) -> list[SelectEntity]:
+        door = data.coordinator.data[door_id]
+        _LOGGER.debug(
+            "Discovered UGT door %s (%s), adding EntityTypeSelect", door.name, door_id
+        )
+        return [EntityTypeSelect(data, door_id)]
+
+    manage_door_entities(
+        config_entry,
+        async_add_entities,
+        lambda door: door.hub_type == "UGT",
+        _build_entity_type_select,
     )
 
 
@@ -71,7 +68,7 @@ class TemporaryLockRuleSelectEntity(UnifiAccessDoorEntity, SelectEntity):
 
     def _update_options(self) -> None:
         """Update Door Lock Rules without duplications."""
-        lock_rule = self.coordinator.data[self.door.id].lock_rule
+        lock_rule = self.door.lock_rule
         self._attr_current_option = "" if lock_rule == "reset" else lock_rule
 
         base_options = [
@@ -121,13 +118,9 @@ class EntityTypeSelect(UnifiAccessDoorEntity, SelectEntity):
         if option == old_type:
             return
 
-        # Persist to storage
         self.door.entity_type = option
         self._attr_current_option = option
-        stored: dict[str, str] = {}
-        for door_id, door_state in self._data.coordinator.data.items():
-            stored[door_id] = door_state.entity_type
-        await self._data.store.async_save(stored)
+        self._data.settings.async_schedule_save()
 
         _LOGGER.debug(
             "Door %s entity type changed from %s to %s",
@@ -1,20 +1,136 @@
 """Platform for sensor integration."""
 
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.const import EntityCategory
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import UnifiAccessConfigEntry
+from .const import DOMAIN
 from .coordinator import UnifiAccessCoordinator
-from .entity import UnifiAccessDoorEntity
+from .entity import UnifiAccessDoorEntity, manage_door_entities
 from .hub import DoorState
 
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry, UnifiAccessData
+    from .command_latency import DoorCommandLatency
+
 PARALLEL_UPDATES = 0
 
 
+@dataclass(frozen=True, kw_only=True)
+class UnifiAccessControllerSensorEntityDescription(SensorEntityDescription):
+    """Describes a controller-level Unifi Access sensor."""
+
+    value_fn: Callable[[UnifiAccessData], StateType]
+    exists_fn: Callable[[UnifiAccessData], bool] = lambda data: True
+
+
+CONTROLLER_SENSORS: tuple[UnifiAccessControllerSensorEntityDescription, ...] = (
+    UnifiAccessControllerSensorEntityDescription(
+        key="poll_interval",
+        translation_key="poll_interval",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: (
+            int(data.coordinator.update_interval.total_seconds())
+            if data.coordinator.update_interval
+            else None
+        ),
+        exists_fn=lambda data: data.hub.use_polling,
+    ),
+    UnifiAccessControllerSensorEntityDescription(
+        key="reconcile_discrepancies",
+        translation_key="reconcile_discrepancies",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data.hub.reconcile_stats.discrepancies,
+        exists_fn=lambda data: not data.hub.use_polling,
+    ),
+    UnifiAccessControllerSensorEntityDescription(
+        key="websocket_disconnects",
+        translation_key="websocket_disconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data.hub.connection_stats.disconnects,
+        exists_fn=lambda data: not data.hub.use_polling,
+    ),
+    UnifiAccessControllerSensorEntityDescription(
+        key="websocket_downtime",
+        translation_key="websocket_downtime",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: round(data.hub.connection_stats.downtime, 1),
+        exists_fn=lambda data: not data.hub.use_polling,
+    ),
+    *(
+        UnifiAccessControllerSensorEntityDescription(
+            key=f"push_latency_p{pct}",
+            translation_key=f"push_latency_p{pct}",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            suggested_display_precision=0,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=lambda data, pct=pct: data.hub.push_latency.percentile(pct),
+            exists_fn=lambda data: not data.hub.use_polling,
+        )
+        for pct in (50, 95, 99)
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UnifiAccessCommandLatencySensorEntityDescription(SensorEntityDescription):
+    """Describes a per-door Unifi Access command latency sensor."""
+
+    value_fn: Callable[[DoorCommandLatency], float | None]
+
+
+COMMAND_LATENCY_SENSORS: tuple[
+    UnifiAccessCommandLatencySensorEntityDescription, ...
+] = (
+    UnifiAccessCommandLatencySensorEntityDescription(
+        key="command_rtt",
+        translation_key="command_rtt",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda latency: latency.rtt.percentile(50),
+    ),
+    UnifiAccessCommandLatencySensorEntityDescription(
+        key="command_confirmation",
+        translation_key="command_confirmation",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda latency: latency.confirmation.percentile(50),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: UnifiAccessConfigEntry,
@@ -23,6 +139,22 @@ async def async_setup_entry(
     """Add sensor entity for passed config entry."""
     data = config_entry.runtime_data
 
+    async_add_entities(
+        UnifiAccessControllerSensorEntity(data, config_entry.entry_id, description)
+        for description in CONTROLLER_SENSORS
+        if description.exists_fn(data)
+    )
+
+    manage_door_entities(
+        config_entry,
+        async_add_entities,
+        lambda door: True,
+        lambda door_id: [
+            CommandLatencySensorEntity(data.coordinator, door_id, description)
+            for description in COMMAND_LATENCY_SENSORS
+        ],
+    )
+
     if data.hub.supports_door_lock_rules:
         async_add_entities(
             [
@@ -36,6 +168,61 @@ async def async_setup_entry(
         )
 
 
+class UnifiAccessControllerSensorEntity(
+    CoordinatorEntity[UnifiAccessCoordinator[dict[str, DoorState]]], SensorEntity
+):
+    """Unifi Access controller-level diagnostic sensor."""
+
+    _attr_has_entity_name = True
+    entity_description: UnifiAccessControllerSensorEntityDescription
+
+    def __init__(
+        self,
+        data: UnifiAccessData,
+        entry_id: str,
+        description: UnifiAccessControllerSensorEntityDescription,
+    ) -> None:
+        """Initialize Unifi Access controller sensor."""
+        super().__init__(data.coordinator)
+        self.entity_description = description
+        self._data = data
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "unifi_access_all_doors")},
+            name="All Doors",
+            model="UAH",
+            manufacturer="Unifi",
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Get native value."""
+        return self.entity_description.value_fn(self._data)
+
+
+class CommandLatencySensorEntity(UnifiAccessDoorEntity, SensorEntity):
+    """Median command latency of a door over its recent commands."""
+
+    entity_description: UnifiAccessCommandLatencySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: UnifiAccessCoordinator[dict[str, DoorState]],
+        door_id: str,
+        description: UnifiAccessCommandLatencySensorEntityDescription,
+    ) -> None:
+        """Initialize Unifi Access command latency sensor."""
+        super().__init__(coordinator, coordinator.data[door_id])
+        self.entity_description = description
+        self._attr_unique_id = f"{description.key}_{self.door.id}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Get native value."""
+        latency = self.coordinator.hub.command_latency.get(self.door.id)
+        return None if latency is None else self.entity_description.value_fn(latency)
+
+
 class TemporaryLockRuleSensorEntity(UnifiAccessDoorEntity, SensorEntity):
     """Unifi Access Temporary Lock Rule Sensor."""
 
@@ -0,0 +1,155 @@
+"""Persistent per-door user settings for the Unifi Access integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, SETTINGS_SAVE_DELAY, STORAGE_KEY, STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from .hub import DoorState
+
+_LOGGER = logging.getLogger(__name__)
+
+# Serializes controllers rewriting the shared settings file they migrate from
+_LEGACY_LOCK: HassKey[asyncio.Lock] = HassKey(f"{DOMAIN}_legacy_settings_lock")
+
+# DoorState attributes that are user settings rather than controller state
+DOOR_SETTINGS = (
+    "entity_type",
+    "open_time",
+    "close_time",
+    "lock_rule_interval",
+    "obstruction_detected",
+)
+
+
+class _DoorSettingsStorage(Store[dict[str, Any]]):
+    """Store that migrates the entity type only format."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate {"door_id": "type"} and {"entity_types": {...}} data."""
+        if old_major_version == 1:
+            entity_types = old_data.get("entity_types", old_data)
+            old_data = {
+                "doors": {
+                    door_id: {"entity_type": entity_type}
+                    for door_id, entity_type in entity_types.items()
+                }
+            }
+        return old_data
+
+
+class DoorSettingsStore:
+    """User settings of every door of one controller, saved with a delay.
+
+    Each config entry has its own file, so controllers never overwrite each
+    other's settings. Settings are read from the live door states when the
+    write happens, so any number of changes within the save delay result in
+    a single write.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, doors: dict[str, DoorState]
+    ) -> None:
+        """Initialize the store for the hub's doors."""
+        self._hass = hass
+        self._store = _DoorSettingsStorage(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}"
+        )
+        self._legacy: _DoorSettingsStorage | None = None
+        self._doors = doors
+        self._stored: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load stored settings; apply them with ``async_apply``."""
+        data = await self._store.async_load()
+        if data is None:
+            # Settings of all controllers used to share one file.
+            legacy = _DoorSettingsStorage(self._hass, STORAGE_VERSION, STORAGE_KEY)
+            if (data := await legacy.async_load()) is not None:
+                self._legacy = legacy
+        self._stored = (data or {}).get("doors", {})
+
+    @callback
+    def async_apply(self) -> None:
+        """Apply the loaded settings to the known doors."""
+        if self._legacy is not None:
+            # Only this controller's doors move out of the shared file.
+            self._stored = {
+                door_id: settings
+                for door_id, settings in self._stored.items()
+                if door_id in self._doors
+            }
+            self._hass.async_create_task(self._async_migrate(self._legacy))
+            self._legacy = None
+        for door_id, settings in self._stored.items():
+            if (door := self._doors.get(door_id)) is None:
+                continue
+            for key in DOOR_SETTINGS & settings.keys():
+                setattr(door, key, settings[key])
+        _LOGGER.debug("Restored settings for %s doors", len(self._stored))
+
+    def has_setting(self, door_id: str, key: str) -> bool:
+        """Return True when a setting of a door has been stored."""
+        return key in self._stored.get(door_id, {})
+
+    async def _async_migrate(self, legacy: _DoorSettingsStorage) -> None:
+        """Move this controller's settings from the shared file to its own.
+
+        The shared file keeps the doors of controllers that have not migrated
+        yet and is removed once none are left.
+        """
+        await self._store.async_save(self._data_to_save())
+        async with self._hass.data.setdefault(_LEGACY_LOCK, asyncio.Lock()):
+            # Re-read, as another controller may have rewritten it meanwhile.
+            data = await legacy.async_load() or {}
+            remaining = {
+                door_id: settings
+                for door_id, settings in data.get("doors", {}).items()
+                if door_id not in self._doors
+            }
+            if remaining:
+                await legacy.async_save({"doors": remaining})
+            else:
+                await legacy.async_remove()
+        _LOGGER.debug("Migrated settings of %s doors", len(self._stored))
+
+    async def async_remove(self) -> None:
+        """Delete the settings file of a removed config entry."""
+        await self._store.async_remove()
+
+    @callback
+    def async_remove_doors(self, door_ids: list[str]) -> None:
+        """Forget the settings of removed doors."""
+        for door_id in door_ids:
+            self._stored.pop(door_id, None)
+        self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a write of the current door settings."""
+        self._store.async_delay_save(self._data_to_save, SETTINGS_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the settings of all doors, keeping those of unknown doors."""
+        self._stored = {
+            **self._stored,
+            **{
+                door_id: {key: getattr(door, key) for key in DOOR_SETTINGS}
+                for door_id, door in self._doors.items()
+            },
+        }
+        return {"doors": self._stored}
@@ -1,6 +1,8 @@
 """Platform for switch integration."""
 
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
@@ -9,11 +11,13 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from unifi_access_api import EmergencyStatus
 
-from . import UnifiAccessConfigEntry, UnifiAccessData
 from .const import DOMAIN
-from .coordinator import UnifiAccessCoordinator
 from .entity import UnifiAccessDoorEntity, manage_door_entities
-from .hub import UnifiAccessHub
+
+if TYPE_CHECKING:
+    from . import UnifiAccessConfigEntry, UnifiAccessData
+    from .coordinator import UnifiAccessCoordinator
+    from .hub import UnifiAccessHub
 
 PARALLEL_UPDATES = 1
 
@@ -45,7 +49,6 @@ async def async_setup_entry(
     )
     manage_door_entities(
         config_entry,
-        data.coordinator,
         async_add_entities,
         lambda door: door.has_face_unlock,
         lambda door_id: [FaceUnlockSwitch(data, door_id)],
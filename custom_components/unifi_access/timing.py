@@ -0,0 +1,111 @@
+"""Timing breakdown of config entry setup."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .connection import ConnectionPoolStats
+    from .hub import SingleFlightStats
+
+
+@dataclass
+class SetupPhase:
+    """Duration and controller traffic of one setup phase.
+
+    Traffic is ``None`` for phases that ran alongside others, as it cannot
+    be attributed to one of them.
+    """
+
+    duration_ms: float = 0.0
+    requests: int | None = None
+    api_calls: dict[str, int] | None = None
+
+
+class SetupTimer:
+    """Record how long each phase of setup takes and what it asks for.
+
+    Every phase records its wall time, the HTTP requests sent through the
+    controller connection pool and the controller reads per API call, so a
+    slow startup can be traced to the phase and call responsible.
+    """
+
+    def __init__(
+        self,
+        pool_stats: ConnectionPoolStats,
+        read_stats: Mapping[str, SingleFlightStats],
+    ) -> None:
+        """Initialize the timer; the total runs from now."""
+        self.phases: dict[str, SetupPhase] = {}
+        self.total_ms = 0.0
+        self._pool_stats = pool_stats
+        self._read_stats = read_stats
+        self._started = time.monotonic()
+
+    def _api_calls(self) -> dict[str, int]:
+        """Return the reads sent to the controller so far per API call."""
+        return {
+            name: stats.calls - stats.coalesced
+            for name, stats in self._read_stats.items()
+        }
+
+    @contextmanager
+    def phase(self, name: str, *, traffic: bool = True) -> Iterator[None]:
+        """Time the enclosed block as the setup phase ``name``.
+
+        Pass ``traffic=False`` for a block that runs concurrently with other
+        phases to only record its duration.
+        """
+        requests = self._pool_stats.requests
+        api_calls = self._api_calls()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            end = time.monotonic()
+            phase = self.phases[name] = SetupPhase(duration_ms=(end - start) * 1000)
+            if traffic:
+                phase.requests = self._pool_stats.requests - requests
+                phase.api_calls = {
+                    call: count - api_calls.get(call, 0)
+                    for call, count in sorted(self._api_calls().items())
+                    if count != api_calls.get(call, 0)
+                }
+            self.total_ms = (end - self._started) * 1000
+
+    async def async_time[T](self, name: str, awaitable: Awaitable[T]) -> T:
+        """Await a step that runs concurrently with others, timing it."""
+        with self.phase(name, traffic=False):
+            return await awaitable
+
+    def summary(self) -> str:
+        """Return the breakdown as a single ``key=value`` log line."""
+        parts = [f"total={self.total_ms:.1f}ms"]
+        for name, phase in self.phases.items():
+            if phase.requests is None or phase.api_calls is None:
+                parts.append(f"{name}={phase.duration_ms:.1f}ms")
+                continue
+            calls = ",".join(f"{call}:{n}" for call, n in phase.api_calls.items())
+            parts.append(
+                f"{name}={phase.duration_ms:.1f}ms/{phase.requests}req"
+                + (f"[{calls}]" if calls else "")
+            )
+        return " ".join(parts)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breakdown for diagnostics."""
+        return {
+            "total_ms": round(self.total_ms, 1),
+            "phases": {
+                name: {
+                    "duration_ms": round(phase.duration_ms, 1),
+                    "requests": phase.requests,
+                    "api_calls": phase.api_calls,
+                }
+                for name, phase in self.phases.items()
+            },
+        }
@@ -273,3 +273,36 @@ async def test_reconfigure_flow_cannot_connect(
 
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "cannot_connect"}
+
+
+async def test_options_flow(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test updating the connection pool options."""
+    mock_config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            "max_connections_per_host": 4,
+            "keepalive_timeout": 30,
+            "dns_cache_ttl": 0,
+        },
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    # Omitted options are stored with their defaults
+    assert mock_config_entry.options == {
+        "max_connections_per_host": 4,
+        "keepalive_timeout": 30,
+        "dns_cache_ttl": 0,
+        "max_poll_interval": 60,
+        "reconcile_interval": 300,
+        "dedup_window": 5,
+        "dedup_capacity": 1024,
+        "confirm_timeout": 10,
+    }
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
+from unifi_access_api import RemoteView, RemoteViewData
 
 from custom_components.unifi_access.const import DOMAIN
 from custom_components.unifi_access.diagnostics import (
@@ -54,10 +55,6 @@ async def test_diagnostics(hass: HomeAssistant) -> None:
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -78,3 +75,105 @@ async def test_diagnostics(hass: HomeAssistant) -> None:
     assert "door-001" in result["doors"]
     assert "door-002" in result["doors"]
     assert result["doors"]["door-001"]["name"] == "Front Door"
+
+    # Adaptive polling is disabled with websockets
+    assert result["polling"]["doors"]["update_interval"] is None
+
+    # Websocket outages
+    assert result["websocket"]["disconnects"] == 0
+    assert result["websocket"]["downtime"] == 0
+
+    # Websocket dispatcher lanes: one priority lane plus the door lanes
+    assert result["dispatcher"]["priority_depth"] == 0
+    assert result["dispatcher"]["door_lane_depths"] == [0, 0, 0, 0]
+    assert result["dispatcher"]["shed_total"] == 0
+
+    # Nothing was dropped as stale
+    assert result["sequencing"]["dropped"] == 0
+
+    # No door commands were sent
+    assert result["command_latency"] == {}
+
+    # Reconciliation has not run yet
+    assert result["reconcile"]["runs"] == 0
+    assert result["reconcile"]["discrepancies"] == 0
+
+    # Connection pool
+    pool = result["connection_pool"]
+    assert pool["limit_per_host"] == 8
+    assert pool["keepalive_timeout"] == 60
+    assert pool["dns_cache_ttl"] == 300
+    assert pool["connections_created"] == 0
+    assert pool["open_connections"] == 0
+    assert pool["active_connections"] == 0
+
+    # Single-flight read counters
+    assert result["read_coalescing"]["get_doors"]["calls"] >= 1
+    assert result["read_coalescing"]["get_doors"]["coalesced"] == 0
+
+    # No access events were de-duplicated
+    assert result["access_event_dedup"]["ttl"] == 5
+    assert result["access_event_dedup"]["hits"] == 0
+
+    # Setup timing breakdown
+    timing = result["setup_timing"]
+    assert set(timing["phases"]) == {
+        "authenticate",
+        "first_refresh",
+        "settings_load",
+        "emergency_refresh",
+        "initial_load",
+        "forward_entry_setups",
+    }
+    initial_load = timing["phases"]["initial_load"]
+    assert timing["total_ms"] >= initial_load["duration_ms"]
+    assert initial_load["api_calls"]["get_doors"] == 1
+    assert initial_load["api_calls"]["get_emergency_status"] == 1
+    # Concurrent steps only report their duration
+    assert timing["phases"]["emergency_refresh"]["api_calls"] is None
+
+
+async def test_diagnostics_recent_messages_are_redacted(hass: HomeAssistant) -> None:
+    """Recent websocket messages are listed per type with secrets redacted."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        unique_id="192.168.1.1",
+        title="Unifi Access Doors",
+    )
+    entry.add_to_hass(hass)
+    mock_client = _make_mock_client()
+
+    with patch(
+        "custom_components.unifi_access.UnifiAccessApiClient",
+        return_value=mock_client,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    handlers = mock_client.start_websocket.call_args[0][0]
+    await handlers["access.remote_view"](
+        RemoteView(
+            event="access.remote_view",
+            data=RemoteViewData(
+                door_name="Front Door",
+                request_id="req-1",
+                token="secret-token",  # noqa: S106
+            ),
+        )
+    )
+    hub = entry.runtime_data.hub
+    for lane in hub._lanes:
+        await lane.join()
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    records = result["recent_messages"]["access.remote_view"]
+    assert len(records) == 1
+    record = records[0]
+    assert record["outcome"] == "processed"
+    assert record["received_at"]
+    assert record["queue_ms"] >= 0
+    assert record["handler_ms"] >= 0
+    assert record["message"]["data"]["token"] == "**REDACTED**"
+    assert record["message"]["data"]["request_id"] == "req-1"
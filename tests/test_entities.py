@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,11 +11,16 @@ from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN, LockState
 from homeassistant.components.select import DOMAIN as SELECT_DOMAIN
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.util import dt as dt_util
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from unifi_access_api import V2LocationUpdate
 
-from custom_components.unifi_access.const import DOMAIN
+from custom_components.unifi_access.const import DOMAIN, DOOR_REMOVE_AFTER_MISSES
 
 from .conftest import (
     MOCK_CONFIG,
@@ -62,10 +68,6 @@ async def setup_integration(hass: HomeAssistant):
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -112,6 +114,66 @@ class TestLockPlatform:
         )
         mock_client.unlock_door.assert_called_once()
 
+    async def test_unlock_door_is_optimistic(
+        self, hass: HomeAssistant, setup_integration
+    ) -> None:
+        """The lock shows unlocked before the controller confirms it."""
+        entry, mock_client = setup_integration
+        entity_id = er.async_get(hass).async_get_entity_id("lock", DOMAIN, "door-001")
+        await hass.services.async_call(
+            LOCK_DOMAIN,
+            "unlock",
+            {"entity_id": entity_id},
+            blocking=True,
+        )
+        assert hass.states.get(entity_id).state == LockState.UNLOCKED
+
+        handlers = mock_client.start_websocket.call_args[0][0]
+        await handlers["access.data.v2.location.update"](
+            V2LocationUpdate.model_validate(
+                {
+                    "event": "access.data.v2.location.update",
+                    "data": {"id": "door-001", "state": {"lock": "unlocked"}},
+                }
+            )
+        )
+        hub = entry.runtime_data.hub
+        for lane in hub._lanes:
+            await lane.join()
+        await hass.async_block_till_done()
+
+        assert hub.doors["door-001"].optimistic_lock is None
+        assert hass.states.get(entity_id).state == LockState.UNLOCKED
+        assert hub.command_latency["door-001"].confirmed == 1
+
+    async def test_unconfirmed_unlock_rolls_back(
+        self,
+        hass: HomeAssistant,
+        setup_integration,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Without a confirmation the lock shows locked again after the timeout."""
+        entry, _ = setup_integration
+        entity_id = er.async_get(hass).async_get_entity_id("lock", DOMAIN, "door-001")
+        await hass.services.async_call(
+            LOCK_DOMAIN,
+            "unlock",
+            {"entity_id": entity_id},
+            blocking=True,
+        )
+        assert hass.states.get(entity_id).state == LockState.UNLOCKED
+
+        hub = entry.runtime_data.hub
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=hub.confirm_timeout + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get(entity_id).state == LockState.LOCKED
+        assert hub.doors["door-001"].optimistic_lock is None
+        assert hub.command_latency["door-001"].unconfirmed == 1
+        assert "was not confirmed" in caplog.text
+
     async def test_open_door(self, hass: HomeAssistant, setup_integration) -> None:
         """Test calling the open service."""
         _, mock_client = setup_integration
@@ -124,6 +186,33 @@ class TestLockPlatform:
         )
         mock_client.unlock_door.assert_called()
 
+    async def test_push_latency_recorded_on_lock_write(
+        self, hass: HomeAssistant, setup_integration
+    ) -> None:
+        """A pushed lock change is timed until the lock entity writes it."""
+        entry, mock_client = setup_integration
+        handlers = mock_client.start_websocket.call_args[0][0]
+        await handlers["access.data.v2.location.update"](
+            V2LocationUpdate.model_validate(
+                {
+                    "event": "access.data.v2.location.update",
+                    "data": {"id": "door-001", "state": {"lock": "unlocked"}},
+                }
+            )
+        )
+        hub = entry.runtime_data.hub
+        for lane in hub._lanes:
+            await lane.join()
+        await hass.async_block_till_done()
+
+        assert hub.push_latency.count == 1
+        assert hub.doors["door-001"].hot.push_origin == 0.0
+        registry = er.async_get(hass)
+        entity_id = registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_push_latency_p95"
+        )
+        assert entity_id is not None
+
     async def test_lock_unsupported_is_logged(
         self,
         hass: HomeAssistant,
@@ -293,8 +382,9 @@ class TestSensorPlatform:
             for e in registry.entities.values()
             if e.domain == "sensor" and e.platform == "unifi_access"
         ]
-        # 2 doors x 2 sensors (rule + end time) = 4
-        assert len(sensor_entries) == 4
+        # 2 doors x 4 sensors (rule, end time, command RTT and confirmation)
+        # + 6 controller sensors = 14
+        assert len(sensor_entries) == 14
 
     async def test_lock_rule_sensor_value(
         self, hass: HomeAssistant, setup_integration
@@ -444,6 +534,83 @@ class TestSelectPlatform:
         door_state = entry.runtime_data.coordinator.data["door-001"]
         assert door_state.entity_type == "garage"
 
+    async def test_entity_manager_only_syncs_changed_doors(
+        self, hass: HomeAssistant, setup_integration
+    ) -> None:
+        """Door updates that keep entity membership skip the platforms."""
+        entry, _ = setup_integration
+        data = entry.runtime_data
+        manager = data.entity_manager
+
+        with patch.object(
+            manager, "_sync_consumer", wraps=manager._sync_consumer
+        ) as sync_consumer:
+            data.hub.doors["door-001"].lock_rule = "keep_lock"
+            data.coordinator.async_set_updated_data(data.hub.doors)
+            sync_consumer.assert_not_called()
+
+            data.hub.doors["door-002"].entity_type = "gate"
+            data.coordinator.async_set_updated_data(data.hub.doors)
+            await hass.async_block_till_done()
+
+        assert sync_consumer.call_count == len(manager._consumers)
+        assert all(
+            call.args[1] == ["door-002"] for call in sync_consumer.call_args_list
+        )
+        registry = er.async_get(hass)
+        assert registry.async_get_entity_id("lock", DOMAIN, "door-002") is None
+        assert registry.async_get_entity_id("cover", DOMAIN, "door-002_cover")
+
+    async def test_door_rename_updates_device(
+        self, hass: HomeAssistant, setup_integration
+    ) -> None:
+        """Entities share cached device info, refreshed when a door is renamed."""
+        entry, _ = setup_integration
+        data = entry.runtime_data
+        door = data.hub.doors["door-001"]
+        device_info = door.device_info
+        assert device_info is not None
+        assert device_info["name"] == "Front Door"
+
+        door.door = door.door.with_updates(name="Main Entrance")
+        data.coordinator.async_set_updated_data(data.hub.doors)
+        await hass.async_block_till_done()
+
+        assert door.device_info is not device_info
+        assert door.device_info["name"] == "Main Entrance"
+        device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "door-001")})
+        assert device is not None
+        assert device.name == "Main Entrance"
+
+    async def test_removed_door_entities_and_device_removed(
+        self, hass: HomeAssistant, setup_integration
+    ) -> None:
+        """A door deleted on the controller loses its device and entities."""
+        entry, client = setup_integration
+        device_registry = dr.async_get(hass)
+        registry = er.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, "door-002")})
+        assert device is not None
+        assert er.async_entries_for_device(registry, device.id)
+        assert registry.async_get_entity_id("sensor", DOMAIN, "command_rtt_door-002")
+
+        client.get_doors.return_value = SAMPLE_DOORS[:1]
+        for _ in range(DOOR_REMOVE_AFTER_MISSES):
+            await entry.runtime_data.coordinator.async_refresh()
+            await hass.async_block_till_done()
+
+        assert (
+            device_registry.async_get_device(identifiers={(DOMAIN, "door-002")}) is None
+        )
+        assert not er.async_entries_for_device(registry, device.id)
+        assert registry.async_get_entity_id("lock", DOMAIN, "door-002") is None
+        assert (
+            registry.async_get_entity_id("sensor", DOMAIN, "command_rtt_door-002")
+            is None
+        )
+        assert registry.async_get_entity_id("lock", DOMAIN, "door-001") is not None
+        assert entry.runtime_data.hub.gc_stats.doors_removed == 1
+
     async def test_cover_device_class_updates_without_reload(
         self, hass: HomeAssistant, setup_integration
     ) -> None:
@@ -516,10 +683,6 @@ async def setup_integration_polling(hass: HomeAssistant):
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -554,6 +717,26 @@ class TestPollingMode:
         image_entities = [s for s in hass.states.async_all() if s.domain == "image"]
         assert len(image_entities) == 0
 
+    async def test_poll_interval_sensor(
+        self, hass: HomeAssistant, setup_integration_polling
+    ) -> None:
+        """The current poll interval is exposed as a diagnostic sensor."""
+        entry, _ = setup_integration_polling
+        registry = er.async_get(hass)
+        entity_id = registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_poll_interval"
+        )
+        assert entity_id is not None
+        assert hass.states.get(entity_id).state == "3"
+
+        # A command speeds polling up without waiting for the next poll.
+        coordinator = entry.runtime_data.coordinator
+        coordinator.update_interval = timedelta(seconds=12)
+        coordinator.async_update_listeners()
+        assert hass.states.get(entity_id).state == "12"
+        coordinator.async_note_activity()
+        assert hass.states.get(entity_id).state == "3"
+
 
 # ---------------------------------------------------------------------------
 # Cover entity: open/close/stop send correct control_cmd
@@ -603,9 +786,7 @@ class TestCoverControlCommands:
         await hass.services.async_call(
             COVER_DOMAIN, "close_cover", {"entity_id": cover_entity_id}, blocking=True
         )
-        mock_client.unlock_door.assert_called_once_with(
-            "door-001", control_cmd="close"
-        )
+        mock_client.unlock_door.assert_called_once_with("door-001", control_cmd="close")
 
     async def test_stop_cover_sends_stop_cmd(
         self, hass: HomeAssistant, setup_integration
@@ -58,10 +58,6 @@ async def _setup(hass: HomeAssistant, mock_client: AsyncMock) -> MockConfigEntry
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -155,3 +151,57 @@ async def test_turn_off_calls_put_device_settings(hass: HomeAssistant) -> None:
     mock_client.put_device_settings.assert_called_once_with(
         "hub-intercom-001", {"face": {"enabled": "no"}}
     )
+
+
+async def test_set_face_unlock_service_defaults_to_face_readers(
+    hass: HomeAssistant,
+) -> None:
+    """set_face_unlock without targets updates every face unlock reader."""
+    mock_client = _make_mock_client(face_capable=True)
+    mock_client.get_device_settings = AsyncMock(
+        return_value=SAMPLE_DEVICE_SETTINGS_FACE_ON
+    )
+    await _setup(hass, mock_client)
+
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id("switch", DOMAIN, "door-001_face_unlock")
+    mock_client.put_device_settings.reset_mock()
+    response = await hass.services.async_call(
+        DOMAIN,
+        "set_face_unlock",
+        {"enabled": False},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+
+    mock_client.put_device_settings.assert_called_once_with(
+        "hub-intercom-001", {"face": {"enabled": "no"}}
+    )
+    assert response["succeeded"] == 1
+    assert response["failed"] == 0
+    assert hass.states.get(entity_id).state == "off"
+
+
+async def test_set_face_unlock_service_reports_unsupported_doors(
+    hass: HomeAssistant,
+) -> None:
+    """Doors without a face unlock reader are reported as failed."""
+    mock_client = _make_mock_client(face_capable=True)
+    await _setup(hass, mock_client)
+
+    mock_client.put_device_settings.reset_mock()
+    response = await hass.services.async_call(
+        DOMAIN,
+        "set_face_unlock",
+        {"door_ids": ["door-001", "door-002"], "enabled": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    mock_client.put_device_settings.assert_called_once_with(
+        "hub-intercom-001", {"face": {"enabled": "yes"}}
+    )
+    results = {result["door_id"]: result for result in response["results"]}
+    assert results["door-001"]["success"] is True
+    assert results["door-002"]["success"] is False
@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from unifi_access_api import (
+    ApiError,
     ApiNotFoundError,
     DoorLockRelayStatus,
     DoorLockRuleType,
     DoorPositionStatus,
+    V2DeviceUpdate,
+    V2LocationUpdate,
 )
+from unifi_access_api.models.websocket import WebsocketMessage
 
+from custom_components.unifi_access.const import DOOR_REMOVE_AFTER_MISSES
+from custom_components.unifi_access.dedup import EventDedupCache
 from custom_components.unifi_access.hub import (
     DoorState,
     UnifiAccessHub,
     _normalize_name,
+    access_event_fingerprint,
 )
+from custom_components.unifi_access.message_log import RecentMessageLog
 
 from .conftest import SAMPLE_DOORS
 
@@ -67,6 +76,22 @@ class TestDoorState:
         state.trigger_event("access", {"actor": "another"})
         assert len(received) == 1
 
+    def test_refresh_keeps_payload_and_reports_changes(self) -> None:
+        """Push updates touch only the hot state; refresh replaces the payload."""
+        state = DoorState(door=SAMPLE_DOORS[0])
+        payload = state.door
+        state.hot.door_position_status = DoorPositionStatus.CLOSE
+        assert state.door is payload
+        assert state.is_open is False
+
+        # The controller still reports the door open: that is a change.
+        assert state.refresh(SAMPLE_DOORS[0]) is True
+        assert state.is_open is True
+        # Same payload again, even after a push the controller agreed with.
+        state.hot.door_lock_relay_status = SAMPLE_DOORS[0].door_lock_relay_status
+        assert state.refresh(SAMPLE_DOORS[0]) is False
+        assert state.refresh(SAMPLE_DOORS[0].with_updates(name="Renamed")) is True
+
     def test_remove_nonexistent_listener(self) -> None:
         """Removing a listener that was never added should not raise."""
         state = DoorState(door=SAMPLE_DOORS[0])
@@ -127,6 +152,68 @@ class TestHubUpdate:
         assert hub.doors["door-001"] is state_001
         assert hub.doors["door-001"].hub_type == "UA-Hub"
 
+    async def test_async_update_prunes_removed_doors(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Doors deleted on the controller are dropped with their state."""
+        await hub.async_update()
+        removed = hub.doors["door-002"]
+        removed.thumbnail = b"x" * 100
+        removed.add_event_listener("access", MagicMock())
+        hub.access_event_cache.add(access_event_fingerprint("door-002", "Ann", 1))
+        hub.on_doors_removed = MagicMock()
+        lock_rule_calls = mock_api_client.get_door_lock_rule.call_count
+
+        mock_api_client.get_doors.return_value = SAMPLE_DOORS[:1]
+        for _ in range(DOOR_REMOVE_AFTER_MISSES - 1):
+            await hub.async_update()
+        # Kept while missing, without asking for its lock rule.
+        assert list(hub.doors) == ["door-001", "door-002"]
+        assert hub.gc_stats_as_dict()["missing"] == {
+            "door-002": DOOR_REMOVE_AFTER_MISSES - 1
+        }
+        hub.on_doors_removed.assert_not_called()
+        await hub.async_update()
+
+        assert list(hub.doors) == ["door-001"]
+        assert (
+            mock_api_client.get_door_lock_rule.call_count
+            == lock_rule_calls + DOOR_REMOVE_AFTER_MISSES
+        )
+        hub.on_doors_removed.assert_called_once_with(["door-002"])
+        assert removed.thumbnail is None
+        assert not hub.access_event_cache.seen(
+            access_event_fingerprint("door-002", "Ann", 1)
+        )
+        stats = hub.gc_stats_as_dict()
+        assert stats["doors_removed"] == 1
+        assert stats["thumbnail_bytes"] == 100
+        assert stats["listeners"] == 1
+        assert stats["index_entries"] == 1
+
+        # An empty door list is not taken as every door being deleted
+        mock_api_client.get_doors.return_value = []
+        await hub.async_update()
+        assert list(hub.doors) == ["door-001"]
+
+    async def test_async_update_keeps_briefly_missing_door(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """A door left out of one partial door list is not removed."""
+        await hub.async_update()
+        state = hub.doors["door-002"]
+        hub.on_doors_removed = MagicMock()
+
+        mock_api_client.get_doors.return_value = SAMPLE_DOORS[:1]
+        await hub.async_update()
+        mock_api_client.get_doors.return_value = SAMPLE_DOORS
+        for _ in range(DOOR_REMOVE_AFTER_MISSES):
+            await hub.async_update()
+
+        assert hub.doors["door-002"] is state
+        assert hub.gc_stats_as_dict()["missing"] == {}
+        hub.on_doors_removed.assert_not_called()
+
     async def test_async_update_only_fetches_devices_until_mapped(
         self, hub: UnifiAccessHub, mock_api_client: AsyncMock
     ) -> None:
@@ -175,6 +262,199 @@ class TestHubUpdate:
         assert rule.type == DoorLockRuleType.KEEP_LOCK
         assert rule.interval == 30
 
+    async def test_async_set_lock_rule_bulk(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """A bulk lock rule is applied to every door with a single notification."""
+        await hub.async_update()
+        hub.on_doors_updated = MagicMock()
+
+        result = await hub.async_set_lock_rule_bulk(
+            ["door-001", "door-002"], "keep_unlock"
+        )
+
+        assert result.success is True
+        assert sorted(result.applied) == ["door-001", "door-002"]
+        assert mock_api_client.set_door_lock_rule.call_count == 2
+        assert hub.doors["door-001"].lock_rule == "keep_unlock"
+        assert hub.doors["door-002"].lock_rule == "keep_unlock"
+        hub.on_doors_updated.assert_called_once()
+
+    async def test_async_set_lock_rule_bulk_rolls_back_on_failure(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Doors that accepted the rule are restored when another door fails."""
+        await hub.async_update()
+        hub.on_doors_updated = MagicMock()
+        hub.doors["door-002"].lock_rule = "schedule"
+        applied: list[tuple[str, DoorLockRuleType]] = []
+
+        async def _set_rule(door_id: str, rule) -> None:
+            if door_id == "door-002" and rule.type == DoorLockRuleType.KEEP_UNLOCK:
+                raise ApiNotFoundError("gone")
+            applied.append((door_id, rule.type))
+
+        mock_api_client.set_door_lock_rule.side_effect = _set_rule
+
+        result = await hub.async_set_lock_rule_bulk(
+            ["door-001", "door-002"], "keep_unlock"
+        )
+
+        assert result.success is False
+        assert list(result.failed) == ["door-002"]
+        assert result.applied == []
+        assert result.rolled_back == ["door-001"]
+        # door-001 was keep_lock before the transaction and is restored to it
+        assert applied == [
+            ("door-001", DoorLockRuleType.KEEP_UNLOCK),
+            ("door-001", DoorLockRuleType.KEEP_LOCK),
+        ]
+        assert hub.doors["door-001"].lock_rule == "keep_lock"
+        assert hub.doors["door-002"].lock_rule == "schedule"
+        hub.on_doors_updated.assert_called_once()
+
+    async def test_async_bulk_door_command_respects_fan_out_limit(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Bulk commands run concurrently but never exceed max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def _unlock(door_id: str, *, control_cmd: str | None = None) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_api_client.unlock_door.side_effect = _unlock
+        door_ids = [f"door-{i:03d}" for i in range(10)]
+
+        results = await hub.async_bulk_door_command(
+            door_ids, control_cmd="stop", max_concurrency=3
+        )
+
+        assert peak == 3
+        assert [result.door_id for result in results] == door_ids
+        assert all(result.success for result in results)
+        mock_api_client.unlock_door.assert_any_call("door-005", control_cmd="stop")
+
+    async def test_async_reconcile_no_drift(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Reconciling an in-sync hub changes nothing and does not notify."""
+        await hub.async_update()
+        hub.on_doors_updated = MagicMock()
+
+        assert await hub.async_reconcile() == 0
+
+        assert hub.reconcile_stats.runs == 1
+        assert hub.reconcile_stats.runs_with_discrepancy == 0
+        hub.on_doors_updated.assert_not_called()
+
+    async def test_async_reconcile_corrects_drift(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Missed push updates are corrected and counted."""
+        await hub.async_update()
+        hub.on_doors_updated = MagicMock()
+        hub.on_emergency_updated = MagicMock()
+        front = hub.doors["door-001"]
+        front.hot.door_position_status = DoorPositionStatus.CLOSE
+        front.lock_rule = "keep_unlock"
+        hub.doors["door-002"].lock_rule = "keep_unlock"
+        hub.evacuation = True
+
+        assert await hub.async_reconcile(lock_rule_batch=1) == 3
+
+        assert front.door_position_status is DoorPositionStatus.OPEN
+        assert front.lock_rule == "keep_lock"
+        assert hub.evacuation is False
+        # Only one lock rule is re-read per run.
+        assert hub.doors["door-002"].lock_rule == "keep_unlock"
+        stats = hub.reconcile_stats
+        assert (stats.door_state, stats.lock_rule, stats.emergency) == (1, 1, 1)
+        assert stats.runs_with_discrepancy == 1
+        hub.on_doors_updated.assert_called_once()
+        hub.on_emergency_updated.assert_called_once()
+
+        # The next run moves on to the next door.
+        assert await hub.async_reconcile(lock_rule_batch=1) == 1
+        assert hub.doors["door-002"].lock_rule == "keep_lock"
+        assert hub.reconcile_stats.discrepancies == 4
+
+    async def test_async_reconcile_failure_is_counted(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """A failed reconcile run is counted and re-raised."""
+        mock_api_client.get_doors.side_effect = ApiError("boom")
+
+        with pytest.raises(ApiError):
+            await hub.async_reconcile()
+
+        assert hub.reconcile_stats.failures == 1
+
+    async def test_concurrent_identical_reads_are_coalesced(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Concurrent identical reads share one in-flight request."""
+        release = asyncio.Event()
+        status = mock_api_client.get_emergency_status.return_value
+
+        async def _get_emergency_status() -> object:
+            await release.wait()
+            return status
+
+        mock_api_client.get_emergency_status.side_effect = _get_emergency_status
+
+        tasks = [
+            asyncio.ensure_future(hub.async_get_emergency_status()) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [status, status, status]
+        mock_api_client.get_emergency_status.assert_called_once()
+        assert hub.read_stats["get_emergency_status"].calls == 3
+        assert hub.read_stats["get_emergency_status"].coalesced == 2
+
+        # Once the request completes, the next read hits the controller again.
+        await hub.async_get_emergency_status()
+        assert mock_api_client.get_emergency_status.call_count == 2
+
+    async def test_coalesced_read_error_reaches_every_caller(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """A failed shared read raises for every waiting caller."""
+        release = asyncio.Event()
+
+        async def _get_devices() -> list:
+            await release.wait()
+            raise ApiNotFoundError("gone")
+
+        mock_api_client.get_devices.side_effect = _get_devices
+
+        tasks = [asyncio.ensure_future(hub._get_devices()) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ApiNotFoundError) for result in results)
+        mock_api_client.get_devices.assert_called_once()
+        assert not hub._inflight
+
+    async def test_reads_with_different_arguments_are_not_coalesced(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Lock rule reads for different doors are separate requests."""
+        await asyncio.gather(
+            hub._get_door_lock_rule("door-001"), hub._get_door_lock_rule("door-002")
+        )
+
+        assert mock_api_client.get_door_lock_rule.call_count == 2
+        assert hub.read_stats["get_door_lock_rule"].coalesced == 0
+
 
 # ---------------------------------------------------------------------------
 # UnifiAccessHub — notifications
@@ -236,12 +516,9 @@ class TestHubWebSocketHandlers:
 
         await hub._handle_location_update(msg)
 
+        assert hub.doors["door-001"].door_position_status == DoorPositionStatus.CLOSE
         assert (
-            hub.doors["door-001"].door.door_position_status == DoorPositionStatus.CLOSE
-        )
-        assert (
-            hub.doors["door-001"].door.door_lock_relay_status
-            == DoorLockRelayStatus.UNLOCK
+            hub.doors["door-001"].door_lock_relay_status == DoorLockRelayStatus.UNLOCK
         )
         hub.on_doors_updated.assert_called_once()
 
@@ -522,7 +799,7 @@ class TestHubWebSocketHandlers:
         assert events_received[0][1]["door_id"] == "door-001"
         assert events_received[0][1]["door_name"] == "Front Door"
         assert events_received[0][1]["type"] == "unifi_access_entry"
-        assert "door-001" in hub._last_insight_time
+        assert len(hub.access_event_cache) == 1
         hub.on_doors_updated.assert_not_called()
 
     async def test_handle_logs_add_suppressed_after_insight_door_mapping(
@@ -558,10 +835,76 @@ class TestHubWebSocketHandlers:
         await hub._handle_logs_add(log_msg)
 
         assert len(events_received) == 1
-        assert "door-001" in hub._last_insight_time
-        assert "hub-001" not in hub._last_insight_time
+        assert hub.access_event_cache.stats.hits == 1
         hub.on_doors_updated.assert_not_called()
 
+    async def test_handle_logs_add_suppressed_with_differing_credentials(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Insights and logs name credentials and times differently."""
+        insight_msg = MagicMock()
+        insight_msg.data.metadata.door = [MagicMock(id="door-001")]
+        insight_msg.data.metadata.actor.display_name = "Raphael"
+        insight_msg.data.metadata.authentication.display_name = "PIN"
+        insight_msg.data.metadata.opened_method = [MagicMock(display_name="pin")]
+        insight_msg.data.metadata.opened_direction = [MagicMock(display_name="entry")]
+        insight_msg.data.metadata.reader_capture = []
+        # Seconds on one stream, milliseconds on the other.
+        insight_msg.data.published = 1_700_000_000
+
+        log_msg = MagicMock()
+        log_msg.door_id = "door-001"
+        log_msg.data.source.target = [MagicMock(type="door", id="door-001")]
+        log_msg.data.source.actor.display_name = "raphael"
+        log_msg.data.source.event.result = "ACCESS"
+        log_msg.data.source.event.model_extra = {"published": 1_700_000_000_400}
+        log_msg.data.source.authentication.credential_provider = "PIN_CODE"
+        log_msg.data.source.device_config.display_name = "entry"
+
+        events_received = []
+        hub.doors["door-001"].add_event_listener(
+            "access", lambda e, a: events_received.append(a)
+        )
+
+        await hub._handle_insights_add(insight_msg)
+        await hub._handle_logs_add(log_msg)
+
+        assert len(events_received) == 1
+        assert hub.access_event_cache.stats.hits == 1
+
+    async def test_handle_logs_add_not_suppressed_for_other_actor(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """An insight for one person must not hide another person's access."""
+        insight_msg = MagicMock()
+        insight_msg.data.metadata.door = [MagicMock(id="door-001")]
+        insight_msg.data.metadata.actor.display_name = "Raphael"
+        insight_msg.data.metadata.authentication.display_name = "FACE"
+        insight_msg.data.metadata.opened_method = [MagicMock(display_name="face")]
+        insight_msg.data.metadata.opened_direction = [MagicMock(display_name="entry")]
+        insight_msg.data.metadata.reader_capture = []
+        insight_msg.data.published = 1_700_000_000_000
+
+        log_msg = MagicMock()
+        log_msg.door_id = "door-001"
+        log_msg.data.source.target = [MagicMock(type="door", id="door-001")]
+        log_msg.data.source.actor.display_name = "Alice"
+        log_msg.data.source.event.result = "ACCESS"
+        log_msg.data.source.event.model_extra = {"published": 1_700_000_001_000}
+        log_msg.data.source.authentication.credential_provider = "NFC"
+        log_msg.data.source.device_config.display_name = "entry"
+
+        events_received = []
+        hub.doors["door-001"].add_event_listener(
+            "access", lambda e, a: events_received.append(a)
+        )
+
+        await hub._handle_insights_add(insight_msg)
+        await hub._handle_logs_add(log_msg)
+
+        assert [event["actor"] for event in events_received] == ["Raphael", "Alice"]
+        assert hub.access_event_cache.stats.misses == 1
+
     async def test_handle_v2_location_update(self, hub: UnifiAccessHub) -> None:
         """Test V2 location update handler."""
         msg = MagicMock()
@@ -573,15 +916,265 @@ class TestHubWebSocketHandlers:
 
         await hub._handle_v2_location_update(msg)
 
+        assert hub.doors["door-001"].door_position_status == DoorPositionStatus.CLOSE
         assert (
-            hub.doors["door-001"].door.door_position_status == DoorPositionStatus.CLOSE
+            hub.doors["door-001"].door_lock_relay_status == DoorLockRelayStatus.UNLOCK
         )
-        assert (
-            hub.doors["door-001"].door.door_lock_relay_status
-            == DoorLockRelayStatus.UNLOCK
+        hub.on_doors_updated.assert_called_once()
+
+    async def test_stale_location_update_is_dropped(self, hub: UnifiAccessHub) -> None:
+        """A frame older than the applied state is dropped and counted."""
+
+        def _update(lock: str, dps: str, timestamp: int) -> V2LocationUpdate:
+            return V2LocationUpdate.model_validate(
+                {
+                    "event": "access.data.v2.location.update",
+                    "data": {"id": "door-001", "state": {"lock": lock, "dps": dps}},
+                    "timestamp": timestamp,
+                }
+            )
+
+        await hub._handle_v2_location_update(_update("unlocked", "open", 1700000002))
+        # Delayed frame from before the unlock, in milliseconds.
+        await hub._handle_v2_location_update(_update("locked", "close", 1700000001000))
+
+        door = hub.doors["door-001"]
+        assert door.door_lock_relay_status == DoorLockRelayStatus.UNLOCK
+        assert door.door_position_status == DoorPositionStatus.OPEN
+        assert hub.sequencing_stats.stale_messages == {
+            "access.data.v2.location.update": 1
+        }
+        hub.on_doors_updated.assert_called_once()
+
+        # Without a timestamp a frame cannot be checked; it is applied as is.
+        await hub._handle_v2_location_update(
+            V2LocationUpdate.model_validate(
+                {
+                    "event": "access.data.v2.location.update",
+                    "data": {"id": "door-001", "state": {"lock": "locked"}},
+                }
+            )
+        )
+        assert door.door_lock_relay_status == DoorLockRelayStatus.LOCK
+        stats = hub.sequencing_stats_as_dict()
+        assert stats["dropped"] == 1
+        assert stats["unchecked_messages"] == 1
+
+    async def test_push_latency_uses_controller_timestamp(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Latency runs from the controller timestamp to the entity write."""
+        sent_at = time.time() - 0.25
+        msg = V2LocationUpdate.model_validate(
+            {
+                "event": "access.data.v2.location.update",
+                "data": {"id": "door-001", "state": {"lock": "unlocked"}},
+                "timestamp": int(sent_at * 1000),
+            }
+        )
+        await hub._handle_v2_location_update(msg)
+        state = hub.doors["door-001"]
+
+        hub.note_state_written(state)
+        # A second entity of the same door does not count the update again.
+        hub.note_state_written(state)
+
+        assert hub.push_latency.count == 1
+        assert 250 <= hub.push_latency.percentile(50) < 5000
+        assert hub.push_latency_as_dict()["sources"] == {"controller": 1}
+
+    async def test_push_latency_discards_unwritten_updates_on_refresh(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """A push no entity wrote is not timed against a later write."""
+        msg = V2LocationUpdate.model_validate(
+            {
+                "event": "access.data.v2.location.update",
+                "data": {"id": "door-001", "state": {"lock": "unlocked"}},
+            }
+        )
+        await hub._handle_v2_location_update(msg)
+        state = hub.doors["door-001"]
+        assert state.hot.push_origin
+
+        await hub.async_update()
+        hub.note_state_written(state)
+
+        assert state.hot.push_origin == 0.0
+        assert hub.push_latency.count == 0
+
+    async def test_push_latency_falls_back_to_receive_time(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Without a controller timestamp the receive time is used."""
+        msg = V2LocationUpdate.model_validate(
+            {
+                "event": "access.data.v2.location.update",
+                "data": {"id": "door-001", "state": {"lock": "unlocked"}},
+            }
+        )
+        await hub._record(hub._handle_v2_location_update)(msg)
+        hub.note_state_written(hub.doors["door-001"])
+
+        latency = hub.push_latency_as_dict()
+        assert latency["count"] == 1
+        assert latency["p99"] >= 0
+        assert latency["sources"] == {"received": 1}
+
+    async def test_command_latency_confirmed_by_push(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """An unlock is timed until the door reports its relay unlocked."""
+
+        async def _unlock_door(door_id: str, control_cmd: str | None = None) -> None:
+            # The push can arrive before the controller answers the request.
+            await hub._handle_v2_location_update(
+                V2LocationUpdate.model_validate(
+                    {
+                        "event": "access.data.v2.location.update",
+                        "data": {"id": door_id, "state": {"lock": "unlocked"}},
+                    }
+                )
+            )
+
+        mock_api_client.unlock_door.side_effect = _unlock_door
+
+        await hub.async_unlock_door("door-001")
+
+        latency = hub.command_latency["door-001"]
+        assert latency.rtt.count == 1
+        assert latency.confirmation.count == 1
+        assert latency.pending is None
+        stats = hub.command_latency_as_dict()["door-001"]
+        assert stats["confirmed"] == 1
+        assert sum(stats["rtt"]["histogram"].values()) == 1
+        assert not hub._awaiting_confirmation
+
+    async def test_command_latency_unconfirmed_and_failed(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Commands without the expected state change or rejected are counted."""
+        await hub.async_close_door("door-001")
+        latency = hub.command_latency["door-001"]
+        assert latency.pending is not None
+        latency.timeout = 0
+        hub._notify_doors_updated()
+        assert latency.unconfirmed == 1
+        assert latency.pending is None
+
+        mock_api_client.unlock_door.side_effect = ApiError("offline")
+        with pytest.raises(ApiError):
+            await hub.async_unlock_door("door-001")
+        assert latency.failed == 1
+        assert latency.rtt.count == 1
+        assert latency.pending is None
+
+    async def test_command_latency_skips_state_already_reached(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Stop, or a command for a state the door is in, awaits nothing."""
+        await hub.async_unlock_door("door-002")
+        await hub.async_stop_door("door-001")
+
+        assert hub.command_latency["door-002"].pending is None
+        assert hub.command_latency["door-001"].pending is None
+        assert hub.command_latency["door-001"].rtt.count == 1
+
+    async def test_command_latency_not_tracked_for_unknown_door(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """A command for a door the hub does not know creates no tracker."""
+        await hub.async_unlock_door("door-999")
+
+        mock_api_client.unlock_door.assert_awaited_once_with(
+            "door-999", control_cmd=None
         )
+        assert "door-999" not in hub.command_latency
+        assert not hub._awaiting_confirmation
+        hub._expire_command("door-999")
+        assert hub.command_latency_as_dict() == {}
+
+    async def test_optimistic_unlock_until_confirmed(self, hub: UnifiAccessHub) -> None:
+        """An unlock shows at once and the pushed state takes over on confirm."""
+        cancel = MagicMock()
+        hub.call_later = MagicMock(return_value=cancel)
+
+        await hub.async_unlock_door("door-001")
+
+        door = hub.doors["door-001"]
+        assert not door.is_locked
+        assert door.hot.door_lock_relay_status == DoorLockRelayStatus.LOCK
+        assert hub.call_later.call_args[0][0] == hub.confirm_timeout
         hub.on_doors_updated.assert_called_once()
 
+        await hub._handle_v2_location_update(
+            V2LocationUpdate.model_validate(
+                {
+                    "event": "access.data.v2.location.update",
+                    "data": {"id": "door-001", "state": {"lock": "unlocked"}},
+                }
+            )
+        )
+
+        assert door.optimistic_lock is None
+        assert not door.is_locked
+        cancel.assert_called_once()
+
+    async def test_optimistic_unlock_rolled_back(
+        self,
+        hub: UnifiAccessHub,
+        mock_api_client: AsyncMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Without a confirmation in time, or on failure, the unlock is undone."""
+        hub.call_later = MagicMock(return_value=MagicMock())
+        door = hub.doors["door-001"]
+
+        await hub.async_unlock_door("door-001")
+        assert not door.is_locked
+        expire = hub.call_later.call_args[0][1]
+        expire()
+
+        assert door.is_locked
+        assert hub.command_latency["door-001"].unconfirmed == 1
+        assert "was not confirmed within 10 seconds" in caplog.text
+        assert hub.on_doors_updated.call_count == 2
+
+        mock_api_client.unlock_door.side_effect = ApiError("offline")
+        with pytest.raises(ApiError):
+            await hub.async_unlock_door("door-001")
+        assert door.is_locked
+        assert door.optimistic_lock is None
+
+    async def test_snapshot_does_not_overwrite_newer_push(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """A push that lands while a REST read is in flight wins."""
+        msg = V2LocationUpdate.model_validate(
+            {
+                "event": "access.data.v2.location.update",
+                "data": {
+                    "id": "door-001",
+                    "state": {"lock": "unlocked", "dps": "close"},
+                },
+            }
+        )
+
+        async def _get_doors() -> list:
+            await hub._handle_v2_location_update(msg)
+            return SAMPLE_DOORS
+
+        mock_api_client.get_doors.side_effect = _get_doors
+
+        assert await hub.async_reconcile() == 0
+
+        door = hub.doors["door-001"]
+        assert door.door_lock_relay_status == DoorLockRelayStatus.UNLOCK
+        assert door.door_position_status == DoorPositionStatus.CLOSE
+        assert door.lock_rule == ""
+        # Both the door snapshot and its lock rule were older than the push.
+        assert hub.sequencing_stats.stale_snapshots == 2
+
     async def test_handle_v2_location_update_unknown_door(
         self, hub: UnifiAccessHub
     ) -> None:
@@ -630,12 +1223,9 @@ class TestHubWebSocketHandlers:
 
         assert hub.doors["door-001"].hub_type == "UGT"
         assert hub.doors["door-001"].hub_id == "hub-ugt-001"
+        assert hub.doors["door-001"].door_position_status == DoorPositionStatus.CLOSE
         assert (
-            hub.doors["door-001"].door.door_position_status == DoorPositionStatus.CLOSE
-        )
-        assert (
-            hub.doors["door-001"].door.door_lock_relay_status
-            == DoorLockRelayStatus.UNLOCK
+            hub.doors["door-001"].door_lock_relay_status == DoorLockRelayStatus.UNLOCK
         )
         hub.on_doors_updated.assert_called_once()
 
@@ -685,9 +1275,7 @@ class TestHubWebSocketHandlers:
 
         assert hub.doors["door-001"].hub_id == "existing-hub"
         assert hub.doors["door-001"].hub_type == "UA-Hub-Old"
-        assert (
-            hub.doors["door-001"].door.door_position_status == DoorPositionStatus.CLOSE
-        )
+        assert hub.doors["door-001"].door_position_status == DoorPositionStatus.CLOSE
         hub.on_doors_updated.assert_called_once()
 
     async def test_handle_location_update_legacy(
@@ -798,13 +1386,33 @@ class TestHubWebSocketHandlers:
         )
 
         # Simulate a recent insights.add so logs.add is suppressed
-        hub._last_insight_time["door-001"] = time.monotonic()
+        bucket = hub._access_event_bucket(msg, None)
+        hub.access_event_cache.add(access_event_fingerprint("door-001", "Test", bucket))
 
         await hub._handle_logs_add(msg)
 
         hub.on_doors_updated.assert_not_called()
         assert len(events_received) == 0
 
+    def test_access_event_cache_is_bounded(self) -> None:
+        """The dedup cache evicts the oldest entries and expires old ones."""
+        cache = EventDedupCache(ttl=60, capacity=2)
+        for key in ("a", "b", "c"):
+            cache.add(key)
+
+        assert len(cache) == 2
+        assert cache.stats.evicted == 1
+        assert not cache.seen("a")
+        assert cache.seen("b", "x")
+
+        assert cache.as_dict()["hits"] == 1
+
+        expiring = EventDedupCache(ttl=0, capacity=2)
+        expiring.add("a")
+        assert not expiring.seen("a")
+        assert len(expiring) == 0
+        assert expiring.stats.expired == 1
+
     async def test_handle_insights_add_empty_direction(
         self, hub: UnifiAccessHub
     ) -> None:
@@ -871,18 +1479,18 @@ class TestHubWebSocketHandlers:
         UnifiAccessHub._apply_lock_dps(
             state, dps=DoorPositionStatus.CLOSE, lock="unlocked"
         )
-        assert state.door.door_position_status == DoorPositionStatus.CLOSE
-        assert state.door.door_lock_relay_status == DoorLockRelayStatus.UNLOCK
+        assert state.door_position_status == DoorPositionStatus.CLOSE
+        assert state.door_lock_relay_status == DoorLockRelayStatus.UNLOCK
 
     async def test_apply_lock_dps_unknown_lock(self, hub: UnifiAccessHub) -> None:
         """Unknown lock value should only update DPS, not lock relay."""
         state = hub.doors["door-001"]
-        original_lock = state.door.door_lock_relay_status
+        original_lock = state.door_lock_relay_status
         UnifiAccessHub._apply_lock_dps(
             state, dps=DoorPositionStatus.CLOSE, lock="unknown"
         )
-        assert state.door.door_position_status == DoorPositionStatus.CLOSE
-        assert state.door.door_lock_relay_status == original_lock
+        assert state.door_position_status == DoorPositionStatus.CLOSE
+        assert state.door_lock_relay_status == original_lock
 
     async def test_start_websocket(
         self, hub: UnifiAccessHub, mock_api_client: AsyncMock
@@ -904,6 +1512,280 @@ class TestHubWebSocketHandlers:
         assert "access.hw.door_bell" in handlers
         assert "access.data.setting.update" in handlers
 
+    async def test_websocket_reconnect_resyncs_state(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """A reconnect after an outage re-reads all doors and lock rules."""
+        await hub.async_update()
+        hub.start_websocket()
+        kwargs = mock_api_client.start_websocket.call_args.kwargs
+        on_connect, on_disconnect = kwargs["on_connect"], kwargs["on_disconnect"]
+        tasks: list[asyncio.Task] = []
+        hub.create_task = lambda coro: tasks.append(asyncio.ensure_future(coro))
+
+        # Initial connection: nothing to resync.
+        on_connect()
+        assert tasks == []
+
+        on_disconnect()
+        stats = hub.connection_stats
+        assert stats.connected is False
+        assert stats.disconnects == 1
+        # Changes missed while disconnected.
+        hub.doors["door-001"].lock_rule = "keep_unlock"
+        hub.doors["door-002"].lock_rule = "keep_unlock"
+        mock_api_client.get_door_lock_rule.reset_mock()
+
+        on_connect()
+        await asyncio.gather(*tasks)
+
+        assert stats.connected is True
+        assert stats.connects == 2
+        assert stats.downtime > 0
+        assert stats.resyncs == 1
+        assert stats.resync_corrections == 2
+        assert mock_api_client.get_door_lock_rule.call_count == 2
+        assert hub.doors["door-001"].lock_rule == "keep_lock"
+        assert hub.doors["door-002"].lock_rule == "keep_lock"
+
+    async def test_websocket_disconnect_on_close_is_ignored(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """Stopping the websocket on shutdown is not counted as an outage."""
+        hub.start_websocket()
+        kwargs = mock_api_client.start_websocket.call_args.kwargs
+        kwargs["on_connect"]()
+
+        await hub.async_close()
+        kwargs["on_disconnect"]()
+
+        assert hub.connection_stats.disconnects == 0
+
+    async def test_dispatcher_orders_per_door_and_runs_doors_in_parallel(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """A slow message only holds up later messages for the same door."""
+        tasks: list[asyncio.Task] = []
+
+        def _create_task(coro):
+            tasks.append(asyncio.ensure_future(coro))
+            return tasks[-1]
+
+        hub._start_dispatcher(_create_task, 2)
+        release = asyncio.Event()
+        seen: list[tuple[str, str]] = []
+
+        async def _slow(msg: WebsocketMessage) -> None:
+            await release.wait()
+            seen.append(("slow", msg.door_id))
+
+        async def _fast(msg: WebsocketMessage) -> None:
+            seen.append(("fast", msg.door_id))
+
+        slow, fast = hub._dispatch(_slow), hub._dispatch(_fast)
+        await slow(WebsocketMessage(event="access.remote_view", door_id="door-001"))
+        await fast(WebsocketMessage(event="access.remote_view", door_id="door-001"))
+        await fast(WebsocketMessage(event="access.remote_view", door_id="door-004"))
+        await fast(WebsocketMessage(event="access.data.setting.update"))
+        await hub._lanes[0].join()
+        await hub._lanes[2].join()
+
+        assert seen == [("fast", "door-004"), ("fast", "")]
+        stats = hub.dispatch_stats_as_dict()
+        assert stats["door_lane_depths"] == [1, 0]
+        assert stats["dispatched"] == 4
+
+        release.set()
+        await hub._lanes[1].join()
+        assert seen[2:] == [("slow", "door-001"), ("fast", "door-001")]
+        assert hub.dispatch_stats.processed == 4
+
+        for task in tasks:
+            task.cancel()
+
+    async def test_dispatcher_splits_device_updates_by_door(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Each door of a device update is queued in that door's own lane."""
+
+        def _create_task(coro):
+            coro.close()  # no workers, so the queued messages stay put
+            return MagicMock()
+
+        hub._start_dispatcher(_create_task, 2)
+
+        async def _handler(msg: WebsocketMessage) -> None:
+            """Never runs."""
+
+        enqueue = hub._dispatch(_handler)
+        await enqueue(
+            V2DeviceUpdate.model_validate(
+                {
+                    "event": "access.data.v2.device.update",
+                    "data": {
+                        "id": "hub-1",
+                        "location_id": "door-001",
+                        "location_states": [
+                            {"location_id": "door-001", "lock": "unlocked"},
+                            {"location_id": "door-004", "lock": "unlocked"},
+                        ],
+                    },
+                }
+            )
+        )
+        await enqueue(
+            V2LocationUpdate.model_validate(
+                {
+                    "event": "access.data.v2.location.update",
+                    "door_id": "door-001",
+                    "data": {"id": "door-004", "state": {"lock": "locked"}},
+                }
+            )
+        )
+
+        def _drain(queue: asyncio.Queue) -> list[tuple[str, str]]:
+            items = []
+            while not queue.empty():
+                _, msg, _ = queue.get_nowait()
+                items.append((msg.event, hub._dispatch_key(msg)))
+            return items
+
+        assert _drain(hub._lanes[1]) == [("access.data.v2.device.update", "door-001")]
+        assert _drain(hub._lanes[2]) == [
+            ("access.data.v2.device.update", "door-004"),
+            ("access.data.v2.location.update", "door-004"),
+        ]
+        assert hub.dispatch_stats.dispatched == 3
+
+    def test_lane_for_hashes_keys_without_remembering_them(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Every key maps to a fixed door lane and no per-key state is kept."""
+        hub._lanes = [asyncio.Queue() for _ in range(5)]
+        lanes = {
+            hub._lane_for(WebsocketMessage(event="access.remote_view", door_id=key))
+            for key in (f"door-{i}" for i in range(1000))
+        }
+        assert lanes == {1, 2, 3, 4}
+
+        msg = WebsocketMessage(event="access.remote_view", door_id="door-001")
+        assert hub._lane_for(msg) == hub._lane_for(msg)
+        assert not hasattr(hub, "_lane_by_key")
+
+    async def test_start_websocket_uses_dispatcher(
+        self, hub: UnifiAccessHub, mock_api_client: AsyncMock
+    ) -> None:
+        """With a task factory, handlers are queued and processed by workers."""
+        tasks: list[asyncio.Task] = []
+
+        def _create_task(coro):
+            tasks.append(asyncio.ensure_future(coro))
+            return tasks[-1]
+
+        hub.create_task = _create_task
+        hub.start_websocket(dispatch_lanes=2)
+        handlers = mock_api_client.start_websocket.call_args[0][0]
+        assert len(tasks) == 3
+
+        msg = MagicMock()
+        msg.event = "access.data.v2.location.update"
+        msg.door_id = "door-001"
+        msg.data.id = "door-001"
+        msg.data.state.dps = DoorPositionStatus.CLOSE
+        msg.data.state.lock = "unlocked"
+        msg.data.thumbnail = None
+        await handlers["access.data.v2.location.update"](msg)
+        await hub._lanes[1].join()
+
+        assert (
+            hub.doors["door-001"].door_lock_relay_status == DoorLockRelayStatus.UNLOCK
+        )
+
+        await hub.async_close()
+        await asyncio.sleep(0)
+        assert all(task.cancelled() for task in tasks)
+
+    @patch("custom_components.unifi_access.hub.DISPATCH_MAX_QUEUED", 6)
+    @patch("custom_components.unifi_access.hub.DISPATCH_HIGH_WATER", 3)
+    async def test_dispatcher_sheds_low_value_messages_under_backpressure(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Above the high-water mark only essential messages always get in."""
+
+        def _create_task(coro):
+            coro.close()  # no workers, so the backlog only grows
+            return MagicMock()
+
+        hub._start_dispatcher(_create_task, 2)
+
+        async def _handler(msg: WebsocketMessage) -> None:
+            """Never runs."""
+
+        enqueue = hub._dispatch(_handler)
+        for _ in range(3):
+            await enqueue(WebsocketMessage(event="access.logs.insights.add"))
+        for _ in range(3):
+            await enqueue(WebsocketMessage(event="access.base.info"))
+        for _ in range(11):
+            await enqueue(WebsocketMessage(event="access.logs.add"))
+        for _ in range(2):
+            await enqueue(WebsocketMessage(event="access.logs.insights.add"))
+        for _ in range(2):
+            await enqueue(
+                WebsocketMessage(
+                    event="access.data.device.location_update_v2",
+                    door_id="door-001",
+                )
+            )
+        # Past the hard limit a log due for sampling is shed too, but a
+        # doorbell ring still gets in.
+        for _ in range(10):
+            await enqueue(WebsocketMessage(event="access.logs.add"))
+        await enqueue(WebsocketMessage(event="access.hw.door_bell"))
+
+        stats = hub.dispatch_stats_as_dict()
+        # 3 before the high-water mark, 2 sampled logs, 1 insight before
+        # the hard limit, both lock state updates and the doorbell ring.
+        assert stats["dispatched"] == 9
+        assert stats["shed"] == {
+            "access.base.info": 3,
+            "access.logs.add": 19,
+            "access.logs.insights.add": 1,
+        }
+        assert stats["shed_total"] == 23
+        assert stats["overloads"] == 1
+        log = hub.message_log.as_dict()
+        assert {record["outcome"] for record in log["access.base.info"]} == {"shed"}
+
+    async def test_message_log_keeps_last_messages_per_type(
+        self, hub: UnifiAccessHub
+    ) -> None:
+        """Only the newest messages of each type are kept, with their outcome."""
+        hub.message_log = RecentMessageLog(2)
+
+        async def _handler(msg: WebsocketMessage) -> None:
+            if msg.door_id == "door-002":
+                raise ValueError("boom")
+
+        recorded = hub._record(_handler)
+        for door_id in ("door-001", "door-003", "door-001"):
+            await recorded(
+                WebsocketMessage(event="access.remote_view", door_id=door_id)
+            )
+        with pytest.raises(ValueError):
+            await recorded(
+                WebsocketMessage(event="access.hw.door_bell", door_id="door-002")
+            )
+
+        log = hub.message_log.as_dict()
+        assert [r["message"]["door_id"] for r in log["access.remote_view"]] == [
+            "door-003",
+            "door-001",
+        ]
+        assert log["access.remote_view"][0]["outcome"] == "processed"
+        assert log["access.remote_view"][0]["handler_ms"] >= 0
+        assert log["access.hw.door_bell"][0]["outcome"] == "failed"
+
     async def test_async_close(
         self, hub: UnifiAccessHub, mock_api_client: AsyncMock
     ) -> None:
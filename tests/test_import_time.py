@@ -0,0 +1,109 @@
+"""Import structure and import time checks for the integration modules."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+PACKAGE = "custom_components.unifi_access"
+PLATFORMS = [
+    "binary_sensor",
+    "button",
+    "cover",
+    "event",
+    "image",
+    "lock",
+    "number",
+    "select",
+    "sensor",
+    "switch",
+]
+# Imported first in the same interpreter, so the integration's own self time is
+# compared with work done on the same runner rather than a wall-clock budget.
+REFERENCE = "homeassistant.helpers.update_coordinator"
+OWN_IMPORT_RATIO = 0.5
+
+
+def _parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    """Return ``{module: (self_us, cumulative_us)}`` from ``-X importtime``."""
+    modules: dict[str, tuple[int, int]] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+async def _import_times(*modules: str) -> dict[str, tuple[int, int]]:
+    """Import ``modules`` in a fresh interpreter and return the import times."""
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        "; ".join(f"import {module}" for module in modules),
+        cwd=Path(__file__).parent.parent,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    output = stderr.decode()
+    assert proc.returncode == 0, output
+    return _parse_importtime(output)
+
+
+def test_parse_importtime() -> None:
+    """Header lines are skipped and nested module names are stripped."""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:        80 |        200 | json\n"
+    )
+    assert _parse_importtime(output) == {
+        "json.decoder": (120, 120),
+        "json": (80, 200),
+    }
+
+
+async def test_package_import_does_not_load_platforms() -> None:
+    """Importing the integration leaves platforms and diagnostics to HA."""
+    modules = await _import_times(PACKAGE)
+
+    assert PACKAGE in modules
+    loaded = [
+        name
+        for name in (*PLATFORMS, "diagnostics", "config_flow")
+        if f"{PACKAGE}.{name}" in modules
+    ]
+    assert loaded == []
+
+
+@pytest.mark.parametrize("platform", PLATFORMS)
+async def test_platform_import_adds_only_itself(platform: str) -> None:
+    """A platform adds no integration modules besides itself."""
+    package = await _import_times(PACKAGE)
+    modules = await _import_times(PACKAGE, f"{PACKAGE}.{platform}")
+
+    own = {name for name in modules if name.startswith(f"{PACKAGE}.")}
+    assert own - package.keys() == {f"{PACKAGE}.{platform}"}
+
+
+async def test_own_import_time_is_small_next_to_reference() -> None:
+    """The integration's own modules import in a fraction of the reference."""
+    modules = await _import_times(
+        REFERENCE, PACKAGE, *(f"{PACKAGE}.{platform}" for platform in PLATFORMS)
+    )
+
+    own = {
+        name: self_us
+        for name, (self_us, _) in modules.items()
+        if name == PACKAGE or name.startswith(f"{PACKAGE}.")
+    }
+    _, reference_us = modules[REFERENCE]
+    assert sum(own.values()) < OWN_IMPORT_RATIO * reference_us, (own, reference_us)
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
-from unifi_access_api import ApiAuthError, ApiConnectionError, ApiError
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from unifi_access_api import (
+    ApiAuthError,
+    ApiConnectionError,
+    ApiError,
+    Door,
+    DoorLockRelayStatus,
+    DoorPositionStatus,
+    EmergencyStatus,
+)
 
 from custom_components.unifi_access import UnifiAccessData
-from custom_components.unifi_access.const import DOMAIN
+from custom_components.unifi_access.const import (
+    DOMAIN,
+    SETTINGS_SAVE_DELAY,
+    STORAGE_KEY,
+)
 
 from .conftest import (
     MOCK_CONFIG,
@@ -60,10 +79,6 @@ async def test_setup_entry(hass: HomeAssistant, mock_entry: MockConfigEntry) ->
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         result = await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
@@ -97,10 +112,6 @@ async def test_setup_entry_polling(
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         result = await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -110,6 +121,282 @@ async def test_setup_entry_polling(
     mock_client.start_websocket.assert_not_called()
 
 
+async def test_reconcile_runs_periodically_with_websocket(
+    hass: HomeAssistant,
+) -> None:
+    """Websocket mode re-reads controller state on the reconcile interval."""
+    mock_client = _make_mock_client()
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        options={"reconcile_interval": 60},
+        unique_id="192.168.1.1",
+        title="Unifi Access Doors",
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.unifi_access.UnifiAccessApiClient",
+        return_value=mock_client,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    calls = mock_client.get_doors.call_count
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert mock_client.get_doors.call_count == calls + 1
+    assert entry.runtime_data.hub.reconcile_stats.runs == 1
+
+
+async def test_door_settings_migrated_and_saved_delayed(
+    hass: HomeAssistant, mock_entry: MockConfigEntry, hass_storage: dict[str, Any]
+) -> None:
+    """Entity types from the old store are migrated and changes are batched."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"entity_types": {"door-001": "garage"}},
+    }
+    mock_client = _make_mock_client()
+
+    with patch(
+        "custom_components.unifi_access.UnifiAccessApiClient",
+        return_value=mock_client,
+    ):
+        await hass.config_entries.async_setup(mock_entry.entry_id)
+        await hass.async_block_till_done()
+
+    key = f"{STORAGE_KEY}.{mock_entry.entry_id}"
+    data = mock_entry.runtime_data
+    door = data.hub.doors["door-001"]
+    assert door.entity_type == "garage"
+    assert hass_storage[key]["data"]["doors"]["door-001"]["entity_type"] == "garage"
+
+    door.open_time = 20
+    data.settings.async_schedule_save()
+    door.close_time = 25
+    data.settings.async_schedule_save()
+    assert hass_storage[key]["data"]["doors"]["door-001"]["open_time"] == 0
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SETTINGS_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[key]
+    assert stored["version"] == 2
+    assert stored["data"]["doors"]["door-001"] == {
+        "entity_type": "garage",
+        "open_time": 20,
+        "close_time": 25,
+        "lock_rule_interval": 10,
+        "obstruction_detected": False,
+    }
+
+
+async def test_door_settings_are_kept_per_controller(
+    hass: HomeAssistant, mock_entry: MockConfigEntry, hass_storage: dict[str, Any]
+) -> None:
+    """Two controllers split the shared file and save without losing updates."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 2,
+        "key": STORAGE_KEY,
+        "data": {
+            "doors": {
+                "door-001": {"entity_type": "garage"},
+                "door-101": {"open_time": 30},
+            }
+        },
+    }
+    site_b_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_CONFIG, "host": "192.168.2.1"},
+        unique_id="192.168.2.1",
+        title="Site B",
+    )
+    site_b_entry.add_to_hass(hass)
+    site_b = _make_mock_client()
+    site_b.get_doors = AsyncMock(
+        return_value=[
+            Door(
+                id="door-101",
+                name="Warehouse Door",
+                full_name="Site B / Warehouse Door",
+                door_position_status=DoorPositionStatus.CLOSE,
+                door_lock_relay_status=DoorLockRelayStatus.LOCK,
+            )
+        ]
+    )
+    site_b.get_devices = AsyncMock(return_value=[])
+    site_b.resolve_door_id = MagicMock(return_value=None)
+
+    for entry, client in ((mock_entry, _make_mock_client()), (site_b_entry, site_b)):
+        with patch(
+            "custom_components.unifi_access.UnifiAccessApiClient",
+            return_value=client,
+        ):
+            await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+        if entry is mock_entry:
+            # Site B's doors stay in the shared file until it migrates too.
+            legacy = hass_storage[STORAGE_KEY]["data"]["doors"]
+            assert legacy == {"door-101": {"open_time": 30}}
+
+    assert STORAGE_KEY not in hass_storage
+    site_a_data = mock_entry.runtime_data
+    site_b_data = site_b_entry.runtime_data
+    assert site_a_data.hub.doors["door-001"].entity_type == "garage"
+    assert site_b_data.hub.doors["door-101"].open_time == 30
+
+    site_a_data.hub.doors["door-001"].close_time = 40
+    site_a_data.settings.async_schedule_save()
+    site_b_data.hub.doors["door-101"].close_time = 50
+    site_b_data.settings.async_schedule_save()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SETTINGS_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    site_a = hass_storage[f"{STORAGE_KEY}.{mock_entry.entry_id}"]["data"]["doors"]
+    site_b = hass_storage[f"{STORAGE_KEY}.{site_b_entry.entry_id}"]["data"]["doors"]
+    assert site_a.keys() == {"door-001", "door-002"}
+    assert site_a["door-001"]["close_time"] == 40
+    assert site_b.keys() == {"door-101"}
+    assert site_b["door-101"]["open_time"] == 30
+    assert site_b["door-101"]["close_time"] == 50
+
+
+async def test_initial_loads_run_concurrently(
+    hass: HomeAssistant, mock_entry: MockConfigEntry
+) -> None:
+    """Setup takes about as long as the slowest initial load, not their sum."""
+    delay = 0.2
+    mock_client = _make_mock_client()
+
+    async def _slow_doors() -> list[Door]:
+        await asyncio.sleep(delay)
+        return SAMPLE_DOORS
+
+    async def _slow_emergency_status() -> EmergencyStatus:
+        await asyncio.sleep(delay)
+        return SAMPLE_EMERGENCY_STATUS
+
+    mock_client.get_doors = AsyncMock(side_effect=_slow_doors)
+    mock_client.get_emergency_status = AsyncMock(side_effect=_slow_emergency_status)
+
+    with patch(
+        "custom_components.unifi_access.UnifiAccessApiClient",
+        return_value=mock_client,
+    ):
+        await hass.config_entries.async_setup(mock_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_entry.state is ConfigEntryState.LOADED
+    phases = mock_entry.runtime_data.setup_timer.phases
+    assert (
+        phases["initial_load"].duration_ms
+        < phases["first_refresh"].duration_ms + phases["emergency_refresh"].duration_ms
+    )
+
+
+async def test_setup_entry_not_ready_when_emergency_refresh_fails(
+    hass: HomeAssistant, mock_entry: MockConfigEntry
+) -> None:
+    """A failed emergency refresh still makes setup retry while doors load."""
+    mock_client = _make_mock_client()
+    mock_client.get_emergency_status = AsyncMock(
+        side_effect=ApiError("Server error", status_code=500)
+    )
+
+    with patch(
+        "custom_components.unifi_access.UnifiAccessApiClient",
+        return_value=mock_client,
+    ):
+        await hass.config_entries.async_setup(mock_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_entry.state is ConfigEntryState.SETUP_RETRY
+    mock_client.get_doors.assert_awaited()
+
+
+async def test_auth_error_wins_over_concurrent_refresh_error(
+    hass: HomeAssistant, mock_entry: MockConfigEntry
+) -> None:
+    """Reauth starts even when another initial load failed differently."""
+    mock_client = _make_mock_client()
+    mock_client.get_doors = AsyncMock(side_effect=ApiAuthError("Invalid token"))
+    mock_client.get_emergency_status = AsyncMock(
+        side_effect=ApiError("Server error", status_code=500)
+    )
+
+    with patch(
+        "custom_components.unifi_access.UnifiAccessApiClient",
+        return_value=mock_client,
+    ):
+        await hass.config_entries.async_setup(mock_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_entry.state is ConfigEntryState.SETUP_ERROR
+    flows = hass.config_entries.flow.async_progress()
+    assert any(f["context"]["source"] == "reauth" for f in flows)
+
+
+async def test_polling_interval_adapts_to_activity(
+    hass: HomeAssistant,
+) -> None:
+    """Idle polls back off to the ceiling; changes and commands speed them up."""
+    mock_client = _make_mock_client()
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_CONFIG, "use_polling": True},
+        options={"max_poll_interval": 12},
+        unique_id="192.168.1.2",
+        title="Unifi Access Doors (Polling)",
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.unifi_access.UnifiAccessApiClient",
+        return_value=mock_client,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    # The first poll counts as a change.
+    assert coordinator.update_interval == timedelta(seconds=3)
+
+    # Nothing changes: step back towards the configured ceiling.
+    coordinator._active_until = 0
+    intervals = []
+    for _ in range(3):
+        await coordinator.async_refresh()
+        intervals.append(coordinator.update_interval.total_seconds())
+    assert intervals == [6, 12, 12]
+
+    # A detected change drops back to the fast interval.
+    mock_client.get_doors.return_value = [
+        SAMPLE_DOORS[0].model_copy(
+            update={"door_position_status": DoorPositionStatus.CLOSE}
+        ),
+        SAMPLE_DOORS[1],
+    ]
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=3)
+
+    # So does a command, without waiting for the next poll.
+    coordinator._active_until = 0
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=6)
+    await entry.runtime_data.hub.async_open_door("door-001")
+    assert coordinator.update_interval == timedelta(seconds=3)
+    assert coordinator.polling_stats["active"] is True
+
+
 async def test_unload_entry(hass: HomeAssistant, mock_entry: MockConfigEntry) -> None:
     """Test unloading a config entry."""
     mock_client = _make_mock_client()
@@ -119,19 +406,18 @@ async def test_unload_entry(hass: HomeAssistant, mock_entry: MockConfigEntry) ->
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
+        session = mock_entry.runtime_data.connection_pool.session
+        assert not session.closed
 
         result = await hass.config_entries.async_unload(mock_entry.entry_id)
         await hass.async_block_till_done()
 
     assert result is True
     mock_client.close.assert_called_once()
+    assert session.closed
 
 
 async def test_setup_entry_not_ready(
@@ -148,10 +434,6 @@ async def test_setup_entry_not_ready(
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
@@ -171,10 +453,6 @@ async def test_coordinator_auth_error(
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
@@ -198,10 +476,6 @@ async def test_coordinator_api_error(
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
@@ -5,9 +5,18 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ServiceValidationError
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
+from unifi_access_api import (
+    ApiError,
+    ApiNotFoundError,
+    Door,
+    DoorLockRelayStatus,
+    DoorPositionStatus,
+    User,
+)
 
 from custom_components.unifi_access import UnifiAccessData, async_setup
 from custom_components.unifi_access.const import DOMAIN
@@ -35,17 +44,38 @@ def _make_mock_client() -> AsyncMock:
     client.close = AsyncMock()
     client.update_user_status = AsyncMock()
     client.update_user_pin = AsyncMock()
+    client.unlock_door = AsyncMock()
+    client.set_door_lock_rule = AsyncMock()
+    return client
+
+
+SITE_B_DOORS = [
+    Door(
+        id="door-101",
+        name="Warehouse Door",
+        full_name="Site B / Warehouse Door",
+        door_position_status=DoorPositionStatus.CLOSE,
+        door_lock_relay_status=DoorLockRelayStatus.LOCK,
+    ),
+]
+
+
+def _make_site_b_client() -> AsyncMock:
+    client = _make_mock_client()
+    client.get_doors = AsyncMock(return_value=SITE_B_DOORS)
+    client.get_devices = AsyncMock(return_value=[])
+    client.resolve_door_id = MagicMock(return_value=None)
     return client
 
 
 async def _setup_integration(
-    hass: HomeAssistant, mock_client: AsyncMock
+    hass: HomeAssistant, mock_client: AsyncMock, host: str = "192.168.1.1"
 ) -> MockConfigEntry:
     """Set up the integration and return the config entry."""
     entry = MockConfigEntry(
         domain=DOMAIN,
-        data=MOCK_CONFIG,
-        unique_id="192.168.1.1",
+        data={**MOCK_CONFIG, "host": host},
+        unique_id=host,
         title="Unifi Access",
     )
     entry.add_to_hass(hass)
@@ -54,10 +84,6 @@ async def _setup_integration(
             "custom_components.unifi_access.UnifiAccessApiClient",
             return_value=mock_client,
         ),
-        patch(
-            "custom_components.unifi_access.async_get_clientsession",
-            return_value=AsyncMock(),
-        ),
     ):
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -71,6 +97,9 @@ async def test_async_setup_registers_services(hass: HomeAssistant) -> None:
     assert hass.services.has_service(DOMAIN, "enable_user")
     assert hass.services.has_service(DOMAIN, "disable_user")
     assert hass.services.has_service(DOMAIN, "update_user_pin")
+    assert hass.services.has_service(DOMAIN, "bulk_door_command")
+    assert hass.services.has_service(DOMAIN, "set_lock_rule")
+    assert hass.services.has_service(DOMAIN, "set_face_unlock")
 
 
 async def test_enable_user_service(hass: HomeAssistant) -> None:
@@ -144,3 +173,253 @@ async def test_service_no_loaded_entry(hass: HomeAssistant) -> None:
             {"user_id": "user-001"},
             blocking=True,
         )
+
+
+async def test_bulk_door_command_service(hass: HomeAssistant) -> None:
+    """bulk_door_command sends the command to every door and reports per-door results."""
+    mock_client = _make_mock_client()
+    await _setup_integration(hass, mock_client)
+
+    async def _unlock(door_id: str, *, control_cmd: str | None = None) -> None:
+        if door_id == "door-002":
+            raise ApiError("Server error", status_code=500)
+
+    mock_client.unlock_door.side_effect = _unlock
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_door_command",
+        {"door_ids": ["door-001", "door-002", "door-001"], "command": "open"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert mock_client.unlock_door.call_count == 2
+    mock_client.unlock_door.assert_any_call("door-001", control_cmd="open")
+    mock_client.unlock_door.assert_any_call("door-002", control_cmd="open")
+    assert response["succeeded"] == 1
+    assert response["failed"] == 1
+    results = {result["door_id"]: result for result in response["results"]}
+    assert results["door-001"]["success"] is True
+    assert results["door-001"]["latency_ms"] >= 0
+    assert results["door-002"]["success"] is False
+    assert "Server error" in results["door-002"]["error"]
+
+
+async def test_bulk_door_command_unknown_door(hass: HomeAssistant) -> None:
+    """bulk_door_command rejects door IDs the controller does not know."""
+    mock_client = _make_mock_client()
+    await _setup_integration(hass, mock_client)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "bulk_door_command",
+            {"door_ids": ["door-001", "door-missing"]},
+            blocking=True,
+        )
+
+    mock_client.unlock_door.assert_not_called()
+
+
+async def test_set_lock_rule_service(hass: HomeAssistant) -> None:
+    """set_lock_rule applies the rule to all requested doors."""
+    mock_client = _make_mock_client()
+    entry = await _setup_integration(hass, mock_client)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_lock_rule",
+        {"door_ids": ["door-001", "door-002"], "rule": "keep_unlock"},
+        blocking=True,
+    )
+
+    assert mock_client.set_door_lock_rule.call_count == 2
+    doors = entry.runtime_data.hub.doors
+    assert doors["door-001"].lock_rule == "keep_unlock"
+    assert doors["door-002"].lock_rule == "keep_unlock"
+
+
+async def test_set_lock_rule_service_failure_raises(hass: HomeAssistant) -> None:
+    """set_lock_rule raises after rolling back when a door fails."""
+    mock_client = _make_mock_client()
+    entry = await _setup_integration(hass, mock_client)
+    mock_client.set_door_lock_rule.side_effect = ApiError(
+        "Server error", status_code=500
+    )
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_lock_rule",
+            {"door_ids": ["door-001"], "rule": "keep_unlock"},
+            blocking=True,
+        )
+
+    assert entry.runtime_data.hub.doors["door-001"].lock_rule == "keep_lock"
+
+
+async def test_set_lock_rule_rolls_back_other_controllers(
+    hass: HomeAssistant,
+) -> None:
+    """A failure on one controller rolls back the doors changed on another."""
+    site_a = _make_mock_client()
+    site_b = _make_site_b_client()
+    entry_a = await _setup_integration(hass, site_a)
+    await _setup_integration(hass, site_b, host="192.168.2.1")
+    site_b.set_door_lock_rule.side_effect = ApiError("Server error", status_code=500)
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_lock_rule",
+            {"door_ids": ["door-001", "door-101"], "rule": "keep_unlock"},
+            blocking=True,
+        )
+
+    # Applied, then restored to the previous rule.
+    assert site_a.set_door_lock_rule.call_count == 2
+    assert entry_a.runtime_data.hub.doors["door-001"].lock_rule == "keep_lock"
+
+
+async def test_bulk_door_command_routes_doors_to_their_controller(
+    hass: HomeAssistant,
+) -> None:
+    """Doors on different controllers are commanded through their own hub."""
+    site_a = _make_mock_client()
+    site_b = _make_site_b_client()
+    await _setup_integration(hass, site_a)
+    await _setup_integration(hass, site_b, host="192.168.2.1")
+
+    await hass.services.async_call(
+        DOMAIN,
+        "bulk_door_command",
+        {"door_ids": ["door-001", "door-101"]},
+        blocking=True,
+    )
+
+    site_a.unlock_door.assert_called_once_with("door-001", control_cmd=None)
+    site_b.unlock_door.assert_called_once_with("door-101", control_cmd=None)
+
+
+async def test_bulk_door_command_device_target(hass: HomeAssistant) -> None:
+    """Door devices can be targeted instead of raw door IDs."""
+    site_a = _make_mock_client()
+    site_b = _make_site_b_client()
+    await _setup_integration(hass, site_a)
+    await _setup_integration(hass, site_b, host="192.168.2.1")
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "door-101")})
+    assert device is not None
+
+    await hass.services.async_call(
+        DOMAIN,
+        "bulk_door_command",
+        {"device_id": device.id},
+        blocking=True,
+    )
+
+    site_a.unlock_door.assert_not_called()
+    site_b.unlock_door.assert_called_once_with("door-101", control_cmd=None)
+
+
+async def test_bulk_door_command_without_targets(hass: HomeAssistant) -> None:
+    """A door action with no door IDs or targets is rejected."""
+    await _setup_integration(hass, _make_mock_client())
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "bulk_door_command", {}, blocking=True)
+
+
+async def test_user_service_routes_to_user_home_controller(
+    hass: HomeAssistant,
+) -> None:
+    """With several controllers, user actions go to the controller owning the user."""
+    site_a = _make_mock_client()
+    site_a.get_users = AsyncMock(return_value=[])
+    site_b = _make_site_b_client()
+    site_b.get_users = AsyncMock(return_value=[User(id="user-001")])
+    await _setup_integration(hass, site_a)
+    await _setup_integration(hass, site_b, host="192.168.2.1")
+
+    for _ in range(2):
+        await hass.services.async_call(
+            DOMAIN, "disable_user", {"user_id": "user-001"}, blocking=True
+        )
+
+    site_a.update_user_status.assert_not_called()
+    assert site_b.update_user_status.call_count == 2
+    # The user's home controller is remembered after the first lookup.
+    assert site_b.get_users.call_count == 1
+
+
+async def test_user_service_forgets_home_of_missing_user(
+    hass: HomeAssistant,
+) -> None:
+    """A user gone from its remembered controller is looked up again."""
+    site_a = _make_mock_client()
+    site_a.get_users = AsyncMock(return_value=[User(id="user-001")])
+    site_b = _make_site_b_client()
+    site_b.get_users = AsyncMock(return_value=[])
+    await _setup_integration(hass, site_a)
+    await _setup_integration(hass, site_b, host="192.168.2.1")
+
+    await hass.services.async_call(
+        DOMAIN, "enable_user", {"user_id": "user-001"}, blocking=True
+    )
+    site_a.update_user_status.side_effect = ApiNotFoundError()
+    with pytest.raises(ApiNotFoundError):
+        await hass.services.async_call(
+            DOMAIN, "enable_user", {"user_id": "user-001"}, blocking=True
+        )
+
+    # The user moved to the other controller.
+    site_a.get_users.return_value = []
+    site_b.get_users.return_value = [User(id="user-001")]
+    await hass.services.async_call(
+        DOMAIN, "enable_user", {"user_id": "user-001"}, blocking=True
+    )
+
+    site_b.update_user_status.assert_called_once_with("user-001", enabled=True)
+
+
+async def test_user_service_unknown_user(hass: HomeAssistant) -> None:
+    """A user missing on every controller is reported instead of guessed."""
+    site_a = _make_mock_client()
+    site_a.get_users = AsyncMock(return_value=[])
+    site_b = _make_site_b_client()
+    site_b.get_users = AsyncMock(return_value=[])
+    await _setup_integration(hass, site_a)
+    await _setup_integration(hass, site_b, host="192.168.2.1")
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "enable_user", {"user_id": "user-404"}, blocking=True
+        )
+
+
+async def test_user_service_config_entry_and_all_controllers(
+    hass: HomeAssistant,
+) -> None:
+    """Explicit routing targets one controller or fans out to all of them."""
+    site_a = _make_mock_client()
+    site_b = _make_site_b_client()
+    await _setup_integration(hass, site_a)
+    entry_b = await _setup_integration(hass, site_b, host="192.168.2.1")
+
+    await hass.services.async_call(
+        DOMAIN,
+        "update_user_pin",
+        {"user_id": "user-001", "pin": "1234", "config_entry_id": entry_b.entry_id},
+        blocking=True,
+    )
+    site_a.update_user_pin.assert_not_called()
+    site_b.update_user_pin.assert_called_once_with("user-001", "1234")
+
+    await hass.services.async_call(
+        DOMAIN,
+        "enable_user",
+        {"user_id": "user-001", "all_controllers": True},
+        blocking=True,
+    )
+    site_a.update_user_status.assert_called_once_with("user-001", enabled=True)
+    site_b.update_user_status.assert_called_once_with("user-001", enabled=True)